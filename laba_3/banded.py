@@ -0,0 +1,339 @@
+from array import array
+from itertools import repeat
+from operator import mul, sub
+from typing import Union
+from matrix import Matrix
+from vector import Vector
+
+
+def bandwidth(matrix: Matrix) -> tuple[int, int]:
+    """Определяет нижнюю и верхнюю ширину ленты матрицы.
+
+    Каждая строка просматривается с краев до первого ненулевого элемента, поэтому
+    для плотной матрицы проверка стоит O(n), а для ленточной - O(n) на строку.
+
+    Args:
+        matrix (Matrix): Исследуемая матрица.
+
+    Returns:
+        tuple[int, int]: Количество ненулевых поддиагоналей и наддиагоналей.
+    """
+    rows, cols = matrix.__len__()
+    lower = upper = 0
+    for i in range(rows):
+        row = matrix.row_buffer(i)
+        # Левая граница: ищем первый ненулевой элемент среди столбцов, расширяющих ленту
+        for j in range(0, min(i - lower, cols)):
+            if row[j] != 0:
+                lower = i - j
+                break
+        # Правая граница аналогично, начиная с последнего столбца
+        for j in range(cols - 1, i + upper, -1):
+            if row[j] != 0:
+                upper = j - i
+                break
+    return lower, upper
+
+
+def is_narrow_band(size: int, lower: int, upper: int) -> bool:
+    """Проверяет, выгодно ли решать систему с такой лентой ленточным методом.
+
+    Рабочая строка ленточного LU занимает 2 * lower + upper + 1 ячеек (с учетом
+    перестановок строк); метод выгоден, пока она уже самой матрицы.
+    """
+    return 2 * lower + upper + 1 < size
+
+
+def thomas(sub_diagonal, diagonal, super_diagonal, free_terms) -> array:
+    """Решает трехдиагональную систему методом прогонки за O(n).
+
+    Метод не выбирает ведущий элемент и устойчив для матриц с диагональным
+    преобладанием и симметричных положительно определенных матриц.
+
+    Args:
+        sub_diagonal: Поддиагональ длины n - 1.
+        diagonal: Главная диагональ длины n.
+        super_diagonal: Наддиагональ длины n - 1.
+        free_terms: Свободные члены длины n.
+
+    Returns:
+        array: Решение системы.
+
+    Raises:
+        ValueError: Если длины диагоналей не согласованы.
+        ZeroDivisionError: Если в ходе прогонки получен нулевой ведущий элемент.
+    """
+    size = len(diagonal)
+    if len(sub_diagonal) != size - 1 or len(super_diagonal) != size - 1 or len(free_terms) != size:
+        raise ValueError('Diagonals must have lengths n - 1, n, n - 1 and free terms length n.')
+    coefficients = array('d', bytes(8 * size))
+    solution = array('d', free_terms)
+
+    # Прямой ход прогонки
+    for i in range(size):
+        pivot = diagonal[i] - (sub_diagonal[i - 1] * coefficients[i - 1] if i > 0 else 0.0)
+        if abs(pivot) < 1e-12:
+            raise ZeroDivisionError(
+                f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
+        if i < size - 1:
+            coefficients[i] = super_diagonal[i] / pivot
+        if i > 0:
+            solution[i] -= sub_diagonal[i - 1] * solution[i - 1]
+        solution[i] /= pivot
+
+    # Обратный ход
+    for i in range(size - 2, -1, -1):
+        solution[i] -= coefficients[i] * solution[i + 1]
+    return solution
+
+
+class BandMatrix:
+    """Класс, представляющий квадратную ленточную матрицу.
+
+    Хранятся только lower поддиагоналей, главная диагональ и upper наддиагоналей:
+    строка i занимает lower + upper + 1 ячеек плоского буфера, элемент (i, j)
+    лежит по смещению i * (lower + upper + 1) + j - i + lower.
+    """
+
+    def __init__(self, size: int, lower: int, upper: int) -> None:
+        """Создает нулевую ленточную матрицу.
+
+        Args:
+            size (int): Порядок матрицы.
+            lower (int): Количество поддиагоналей.
+            upper (int): Количество наддиагоналей.
+
+        Raises:
+            TypeError: Если порядок не является положительным целым числом.
+            ValueError: Если ширина ленты отрицательна.
+        """
+        Matrix.validated_rows(size)
+        if not isinstance(lower, int) or not isinstance(upper, int) or lower < 0 or upper < 0:
+            raise ValueError('Band widths must be non-negative integers.')
+        self.__size: int = size
+        self.__lower: int = min(lower, size - 1)
+        self.__upper: int = min(upper, size - 1)
+        self.__width: int = self.__lower + self.__upper + 1
+        self.__data: array = array('d', bytes(8 * size * self.__width))
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, lower: int | None = None, upper: int | None = None) -> 'BandMatrix':
+        """Создает ленточную матрицу из плотной.
+
+        Args:
+            matrix (Matrix): Квадратная матрица.
+            lower (int | None): Количество поддиагоналей; по умолчанию определяется автоматически.
+            upper (int | None): Количество наддиагоналей; по умолчанию определяется автоматически.
+
+        Raises:
+            ValueError: Если матрица не квадратная или имеет ненулевые элементы вне заданной ленты.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError("'matrix' can be only Matrix")
+        size, cols = matrix.__len__()
+        if size != cols:
+            raise ValueError('The matrix must be square (n x n) for the band storage.')
+        detected_lower, detected_upper = bandwidth(matrix)
+        lower = detected_lower if lower is None else lower
+        upper = detected_upper if upper is None else upper
+        if detected_lower > lower or detected_upper > upper:
+            raise ValueError('The matrix has non-zero elements outside of the band.')
+        band = cls(size, lower, upper)
+        for i in range(size):
+            start = max(0, i - band.__lower)
+            stop = min(size, i + band.__upper + 1)
+            offset = i * band.__width - i + band.__lower
+            band.__data[offset + start:offset + stop] = array('d', matrix.row_buffer(i)[start:stop])
+        return band
+
+    @classmethod
+    def from_diagonals(cls, sub_diagonal, diagonal, super_diagonal) -> 'BandMatrix':
+        """Создает трехдиагональную матрицу по трем диагоналям."""
+        size = len(diagonal)
+        if len(sub_diagonal) != size - 1 or len(super_diagonal) != size - 1:
+            raise ValueError('Diagonals must have lengths n - 1, n and n - 1.')
+        band = cls(size, 1, 1)
+        for i in range(size):
+            band[i, i] = diagonal[i]
+            if i > 0:
+                band[i, i - 1] = sub_diagonal[i - 1]
+            if i < size - 1:
+                band[i, i + 1] = super_diagonal[i]
+        return band
+
+    @property
+    def bandwidth(self) -> tuple[int, int]:
+        """Возвращает количество поддиагоналей и наддиагоналей."""
+        return self.__lower, self.__upper
+
+    def diagonal(self, offset: int = 0) -> array:
+        """Возвращает диагональ с заданным смещением (положительное - выше главной)."""
+        if not -self.__lower <= offset <= self.__upper:
+            raise IndexError('The diagonal is outside of the band.')
+        start = max(0, -offset)
+        stop = min(self.__size, self.__size - offset)
+        return array('d', (self.__data[i * self.__width + offset + self.__lower] for i in range(start, stop)))
+
+    def validated_index(self, index: tuple[int, int] | list[int]) -> None:
+        """Проверяет валидность пары индексов (строка, столбец)."""
+        if not isinstance(index, (tuple, list)) or len(index) != 2 or not all(isinstance(i, int) for i in index):
+            raise TypeError('Index must be a tuple or list of two integers.')
+        if not all(0 <= i < self.__size for i in index):
+            raise IndexError('Indexes must be non-negative and less than the size of the matrix.')
+
+    def __in_band(self, row: int, col: int) -> bool:
+        """Проверяет, попадает ли элемент в ленту."""
+        return -self.__lower <= col - row <= self.__upper
+
+    def __getitem__(self, index: tuple[int, int] | list[int]) -> float:
+        """Получает элемент матрицы; элементы вне ленты равны нулю."""
+        self.validated_index(index)
+        row, col = index
+        if not self.__in_band(row, col):
+            return 0.0
+        return self.__data[row * self.__width + col - row + self.__lower]
+
+    def __setitem__(self, index: tuple[int, int] | list[int], value: int | float) -> None:
+        """Устанавливает элемент матрицы внутри ленты."""
+        self.validated_index(index)
+        Vector.validated_value(value)
+        row, col = index
+        if not self.__in_band(row, col):
+            if value != 0:
+                raise ValueError('Only zero can be stored outside of the band.')
+            return
+        self.__data[row * self.__width + col - row + self.__lower] = value
+
+    def __len__(self) -> tuple[int, int]:
+        """Возвращает размеры матрицы."""
+        return self.__size, self.__size
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление матрицы."""
+        return f'{type(self).__name__}(size={self.__size}, lower={self.__lower}, upper={self.__upper})'
+
+    def to_matrix(self) -> Matrix:
+        """Преобразует ленточную матрицу в плотную."""
+        dense = Matrix(self.__size, self.__size)
+        for i in range(self.__size):
+            start = max(0, i - self.__lower)
+            stop = min(self.__size, i + self.__upper + 1)
+            offset = i * self.__width - i + self.__lower
+            dense.row_buffer(i, writable=True)[start:stop] = self.__data[offset + start:offset + stop]
+        return dense
+
+    def __mul__(self, other: Vector) -> Vector:
+        """Умножение ленточной матрицы на вектор за O(n * (lower + upper))."""
+        if not isinstance(other, Vector):
+            raise TypeError('Unsupported type for multiplication.')
+        if len(other) != self.__size:
+            raise ValueError('Number of columns in the matrix must equal the size of the vector.')
+        vector = other.buffer
+        result = array('d', bytes(8 * self.__size))
+        for i in range(self.__size):
+            start = max(0, i - self.__lower)
+            stop = min(self.__size, i + self.__upper + 1)
+            offset = i * self.__width - i + self.__lower
+            result[i] = sum(map(mul, self.__data[offset + start:offset + stop], vector[start:stop]))
+        return Vector.from_buffer(result, copy=False)
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему ленточным LU-разложением с выбором ведущего элемента за O(n * lower * (lower + upper)).
+
+        Для трехдиагональной матрицы с диагональным преобладанием используется прогонка за O(n).
+
+        Args:
+            col_of_free_mem (Vector): Вектор свободных членов.
+
+        Returns:
+            Vector: Вектор решений системы.
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы.
+            ZeroDivisionError: Если обнаружена вырожденная матрица.
+        """
+        if len(col_of_free_mem) != self.__size:
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+        if self.__lower == 1 and self.__upper == 1 and self.is_diagonally_dominant():
+            return Vector.from_buffer(
+                thomas(self.diagonal(-1), self.diagonal(), self.diagonal(1), col_of_free_mem), copy=False)
+
+        size, lower, upper = self.__size, self.__lower, self.__upper
+        # Рабочая строка на позиции i хранит столбцы i - lower .. i + lower + upper:
+        # перестановки строк расширяют верхнюю ленту U до lower + upper
+        work_width = 2 * lower + upper + 1
+        rows = []
+        for i in range(size):
+            row = array('d', bytes(8 * work_width))
+            row[:self.__width] = self.__data[i * self.__width:(i + 1) * self.__width]
+            rows.append(row)
+        free_terms = array('d', col_of_free_mem)
+
+        def position(row_index: int, col: int) -> int:
+            """Возвращает позицию столбца col в рабочей строке row_index."""
+            return col - row_index + lower
+
+        # Прямой ход с выбором ведущего элемента внутри ленты
+        for k in range(size):
+            last_row = min(size - 1, k + lower)
+            max_row = k + max(range(last_row - k + 1), key=lambda r: abs(rows[k + r][position(k + r, k)]))
+            stop_col = min(size, k + lower + upper + 1)
+            if max_row != k:
+                pivot_slice = slice(position(k, k), position(k, stop_col))
+                other_slice = slice(position(max_row, k), position(max_row, stop_col))
+                saved = rows[k][pivot_slice]
+                rows[k][pivot_slice] = rows[max_row][other_slice]
+                rows[max_row][other_slice] = saved
+                free_terms[k], free_terms[max_row] = free_terms[max_row], free_terms[k]
+
+            pivot_row = rows[k]
+            pivot = pivot_row[position(k, k)]
+            if abs(pivot) < 1e-12:
+                raise ZeroDivisionError(
+                    f"System of equations is inconsistent or underdetermined (leading element = 0) in row {k + 1}.")
+
+            tail = pivot_row[position(k, k + 1):position(k, stop_col)]
+            for j in range(k + 1, last_row + 1):
+                row = rows[j]
+                factor = row[position(j, k)] / pivot
+                if factor == 0:
+                    continue
+                row[position(j, k)] = 0.0
+                start, stop = position(j, k + 1), position(j, stop_col)
+                row[start:stop] = array('d', map(sub, row[start:stop], map(mul, tail, repeat(factor))))
+                free_terms[j] -= factor * free_terms[k]
+
+        # Обратный ход
+        solution = array('d', bytes(8 * size))
+        for i in range(size - 1, -1, -1):
+            row = rows[i]
+            stop_col = min(size, i + lower + upper + 1)
+            sum_ax = sum(map(mul, row[position(i, i + 1):position(i, stop_col)], solution[i + 1:stop_col]))
+            solution[i] = (free_terms[i] - sum_ax) / row[position(i, i)]
+        return Vector.from_buffer(solution, copy=False)
+
+    def is_diagonally_dominant(self) -> bool:
+        """Проверяет строгое диагональное преобладание по строкам."""
+        for i in range(self.__size):
+            row = self.__data[i * self.__width:(i + 1) * self.__width]
+            diagonal = abs(row[self.__lower])
+            if diagonal <= sum(map(abs, row)) - diagonal:
+                return False
+        return True
+
+
+def solve(matrix: Union[Matrix, BandMatrix], col_of_free_mem: Vector) -> Vector:
+    """Решает систему, выбирая метод по структуре матрицы.
+
+    Ленточная матрица решается своим методом solve(), плотная - методом Matrix.solve(),
+    который и выбирает способ решения (ленточное LU-разложение, Холецкий или Гаусс).
+
+    Args:
+        matrix (Matrix | BandMatrix): Квадратная матрица системы.
+        col_of_free_mem (Vector): Вектор свободных членов.
+
+    Returns:
+        Vector: Вектор решений системы.
+    """
+    return matrix.solve(col_of_free_mem)
@@ -0,0 +1,74 @@
+import unittest
+from matrix import Matrix
+from vector import Vector
+import banded
+from banded import BandMatrix
+
+
+class TestBanded(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем пятидиагональную матрицу без диагонального преобладания."""
+        self.size = 7
+        self.matrix = Matrix(self.size, self.size)
+        for i in range(self.size):
+            for j in range(max(0, i - 2), min(self.size, i + 2)):
+                self.matrix[i, j] = (i + 2 * j) % 5 + (1 if i == j else 0) - 1.5
+        self.solution = Vector.from_iterable(range(1, self.size + 1))
+        self.free_terms = self.matrix * self.solution
+
+    def assertVectorAlmostEqual(self, first, second, places: int = 9):
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_bandwidth(self):
+        """Тестируем определение ширины ленты."""
+        self.assertEqual(banded.bandwidth(self.matrix), (2, 1))
+        self.assertEqual(banded.bandwidth(Matrix.identity(4)), (0, 0))
+        self.assertEqual(banded.bandwidth(Matrix.from_buffer(2, 2, [1, 2, 3, 4])), (1, 1))
+
+    def test_band_storage(self):
+        """Тестируем хранение ленточной матрицы и преобразования."""
+        band = BandMatrix.from_matrix(self.matrix)
+        self.assertEqual(band.bandwidth, (2, 1))
+        self.assertTrue(band.to_matrix() == self.matrix)
+        self.assertEqual(band[0, 5], 0)
+        self.assertEqual(band * self.solution, self.free_terms)
+        with self.assertRaises(ValueError):
+            band[0, 5] = 1
+        with self.assertRaises(ValueError):
+            BandMatrix.from_matrix(self.matrix, 1, 1)
+
+    def test_banded_solve_with_pivoting(self):
+        """Тестируем ленточное LU-разложение с перестановками строк."""
+        band = BandMatrix.from_matrix(self.matrix)
+        self.assertVectorAlmostEqual(band.solve(self.free_terms), self.solution)
+        self.assertVectorAlmostEqual(band.solve(self.free_terms), self.matrix.gauss(self.free_terms))
+
+    def test_thomas(self):
+        """Тестируем метод прогонки."""
+        result = banded.thomas([-1, -1], [4, 4, 4], [-1, -1], [2, 4, 10])
+        self.assertVectorAlmostEqual(result, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            banded.thomas([1], [1, 1, 1], [1, 1], [1, 1, 1])
+        band = BandMatrix.from_diagonals([-1, -1], [4, 4, 4], [-1, -1])
+        self.assertTrue(band.is_diagonally_dominant())
+        self.assertVectorAlmostEqual(band.solve(Vector(3, [2, 4, 10])), [1, 2, 3])
+
+    def test_dispatcher(self):
+        """Тестируем автоматический выбор метода решения."""
+        self.assertVectorAlmostEqual(self.matrix.solve(self.free_terms), self.solution)
+        dense = Matrix.from_buffer(2, 2, [2, 1, 1, 3])
+        self.assertVectorAlmostEqual(banded.solve(dense, Vector(2, [3, 4])), [1, 1])
+        # Оба диспетчера выбирают один и тот же метод
+        spd = Matrix.from_buffer(3, 3, [4, 1, 2, 1, 5, 1, 2, 1, 6])
+        free_terms = Vector(3, [7, 7, 9])
+        self.assertEqual(banded.solve(spd, free_terms), spd.solve(free_terms))
+        self.assertEqual(banded.solve(spd, free_terms), spd.cholesky().solve(free_terms))
+        singular = BandMatrix.from_diagonals([1], [1, 1], [1])
+        with self.assertRaises(ZeroDivisionError):
+            singular.solve(Vector(2, [1, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
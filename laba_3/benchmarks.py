@@ -0,0 +1,264 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+from typing import Callable
+import generators
+from decompositions import LUDecomposition
+from matrix import Matrix
+from vector import Vector
+
+# Размеры по умолчанию: векторы длиннее матриц, чтобы время операций было сопоставимым
+VECTOR_SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+MATRIX_SIZES: tuple[int, ...] = (16, 64, 128)
+# Допустимое относительное замедление по сравнению с эталоном
+DEFAULT_THRESHOLD: float = 0.25
+DEFAULT_BASELINE: str = 'benchmark_baseline.json'
+# Минимальная длительность одного замера: короткие операции повторяются, пока не наберут это время
+MIN_DURATION: float = 0.05
+
+
+def _vector_pair(size: int) -> tuple[Vector, Vector]:
+    return Vector.random_vector(size, -10, 10), Vector.random_vector(size, -10, 10)
+
+
+def _matrix(size: int) -> Matrix:
+    # Диагональное преобладание гарантирует, что метод Гаусса не встретит нулевой ведущий элемент
+    return generators.diagonally_dominant(size)
+
+
+def _vector_add(size: int) -> Callable[[], object]:
+    a, b = _vector_pair(size)
+    return lambda: a + b
+
+
+def _vector_sub(size: int) -> Callable[[], object]:
+    a, b = _vector_pair(size)
+    return lambda: a - b
+
+
+def _vector_scale(size: int) -> Callable[[], object]:
+    a, _ = _vector_pair(size)
+    return lambda: a * 2.5
+
+
+def _vector_norma(size: int) -> Callable[[], object]:
+    a, _ = _vector_pair(size)
+    return a.norma
+
+
+def _matrix_matrix(size: int) -> Callable[[], object]:
+    a, b = _matrix(size), _matrix(size)
+    return lambda: a * b
+
+
+def _matrix_vector(size: int) -> Callable[[], object]:
+    a, b = _matrix(size), Vector.random_vector(size, -10, 10)
+    return lambda: a * b
+
+
+def _matrix_scalar(size: int) -> Callable[[], object]:
+    a = _matrix(size)
+    return lambda: a * 2.5
+
+
+def _gauss(size: int) -> Callable[[], object]:
+    # Кэш разложения сбрасывается перед каждым вызовом, поэтому замер включает исключение;
+    # повторное решение по готовому разложению измеряет lu_solve
+    a, b = _matrix(size), Vector.random_vector(size, -10, 10)
+
+    def solve() -> Vector:
+        a.mark_modified()
+        return a.gauss(b)
+    return solve
+
+
+def _lu_factor(size: int) -> Callable[[], object]:
+    # Разложение строится напрямую, минуя кэш Matrix.lu()
+    a = _matrix(size)
+    return lambda: LUDecomposition(a)
+
+
+def _lu_solve(size: int) -> Callable[[], object]:
+    lu, b = _matrix(size).lu(), Vector.random_vector(size, -10, 10)
+    return lambda: lu.solve(b)
+
+
+def _random_matrix(size: int) -> Callable[[], object]:
+    return lambda: Matrix.random_matrix(size, size, -10, 10)
+
+
+def _diagonally_dominant(size: int) -> Callable[[], object]:
+    return lambda: generators.diagonally_dominant(size)
+
+
+def _condition_number(size: int) -> Callable[[], object]:
+    return lambda: generators.with_condition_number(size, 1e6)
+
+
+def _text_io(size: int) -> Callable[[], object]:
+    a = _matrix(size)
+    filename = os.path.join(tempfile.gettempdir(), f'benchmark_{os.getpid()}.txt')
+
+    def run():
+        try:
+            a.write_to_file(filename)
+            return Matrix.from_file(filename)
+        finally:
+            os.remove(filename)
+    return run
+
+
+def _binary_io(size: int) -> Callable[[], object]:
+    a = _matrix(size)
+    filename = os.path.join(tempfile.gettempdir(), f'benchmark_{os.getpid()}.bin')
+
+    def run():
+        try:
+            a.write_binary(filename)
+            return Matrix.from_binary(filename, None)
+        finally:
+            os.remove(filename)
+    return run
+
+
+# Название -> (функция подготовки замера по размеру, размеры по умолчанию)
+BENCHMARKS: dict[str, tuple[Callable[[int], Callable[[], object]], tuple[int, ...]]] = {
+    'vector_add': (_vector_add, VECTOR_SIZES),
+    'vector_sub': (_vector_sub, VECTOR_SIZES),
+    'vector_scale': (_vector_scale, VECTOR_SIZES),
+    'vector_norma': (_vector_norma, VECTOR_SIZES),
+    'matrix_matrix_mul': (_matrix_matrix, MATRIX_SIZES),
+    'matrix_vector_mul': (_matrix_vector, MATRIX_SIZES),
+    'matrix_scalar_mul': (_matrix_scalar, MATRIX_SIZES),
+    'gauss': (_gauss, MATRIX_SIZES),
+    'lu_factor': (_lu_factor, MATRIX_SIZES),
+    'lu_solve': (_lu_solve, MATRIX_SIZES),
+    'random_matrix': (_random_matrix, MATRIX_SIZES),
+    'diagonally_dominant': (_diagonally_dominant, MATRIX_SIZES),
+    'condition_number': (_condition_number, MATRIX_SIZES),
+    'text_io': (_text_io, MATRIX_SIZES),
+    'binary_io': (_binary_io, MATRIX_SIZES),
+}
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Измеряет время одного вызова функции.
+
+    Количество вызовов в замере подбирается так, чтобы замер длился не меньше
+    MIN_DURATION; из repeat замеров берется минимальный как наименее искаженный
+    посторонней нагрузкой.
+
+    Returns:
+        float: Время одного вызова в секундах.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < MIN_DURATION and number < 1 << 20:
+        number *= 2 if elapsed == 0 else max(2, min(10, int(MIN_DURATION / elapsed) + 1))
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number))
+    return best / number
+
+
+def run_benchmarks(names: list[str] | None = None, sizes: list[int] | None = None,
+                   repeat: int = 5, seed: int = 0) -> dict[str, float]:
+    """Выполняет замеры.
+
+    Args:
+        names (list[str] | None): Названия замеров из BENCHMARKS; по умолчанию все.
+        sizes (list[int] | None): Размеры данных; по умолчанию размеры, заданные для каждого замера.
+        repeat (int): Количество повторений замера.
+        seed (int): Зерно генератора случайных данных.
+
+    Returns:
+        dict[str, float]: Время одного вызова в секундах по ключам вида 'название[размер]'.
+
+    Raises:
+        ValueError: Если указан неизвестный замер.
+    """
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f'Unknown benchmarks: {", ".join(unknown)}.')
+    results = {}
+    for name in names:
+        setup, default_sizes = BENCHMARKS[name]
+        for size in sizes or default_sizes:
+            random.seed(seed)
+            results[f'{name}[{size}]'] = measure(setup(size), repeat)
+    return results
+
+
+def save_baseline(results: dict[str, float], filename: str) -> None:
+    """Записывает результаты замеров в JSON-файл эталона."""
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_baseline(filename: str) -> dict[str, float]:
+    """Читает результаты замеров из JSON-файла эталона."""
+    with open(filename) as f:
+        return json.load(f)
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, float, float, float]]:
+    """Сравнивает результаты с эталоном.
+
+    Замеры, отсутствующие в эталоне, не сравниваются.
+
+    Args:
+        results (dict[str, float]): Текущие результаты.
+        baseline (dict[str, float]): Эталонные результаты.
+        threshold (float): Допустимое относительное замедление (0.25 - на 25%).
+
+    Returns:
+        list[tuple[str, float, float, float]]: Регрессии: название, эталонное и текущее время,
+            отношение текущего времени к эталонному.
+    """
+    if threshold < 0:
+        raise ValueError('The threshold must be non-negative.')
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference and current > reference * (1 + threshold):
+            regressions.append((key, reference, current, current / reference))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Замеры производительности классов Vector и Matrix.')
+    parser.add_argument('names', nargs='*', help='названия замеров (по умолчанию все)')
+    parser.add_argument('--sizes', type=int, nargs='+', help='размеры данных')
+    parser.add_argument('--repeat', type=int, default=5, help='количество повторений замера')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='файл эталона')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='допустимое относительное замедление')
+    parser.add_argument('--update', action='store_true', help='записать результаты как новый эталон')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.names or None, args.sizes, args.repeat)
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+    for key, seconds in results.items():
+        reference = baseline.get(key)
+        change = f'{seconds / reference - 1:+.1%}' if reference else 'нет эталона'
+        print(f'{key:<28} {seconds * 1e3:12.4f} мс  {change}')
+
+    if args.update or not baseline:
+        save_baseline({**baseline, **results}, args.baseline)
+        print(f'Эталон записан в {args.baseline}')
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, reference, current, ratio in regressions:
+        print(f'Регрессия {key}: {reference * 1e3:.4f} мс -> {current * 1e3:.4f} мс (x{ratio:.2f})')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+import benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run_benchmarks(self):
+        """Тестируем выполнение всех замеров на малых размерах."""
+        results = benchmarks.run_benchmarks(sizes=[4], repeat=1)
+        self.assertEqual(set(results), {f'{name}[4]' for name in benchmarks.BENCHMARKS})
+        self.assertTrue(all(seconds > 0 for seconds in results.values()))
+        with self.assertRaises(ValueError):
+            benchmarks.run_benchmarks(['unknown'])
+
+    def test_compare(self):
+        """Тестируем обнаружение регрессий относительно эталона."""
+        baseline = {'a[1]': 1.0, 'b[1]': 1.0}
+        results = {'a[1]': 1.2, 'b[1]': 1.5, 'c[1]': 10.0}
+        self.assertEqual(benchmarks.compare(results, baseline, 0.25), [('b[1]', 1.0, 1.5, 1.5)])
+        self.assertEqual(benchmarks.compare(results, baseline, 0.6), [])
+        with self.assertRaises(ValueError):
+            benchmarks.compare(results, baseline, -1)
+
+    def test_main(self):
+        """Тестируем запись эталона и код возврата при регрессии."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'baseline.json')
+            arguments = ['vector_norma', '--sizes', '8', '--repeat', '1', '--baseline', filename]
+            self.assertEqual(benchmarks.main(arguments), 0)
+            self.assertIn('vector_norma[8]', benchmarks.load_baseline(filename))
+
+            benchmarks.save_baseline({'vector_norma[8]': 1e-12}, filename)
+            self.assertEqual(benchmarks.main(arguments), 1)
+            self.assertEqual(benchmarks.main(arguments + ['--update']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
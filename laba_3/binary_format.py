@@ -0,0 +1,110 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+# Заголовок: сигнатура, версия, тип элементов, порядок хранения, строки, столбцы.
+# Размер заголовка кратен 8, чтобы данные были выровнены под числа двойной точности.
+MAGIC: bytes = b'MTRX'
+VERSION: int = 1
+HEADER = struct.Struct('<4sBcc9xQQ')
+DTYPE: bytes = b'd'
+ROW_MAJOR: bytes = b'C'
+# Режимы отображения файла в память: только чтение, запись в файл, копирование при записи
+ACCESS_MODES: dict[str, int] = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+def _little_endian(values) -> array | memoryview:
+    """Возвращает буфер чисел в порядке байтов little-endian."""
+    if sys.byteorder == 'little':
+        return values
+    swapped = array('d', values)
+    swapped.byteswap()
+    return swapped
+
+
+def write(filename: str, rows: int, cols: int, chunks: Iterable) -> None:
+    """Записывает матрицу в двоичный файл.
+
+    Args:
+        filename (str): Имя файла.
+        rows (int): Количество строк.
+        cols (int): Количество столбцов.
+        chunks (Iterable): Последовательные фрагменты данных по строкам (буферы чисел 'd').
+
+    Raises:
+        ValueError: Если количество записанных чисел не равно rows * cols.
+    """
+    written = 0
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, DTYPE, ROW_MAJOR, rows, cols))
+        for chunk in chunks:
+            if not isinstance(chunk, array) and not (isinstance(chunk, memoryview) and chunk.c_contiguous):
+                chunk = array('d', chunk)
+            f.write(_little_endian(chunk))
+            written += len(chunk)
+    if written != rows * cols:
+        raise ValueError(f'Expected {rows * cols} values, {written} were written.')
+
+
+def create(filename: str, rows: int, cols: int) -> None:
+    """Создает двоичный файл с нулевой матрицей заданного размера, не записывая сами данные."""
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, DTYPE, ROW_MAJOR, rows, cols))
+        f.truncate(HEADER.size + 8 * rows * cols)
+
+
+def read_header(f) -> tuple[int, int]:
+    """Читает и проверяет заголовок двоичного файла.
+
+    Returns:
+        tuple[int, int]: Количество строк и столбцов.
+
+    Raises:
+        ValueError: Если файл не является двоичным файлом матрицы поддерживаемой версии.
+    """
+    header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError('The file is too short to contain a matrix header.')
+    magic, version, dtype, layout, rows, cols = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('The file is not a binary matrix file.')
+    if version != VERSION or dtype != DTYPE or layout != ROW_MAJOR:
+        raise ValueError(f'Unsupported binary format (version {version}, dtype {dtype!r}, layout {layout!r}).')
+    return rows, cols
+
+
+def load(filename: str, mode: str | None = 'r') -> tuple[int, int, memoryview]:
+    """Открывает двоичный файл матрицы.
+
+    Args:
+        filename (str): Имя файла.
+        mode (str | None): Режим отображения в память: 'r' - только чтение, 'r+' - изменения
+            записываются в файл, 'c' - копирование при записи; None - чтение файла целиком в память.
+
+    Returns:
+        tuple[int, int, memoryview]: Количество строк, столбцов и буфер чисел формата 'd'.
+            При отображении в память данные подгружаются с диска по мере обращения.
+
+    Raises:
+        ValueError: Если файл поврежден или указан неизвестный режим.
+    """
+    if mode is not None and mode not in ACCESS_MODES:
+        raise ValueError(f'Unknown mode {mode!r}; expected one of {sorted(ACCESS_MODES)} or None.')
+    with open(filename, 'r+b' if mode == 'r+' else 'rb') as f:
+        rows, cols = read_header(f)
+        size = 8 * rows * cols
+        if mode is None or sys.byteorder != 'little':
+            data = array('d')
+            data.frombytes(f.read(size))
+            if len(data) != rows * cols:
+                raise ValueError('The file is truncated.')
+            if sys.byteorder != 'little':
+                data.byteswap()
+            return rows, cols, memoryview(data)
+        mapped = mmap.mmap(f.fileno(), 0, access=ACCESS_MODES[mode])
+    if len(mapped) < HEADER.size + size:
+        mapped.close()
+        raise ValueError('The file is truncated.')
+    return rows, cols, memoryview(mapped)[HEADER.size:HEADER.size + size].cast('d')
@@ -0,0 +1,541 @@
+import sys
+from array import array
+from itertools import repeat
+from math import fsum, sqrt
+from operator import add, mul, sub, truediv
+from typing import Iterable, Iterator, Union
+from iterative import SolverResult, norm2
+from matrix import Matrix
+from vector import Vector
+
+# Пороговое значение для определения нулевого ведущего элемента
+PIVOT_TOLERANCE: float = 1e-12
+# Относительная точность чисел двойной точности (граница уточнения MixedPrecisionLU)
+DOUBLE_EPSILON: float = sys.float_info.epsilon
+
+
+def eliminate(rows: list, typecode: str = 'd') -> tuple[list[int], int]:
+    """Прямой ход метода Гаусса с выбором ведущего элемента по столбцу, общий для всех LU-разложений.
+
+    Строки переставляются только в списке rows (данные не копируются), множители L
+    записываются под диагональю на место исключенных элементов, U - на диагональ и выше.
+    Множитель используется после записи в строку, поэтому при typecode='f' все хранимые
+    величины округляются до одинарной точности.
+
+    Args:
+        rows (list): Изменяемые строки матрицы (array или memoryview), изменяются на месте.
+        typecode (str): Тип элементов строк для записи результатов.
+
+    Returns:
+        tuple[list[int], int]: Перестановка (исходный номер строки на каждом месте) и ее знак.
+
+    Raises:
+        ZeroDivisionError: Если матрица вырождена.
+    """
+    size = len(rows)
+    permutation = list(range(size))
+    sign = 1
+    for i in range(size):
+        # Поиск строки с максимальным по модулю элементом в текущем столбце
+        max_row = i + max(range(size - i), key=lambda r: abs(rows[i + r][i]))
+        if max_row != i:
+            rows[i], rows[max_row] = rows[max_row], rows[i]
+            permutation[i], permutation[max_row] = permutation[max_row], permutation[i]
+            sign = -sign
+
+        pivot_row = rows[i]
+        pivot = pivot_row[i]
+        if abs(pivot) < PIVOT_TOLERANCE:
+            raise ZeroDivisionError(
+                f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
+
+        tail = pivot_row[i + 1:]
+        for j in range(i + 1, size):
+            row = rows[j]
+            row[i] = row[i] / pivot
+            factor = row[i]
+            if factor != 0:
+                row[i + 1:] = array(typecode, map(sub, row[i + 1:], map(mul, tail, repeat(factor))))
+    return permutation, sign
+
+
+def multiplier_columns(rows: list, typecode: str = 'd') -> Iterator[array]:
+    """Выдает столбцы множителей L под диагональю (в порядке строк после перестановки)."""
+    for i in range(len(rows) - 1):
+        yield array(typecode, [rows[j][i] for j in range(i + 1, len(rows))])
+
+
+def substitute(rows: list, columns: Iterable, permutation: list[int], free_terms) -> array:
+    """Решает L * U * x = P * b прямой и обратной подстановкой по результатам eliminate().
+
+    Args:
+        rows (list): Строки с множителями L и U.
+        columns (Iterable): Столбцы множителей L (см. multiplier_columns()).
+        permutation (list[int]): Перестановка строк.
+        free_terms: Последовательность свободных членов длины n.
+
+    Returns:
+        array: Буфер решения (накопление в двойной точности).
+    """
+    solution = array('d', [free_terms[p] for p in permutation])
+
+    # Прямая подстановка L * y = P * b по столбцам L
+    for i, column in enumerate(columns):
+        value = solution[i]
+        if value != 0:
+            solution[i + 1:] = array('d', map(sub, solution[i + 1:], map(mul, column, repeat(value))))
+
+    # Обратная подстановка: U * x = y
+    for i in range(len(rows) - 1, -1, -1):
+        row = rows[i]
+        sum_ax = sum(map(mul, row[i + 1:], solution[i + 1:]))
+        solution[i] = (solution[i] - sum_ax) / row[i]
+    return solution
+
+
+class LUDecomposition:
+    """LU-разложение квадратной матрицы с выбором ведущего элемента по столбцу: P * A = L * U.
+
+    Разложение вычисляется один раз за O(n^3), после чего каждое решение системы
+    с новой правой частью стоит O(n^2).
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Выполняет разложение матрицы.
+
+        Args:
+            matrix (Matrix): Квадратная матрица системы.
+
+        Raises:
+            TypeError: Если аргумент не является матрицей.
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если матрица вырождена.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError("'matrix' can be only Matrix")
+        rows, cols = matrix.__len__()
+        if rows != cols:
+            raise ValueError('The matrix must be square (n x n) for the LU decomposition.')
+
+        self.__size: int = rows
+        # L (под диагональю, единичная диагональ не хранится) и U (диагональ и выше) в общих строках
+        self.__rows: list[array] = [array('d', matrix.row_buffer(i)) for i in range(rows)]
+        permutation, sign = eliminate(self.__rows)
+        self.__permutation: list[int] = permutation
+        self.__sign: int = sign
+        # Столбцы множителей L под диагональю (в порядке строк после перестановки)
+        self.__columns: list[array] = list(multiplier_columns(self.__rows))
+
+    @property
+    def size(self) -> int:
+        """Возвращает порядок разложенной матрицы."""
+        return self.__size
+
+    @property
+    def permutation(self) -> list[int]:
+        """Возвращает перестановку строк: i-я строка P * A - это строка permutation[i] матрицы A."""
+        return list(self.__permutation)
+
+    @property
+    def lower(self) -> Matrix:
+        """Возвращает нижнюю треугольную матрицу L с единичной диагональю."""
+        n = self.__size
+        data = array('d', bytes(8 * n * n))
+        for i, row in enumerate(self.__rows):
+            data[i * n:i * n + i] = row[:i]
+            data[i * n + i] = 1.0
+        return Matrix.from_buffer(n, n, data, copy=False)
+
+    @property
+    def upper(self) -> Matrix:
+        """Возвращает верхнюю треугольную матрицу U."""
+        n = self.__size
+        data = array('d', bytes(8 * n * n))
+        for i, row in enumerate(self.__rows):
+            data[i * n + i:(i + 1) * n] = row[i:]
+        return Matrix.from_buffer(n, n, data, copy=False)
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему A * x = b по готовому разложению за O(n^2).
+
+        Args:
+            col_of_free_mem (Vector): Вектор свободных членов.
+
+        Returns:
+            Vector: Вектор решений системы.
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы.
+        """
+        if not isinstance(col_of_free_mem, Vector):
+            raise TypeError('The "col_of_free_mem" argument is not a vector.')
+        if len(col_of_free_mem) != self.__size:
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+        return Vector.from_buffer(self.solve_buffer(col_of_free_mem.buffer), copy=False)
+
+    def solve_buffer(self, free_terms) -> array:
+        """Решает систему для правой части, заданной буфером, без проверок.
+
+        Args:
+            free_terms: Последовательность свободных членов длины n.
+
+        Returns:
+            array: Буфер решения.
+        """
+        # Те же функции использует Matrix.gauss(overwrite=True), поэтому результаты совпадают до бита
+        return substitute(self.__rows, self.__columns, self.__permutation, free_terms)
+
+    def solve_batch(self, free_terms: Union[Matrix, list[Vector], tuple]) -> Matrix:
+        """Решает систему по готовому разложению сразу для нескольких правых частей.
+
+        Args:
+            free_terms (Matrix | list[Vector]): Матрица n x k, столбцы которой - правые части,
+                или список векторов свободных членов.
+
+        Returns:
+            Matrix: Матрица n x k, столбцы которой - решения соответствующих систем.
+
+        Raises:
+            ValueError: Если число строк правых частей не совпадает с порядком матрицы.
+        """
+        if isinstance(free_terms, (list, tuple)):
+            free_terms = Matrix.from_columns(free_terms)
+        elif not isinstance(free_terms, Matrix):
+            raise TypeError('Free terms must be a Matrix or a list of vectors.')
+        rows, count = free_terms.__len__()
+        if rows != self.__size:
+            raise ValueError('The number of rows of free terms must be equal to the number of rows in the matrix.')
+
+        lu = self.__rows
+        n = self.__size
+        solutions = [array('d', free_terms.row_buffer(p)) for p in self.__permutation]
+
+        # Прямая подстановка: L * Y = P * B
+        for i in range(1, n):
+            row = lu[i]
+            accumulated = solutions[i]
+            for j in range(i):
+                if row[j] != 0:
+                    accumulated = array('d', map(sub, accumulated, map(mul, solutions[j], repeat(row[j]))))
+            solutions[i] = accumulated
+
+        # Обратная подстановка: U * X = Y
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            accumulated = solutions[i]
+            for j in range(i + 1, n):
+                if row[j] != 0:
+                    accumulated = array('d', map(sub, accumulated, map(mul, solutions[j], repeat(row[j]))))
+            solutions[i] = array('d', map(truediv, accumulated, repeat(row[i])))
+
+        result = array('d')
+        for solution in solutions:
+            result.extend(solution)
+        return Matrix.from_buffer(n, count, result, copy=False)
+
+    def det(self) -> float:
+        """Вычисляет определитель матрицы как произведение диагонали U с учетом знака перестановки."""
+        result = float(self.__sign)
+        for i, row in enumerate(self.__rows):
+            result *= row[i]
+        return result
+
+    def inverse(self) -> Matrix:
+        """Вычисляет обратную матрицу, решая систему сразу для всех столбцов единичной матрицы."""
+        return self.solve_batch(Matrix.identity(self.__size))
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление разложения."""
+        return f'{type(self).__name__}(size={self.__size})'
+
+
+class MixedPrecisionLU:
+    """LU-разложение в одинарной точности с итерационным уточнением решения.
+
+    Множители L и U хранятся в буферах ``array('f')``, то есть занимают вдвое меньше
+    памяти, чем в LUDecomposition. Решение, полученное по такому разложению, уточняется:
+    невязка r = b - A * x вычисляется в двойной точности по исходной матрице (сумма
+    произведений - через math.fsum без потери значащих цифр), поправка находится по тому же
+    разложению. Для матриц с числом обусловленности до ~1e7 несколько шагов уточнения
+    дают погрешность уровня двойной точности.
+    """
+
+    def __init__(self, matrix: Matrix, max_iterations: int = 10) -> None:
+        """Выполняет разложение матрицы в одинарной точности.
+
+        Args:
+            matrix (Matrix): Квадратная матрица системы; не должна изменяться, пока используется разложение.
+            max_iterations (int): Наибольшее количество шагов уточнения.
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если матрица вырождена (в одинарной точности).
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError("'matrix' can be only Matrix")
+        rows, cols = matrix.__len__()
+        if rows != cols:
+            raise ValueError('The matrix must be square (n x n) for the LU decomposition.')
+        if not isinstance(max_iterations, int) or max_iterations < 0:
+            raise ValueError('The number of iterations must be a non-negative integer.')
+        self.__size: int = rows
+        self.__matrix: Matrix = matrix
+        self.__version: int = matrix.version
+        self.__max_iterations: int = max_iterations
+        # Все хранимые величины прямого хода округляются до одинарной точности
+        self.__rows: list[array] = [array('f', matrix.row_buffer(i)) for i in range(rows)]
+        self.__permutation: list[int] = eliminate(self.__rows, 'f')[0]
+        self.__columns: list[array] = list(multiplier_columns(self.__rows, 'f'))
+
+    @property
+    def size(self) -> int:
+        """Возвращает порядок разложенной матрицы."""
+        return self.__size
+
+    @property
+    def factor_bytes(self) -> int:
+        """Возвращает объем памяти, занимаемый множителями L и U, в байтах."""
+        return sum(row.itemsize * len(row) for row in self.__rows)
+
+    def solve_buffer(self, free_terms) -> array:
+        """Решает систему по разложению одинарной точности без уточнения (накопление в двойной точности)."""
+        return substitute(self.__rows, self.__columns, self.__permutation, free_terms)
+
+    def residual(self, solution: array, free_terms) -> array:
+        """Вычисляет невязку b - A * x в двойной точности с точным суммированием произведений."""
+        matrix = self.__matrix
+        return array('d', [free_terms[i] - fsum(map(mul, matrix.row_buffer(i), solution))
+                           for i in range(self.__size)])
+
+    def refine(self, col_of_free_mem: Vector) -> SolverResult:
+        """Решает систему с итерационным уточнением.
+
+        Уточнение прекращается, когда невязка достигает уровня ошибок округления двойной
+        точности, или когда она перестает уменьшаться вдвое (уточнение не сходится для
+        плохо обусловленной матрицы).
+
+        Returns:
+            SolverResult: Решение, количество шагов уточнения, относительные нормы невязки
+                ||b - A * x|| / ||b|| перед каждым шагом и признак сходимости.
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы или матрица
+                изменилась после разложения.
+        """
+        validated_free_terms(self.__size, col_of_free_mem)
+        if self.__matrix.version != self.__version:
+            raise ValueError('The matrix has been modified after the decomposition.')
+        free_terms = col_of_free_mem.buffer
+        scale = norm2(free_terms) or 1.0
+        # Критерий остановки LAPACK (dsgesv): ||r|| <= ||x|| * ||A||_F * eps * sqrt(n)
+        bound = sqrt(self.__size) * DOUBLE_EPSILON * self.__matrix.norma('fro')
+        solution = self.solve_buffer(free_terms)
+        history = []
+        previous = float('inf')
+        converged = False
+        iterations = 0
+        while True:
+            residual = self.residual(solution, free_terms)
+            history.append(norm2(residual) / scale)
+            size = max(map(abs, residual))
+            if size <= bound * max(map(abs, solution)):
+                converged = True
+                break
+            if iterations == self.__max_iterations or size > previous / 2:
+                break
+            previous = size
+            solution = array('d', map(add, solution, self.solve_buffer(residual)))
+            iterations += 1
+        return SolverResult(Vector.from_buffer(solution, copy=False), iterations, history, converged)
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему с итерационным уточнением и возвращает решение (см. refine)."""
+        return self.refine(col_of_free_mem).solution
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление разложения."""
+        return f'{type(self).__name__}(size={self.__size})'
+
+
+def validated_symmetric(matrix: Matrix) -> int:
+    """Проверяет, что аргумент - квадратная матрица, и возвращает ее порядок.
+
+    Симметричность не проверяется: разложения читают только нижний треугольник.
+    """
+    if not isinstance(matrix, Matrix):
+        raise TypeError("'matrix' can be only Matrix")
+    rows, cols = matrix.__len__()
+    if rows != cols:
+        raise ValueError('The matrix must be square (n x n) for the decomposition.')
+    return rows
+
+
+def validated_free_terms(size: int, col_of_free_mem: Vector) -> None:
+    """Проверяет вектор свободных членов."""
+    if not isinstance(col_of_free_mem, Vector):
+        raise TypeError('The "col_of_free_mem" argument is not a vector.')
+    if len(col_of_free_mem) != size:
+        raise ValueError(
+            "The length of the column of free terms must be equal to the number of rows in the matrix.")
+
+
+class CholeskyDecomposition:
+    """Разложение Холецкого симметричной положительно определенной матрицы: A = L * L^T.
+
+    Используется только нижний треугольник матрицы, а L хранится построчно в упакованном
+    виде, поэтому разложение требует вдвое меньше операций и памяти, чем LU.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Выполняет разложение матрицы.
+
+        Args:
+            matrix (Matrix): Симметричная положительно определенная матрица.
+
+        Raises:
+            ValueError: Если матрица не квадратная или не является положительно определенной.
+        """
+        self.__size: int = validated_symmetric(matrix)
+        self.__rows: list[array] = []
+        for i in range(self.__size):
+            source = matrix.row_buffer(i)
+            row = array('d', bytes(8 * (i + 1)))
+            for j in range(i):
+                other = self.__rows[j]
+                row[j] = (source[j] - sum(map(mul, row[:j], other[:j]))) / other[j]
+            diagonal = source[i] - sum(map(mul, row[:i], row[:i]))
+            if diagonal <= 0:
+                raise ValueError(f'The matrix is not positive definite (pivot in row {i + 1} is not positive).')
+            row[i] = sqrt(diagonal)
+            self.__rows.append(row)
+
+    @property
+    def size(self) -> int:
+        """Возвращает порядок разложенной матрицы."""
+        return self.__size
+
+    @property
+    def lower(self) -> Matrix:
+        """Возвращает нижнюю треугольную матрицу L."""
+        n = self.__size
+        data = array('d', bytes(8 * n * n))
+        for i, row in enumerate(self.__rows):
+            data[i * n:i * n + i + 1] = row
+        return Matrix.from_buffer(n, n, data, copy=False)
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему A * x = b двумя треугольными подстановками за O(n^2).
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы.
+        """
+        validated_free_terms(self.__size, col_of_free_mem)
+        solution = array('d', col_of_free_mem)
+
+        # Прямая подстановка: L * y = b
+        for i, row in enumerate(self.__rows):
+            solution[i] = (solution[i] - sum(map(mul, row[:i], solution[:i]))) / row[i]
+
+        # Обратная подстановка: L^T * x = y (строка i матрицы L - столбец i матрицы L^T)
+        for i in range(self.__size - 1, -1, -1):
+            row = self.__rows[i]
+            solution[i] /= row[i]
+            if i:
+                solution[:i] = array('d', map(sub, solution[:i], map(mul, row[:i], repeat(solution[i]))))
+        return Vector.from_buffer(solution, copy=False)
+
+    def det(self) -> float:
+        """Вычисляет определитель матрицы как квадрат произведения диагонали L."""
+        result = 1.0
+        for i, row in enumerate(self.__rows):
+            result *= row[i]
+        return result * result
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление разложения."""
+        return f'{type(self).__name__}(size={self.__size})'
+
+
+class LDLDecomposition:
+    """Разложение симметричной матрицы вида A = L * D * L^T без выбора ведущего элемента.
+
+    L - нижняя треугольная матрица с единичной диагональю, D - диагональная. В отличие
+    от разложения Холецкого не требует положительной определенности и извлечения корней.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Выполняет разложение матрицы.
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если получен нулевой диагональный элемент D.
+        """
+        self.__size: int = validated_symmetric(matrix)
+        self.__rows: list[array] = []
+        self.__diagonal: array = array('d')
+        for i in range(self.__size):
+            source = matrix.row_buffer(i)
+            row = array('d', bytes(8 * i))
+            # scaled[k] = L[i][k] * D[k]
+            scaled = array('d', bytes(8 * i))
+            for j in range(i):
+                scaled[j] = source[j] - sum(map(mul, scaled[:j], self.__rows[j][:j]))
+                row[j] = scaled[j] / self.__diagonal[j]
+            diagonal = source[i] - sum(map(mul, scaled, row))
+            if abs(diagonal) < PIVOT_TOLERANCE:
+                raise ZeroDivisionError(
+                    f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
+            self.__diagonal.append(diagonal)
+            self.__rows.append(row)
+
+    @property
+    def size(self) -> int:
+        """Возвращает порядок разложенной матрицы."""
+        return self.__size
+
+    @property
+    def diagonal(self) -> Vector:
+        """Возвращает диагональ матрицы D."""
+        return Vector.from_buffer(self.__diagonal)
+
+    @property
+    def lower(self) -> Matrix:
+        """Возвращает нижнюю треугольную матрицу L с единичной диагональю."""
+        n = self.__size
+        data = array('d', bytes(8 * n * n))
+        for i, row in enumerate(self.__rows):
+            data[i * n:i * n + i] = row
+            data[i * n + i] = 1.0
+        return Matrix.from_buffer(n, n, data, copy=False)
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему A * x = b за O(n^2).
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы.
+        """
+        validated_free_terms(self.__size, col_of_free_mem)
+        solution = array('d', col_of_free_mem)
+
+        # L * y = b
+        for i, row in enumerate(self.__rows):
+            solution[i] -= sum(map(mul, row, solution[:i]))
+        # D * z = y
+        solution = array('d', map(truediv, solution, self.__diagonal))
+        # L^T * x = z
+        for i in range(self.__size - 1, 0, -1):
+            row = self.__rows[i]
+            solution[:i] = array('d', map(sub, solution[:i], map(mul, row, repeat(solution[i]))))
+        return Vector.from_buffer(solution, copy=False)
+
+    def det(self) -> float:
+        """Вычисляет определитель матрицы как произведение элементов D."""
+        result = 1.0
+        for value in self.__diagonal:
+            result *= value
+        return result
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление разложения."""
+        return f'{type(self).__name__}(size={self.__size})'
@@ -0,0 +1,142 @@
+import unittest
+from matrix import Matrix
+from vector import Vector
+from decompositions import CholeskyDecomposition, LDLDecomposition, LUDecomposition, MixedPrecisionLU
+
+
+class TestLUDecomposition(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем систему с известным решением."""
+        self.matrix = Matrix(3, 3)
+        self.matrix[0] = Vector(3, [2, 1, -1])
+        self.matrix[1] = Vector(3, [-3, -1, 2])
+        self.matrix[2] = Vector(3, [-2, 1, 2])
+        self.free_terms = Vector(3, [8, -11, -3])
+        self.solution = Vector(3, [2, 3, -1])
+
+    def assertVectorAlmostEqual(self, first: Vector, second: Vector, places: int = 9):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_factors(self):
+        """Тестируем, что P * A = L * U."""
+        lu = self.matrix.lu()
+        self.assertIsInstance(lu, LUDecomposition)
+        product = lu.lower * lu.upper
+        for i, p in enumerate(lu.permutation):
+            self.assertVectorAlmostEqual(product[i], self.matrix[p])
+
+    def test_solve(self):
+        """Тестируем решение нескольких систем по одному разложению."""
+        lu = self.matrix.lu()
+        self.assertVectorAlmostEqual(lu.solve(self.free_terms), self.solution)
+        other = Vector(3, [1, 2, 3])
+        self.assertVectorAlmostEqual(lu.solve(other), self.matrix.gauss(other))
+        with self.assertRaises(ValueError):
+            lu.solve(Vector(2))
+
+    def test_solve_batch(self):
+        """Тестируем решение сразу нескольких систем по разложению."""
+        other = Vector(3, [1, 2, 3])
+        solutions = self.matrix.lu().solve_batch([self.free_terms, other])
+        self.assertEqual(solutions.__len__(), (3, 2))
+        self.assertVectorAlmostEqual(Vector.from_buffer(solutions.column_buffer(0)), self.solution)
+        self.assertVectorAlmostEqual(Vector.from_buffer(solutions.column_buffer(1)), self.matrix.gauss(other))
+
+    def test_det_and_inverse(self):
+        """Тестируем определитель и обратную матрицу."""
+        lu = self.matrix.lu()
+        self.assertAlmostEqual(lu.det(), -1)
+        identity = self.matrix * lu.inverse()
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(identity[i, j], 1 if i == j else 0)
+
+    def test_singular_and_non_square(self):
+        """Тестируем исключения для вырожденной и неквадратной матриц."""
+        singular = Matrix(2, 2)
+        singular[0] = Vector(2, [1, 2])
+        singular[1] = Vector(2, [2, 4])
+        with self.assertRaises(ZeroDivisionError):
+            singular.lu()
+        with self.assertRaises(ValueError):
+            Matrix(2, 3).lu()
+
+    def test_mixed_precision(self):
+        """Тестируем LU в одинарной точности с итерационным уточнением."""
+        n = 30
+        matrix = Matrix.from_buffer(n, n, [((i * 37 + j * 11) % 17) / 3 + (i == j) * 10
+                                           for i in range(n) for j in range(n)])
+        exact = Vector.from_iterable((k % 7) - 3.5 for k in range(n))
+        free_terms = matrix * exact
+        mixed = matrix.mixed_lu()
+        self.assertIsInstance(mixed, MixedPrecisionLU)
+        self.assertIs(matrix.mixed_lu(), mixed)
+        self.assertEqual(mixed.factor_bytes, 4 * n * n)
+
+        # Без уточнения погрешность определяется одинарной точностью, после уточнения - двойной
+        unrefined = Vector.from_buffer(mixed.solve_buffer(free_terms.buffer))
+        self.assertGreater((unrefined - exact).norma(), 1e-10)
+        result = mixed.refine(free_terms)
+        self.assertTrue(result.converged)
+        self.assertGreater(result.iterations, 0)
+        self.assertLess(result.history[-1], result.history[0])
+        self.assertLess((result.solution - exact).norma(), 1e-12)
+
+        matrix[0, 0] = 1
+        with self.assertRaises(ValueError):
+            mixed.solve(free_terms)
+
+    def test_mixed_precision_ill_conditioned(self):
+        """Тестируем, что для плохо обусловленной матрицы уточнение сообщает об отсутствии сходимости."""
+        n = 9
+        hilbert = Matrix.from_buffer(n, n, [1 / (i + j + 1) for i in range(n) for j in range(n)])
+        result = MixedPrecisionLU(hilbert).refine(Vector(n, [1.0] * n))
+        self.assertFalse(result.converged)
+
+
+
+class TestSymmetricDecompositions(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем симметричную положительно определенную и симметричную знаконеопределенную матрицы."""
+        self.spd = Matrix.from_buffer(3, 3, [4, 12, -16, 12, 37, -43, -16, -43, 98])
+        self.indefinite = Matrix.from_buffer(3, 3, [1, 2, 3, 2, -4, 5, 3, 5, 6])
+        self.solution = Vector(3, [1, -2, 3])
+
+    def assertVectorAlmostEqual(self, first, second, places: int = 9):
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_cholesky(self):
+        """Тестируем разложение Холецкого."""
+        cholesky = self.spd.cholesky()
+        self.assertIsInstance(cholesky, CholeskyDecomposition)
+        self.assertTrue(cholesky.lower == Matrix.from_buffer(3, 3, [2, 0, 0, 6, 1, 0, -8, 5, 3]))
+        self.assertVectorAlmostEqual(cholesky.solve(self.spd * self.solution), self.solution)
+        self.assertAlmostEqual(cholesky.det(), 36)
+        with self.assertRaises(ValueError):
+            self.indefinite.cholesky()
+
+    def test_ldl(self):
+        """Тестируем разложение L * D * L^T."""
+        ldl = self.indefinite.ldl()
+        self.assertIsInstance(ldl, LDLDecomposition)
+        self.assertVectorAlmostEqual(ldl.solve(self.indefinite * self.solution), self.solution)
+        self.assertAlmostEqual(ldl.det(), self.indefinite.lu().det())
+        self.assertEqual(self.spd.ldl().diagonal, Vector(3, [4, 1, 9]))
+
+    def test_symmetry_and_dispatch(self):
+        """Тестируем проверку симметричности и выбор метода решения."""
+        self.assertTrue(self.spd.is_symmetric())
+        self.assertFalse(Matrix.from_buffer(2, 2, [1, 2, 2.5, 1]).is_symmetric())
+        self.assertTrue(Matrix.from_buffer(2, 2, [1, 2, 2.5, 1]).is_symmetric(tolerance=1))
+        self.assertEqual(self.spd.diagonal(), Vector(3, [4, 37, 98]))
+        self.assertVectorAlmostEqual(self.spd.solve(self.spd * self.solution), self.solution)
+        self.assertVectorAlmostEqual(self.indefinite.solve(self.indefinite * self.solution), self.solution)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import csv
+import json
+import os
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from statistics import mean, stdev
+from matrix import Matrix
+from vector import Vector
+
+# Поля результата одного запуска в порядке вывода
+TRIAL_FIELDS: tuple[str, ...] = ('mode', 'size', 'trial', 'seed', 'time', 'peak_memory', 'error')
+# Метрики, по которым считаются среднее и стандартное отклонение
+METRICS: tuple[str, ...] = ('time', 'peak_memory', 'error')
+# Режимы решения: метод Гаусса в двойной точности и LU в одинарной с итерационным уточнением
+MODES: tuple[str, ...] = ('double', 'mixed')
+
+
+def computational_experiment(matrix: Matrix, exact_solution: Vector, mode: str = 'double') -> float:
+    """Решает систему с известным решением и возвращает норму погрешности найденного решения.
+
+    Args:
+        matrix (Matrix): Матрица системы.
+        exact_solution (Vector): Точное решение.
+        mode (str): Режим решения из MODES.
+
+    Raises:
+        ValueError: Если режим неизвестен.
+    """
+    if mode not in MODES:
+        raise ValueError(f'Unknown mode {mode!r}; expected one of {MODES}.')
+    # Вычисляем вектор правой части b
+    b_vector = matrix * exact_solution
+
+    # Решаем полученную систему
+    found_solution = _solve(matrix, b_vector, mode)
+
+    # Вычисляем погрешность
+    error_vector = exact_solution - found_solution
+    return error_vector.norma()
+
+
+def _solve(matrix: Matrix, b_vector: Vector, mode: str) -> Vector:
+    """Решает систему в заданном режиме."""
+    if mode == 'mixed':
+        return matrix.mixed_lu().solve(b_vector)
+    return matrix.gauss(b_vector)
+
+
+def trial_seed(seed: int, size: int, trial: int) -> int:
+    """Вычисляет зерно генератора для запуска так, чтобы оно не зависело от порядка выполнения задач."""
+    return (seed * 1_000_003 + size) * 1_000_003 + trial
+
+
+def run_trial(size: int, trial: int, seed: int, mode: str = 'double') -> dict:
+    """Выполняет один запуск эксперимента.
+
+    Матрица и точное решение генерируются собственным генератором random.Random(seed),
+    поэтому запуск воспроизводим независимо от процесса, в котором он выполняется,
+    и не изменяет состояние глобального генератора. Время и пиковая память относятся
+    только к решению системы (без генерации и вычисления правой части) и измеряются
+    в разных проходах: время - по стенным часам с выключенным tracemalloc, который
+    замедляет каждое выделение памяти, память - повторным решением на копии матрицы
+    (без разложений, сохраненных в кэше первым проходом).
+
+    Returns:
+        dict: Поля TRIAL_FIELDS.
+    """
+    if mode not in MODES:
+        raise ValueError(f'Unknown mode {mode!r}; expected one of {MODES}.')
+    rng = random.Random(seed)
+    # Генерация случайной обусловленной матрицы и известного решения
+    matrix = Matrix.random_matrix(size, size, 1, 10, rng)
+    exact_solution = Vector.random_vector(size, 1, 10, rng)
+    b_vector = matrix * exact_solution
+
+    start = time.perf_counter()
+    found_solution = _solve(matrix, b_vector, mode)
+    elapsed = time.perf_counter() - start
+    error = (exact_solution - found_solution).norma()
+
+    matrix = matrix.copy()
+    tracemalloc.start()
+    try:
+        _solve(matrix, b_vector, mode)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'mode': mode, 'size': size, 'trial': trial, 'seed': seed,
+            'time': elapsed, 'peak_memory': peak_memory, 'error': error}
+
+
+def _run_job(job: tuple[int, int, int, str]) -> dict:
+    """Распаковывает задачу для пула процессов."""
+    return run_trial(*job)
+
+
+def run_experiment(sizes: list[int], trials: int = 1, seed: int = 0, workers: int | None = None,
+                   modes: tuple[str, ...] = ('double',)) -> list[dict]:
+    """Запускает эксперимент для всех сочетаний (режим, размер, номер запуска) в пуле процессов.
+
+    Запуски с одинаковыми размером и номером в разных режимах решают одну и ту же систему.
+
+    Args:
+        sizes (list[int]): Размеры систем.
+        trials (int): Количество запусков для каждого размера.
+        seed (int): Базовое зерно; зерно каждого запуска вычисляется функцией trial_seed().
+        workers (int | None): Количество процессов; по умолчанию os.cpu_count(), 1 - без пула.
+        modes (tuple[str, ...]): Режимы решения из MODES.
+
+    Returns:
+        list[dict]: Результаты запусков в порядке (режим, размер, номер запуска).
+
+    Raises:
+        ValueError: Если количество запусков или процессов не положительно или режим неизвестен.
+    """
+    if not isinstance(trials, int) or trials <= 0:
+        raise ValueError('The number of trials must be a positive integer.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError('The number of workers must be a positive integer.')
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise ValueError(f'Unknown modes {unknown}; expected some of {MODES}.')
+
+    # Крупные задачи ставим в очередь первыми, чтобы процессы завершали работу одновременно
+    jobs = [(size, trial, trial_seed(seed, size, trial), mode)
+            for mode in modes for size in sizes for trial in range(trials)]
+    order = sorted(range(len(jobs)), key=lambda k: -jobs[k][0])
+    if workers == 1:
+        results = {k: _run_job(jobs[k]) for k in order}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(order, executor.map(_run_job, [jobs[k] for k in order])))
+    return [results[k] for k in range(len(jobs))]
+
+
+def aggregate(results: list[dict]) -> list[dict]:
+    """Вычисляет среднее и стандартное отклонение метрик для каждого размера и режима.
+
+    Returns:
+        list[dict]: Для каждого размера (и режима внутри него) поля mode, size, trials,
+            <метрика>_mean и <метрика>_stdev.
+    """
+    groups: dict[tuple[int, str], list[dict]] = {}
+    for result in results:
+        groups.setdefault((result['size'], result['mode']), []).append(result)
+    summary = []
+    for size, mode in sorted(groups, key=lambda key: (key[0], MODES.index(key[1]))):
+        group = groups[size, mode]
+        row = {'mode': mode, 'size': size, 'trials': len(group)}
+        for metric in METRICS:
+            values = [result[metric] for result in group]
+            row[f'{metric}_mean'] = mean(values)
+            row[f'{metric}_stdev'] = stdev(values) if len(values) > 1 else 0.0
+        summary.append(row)
+    return summary
+
+
+def export_csv(rows: list[dict], filename: str) -> None:
+    """Записывает результаты (или сводку) в CSV-файл."""
+    if not rows:
+        raise ValueError('There are no results to export.')
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def export_json(results: list[dict], filename: str) -> None:
+    """Записывает результаты запусков и сводку по размерам в JSON-файл."""
+    with open(filename, 'w') as f:
+        json.dump({'trials': results, 'summary': aggregate(results)}, f, indent=2)
@@ -0,0 +1,74 @@
+import unittest
+import os
+import json
+import csv
+from matrix import Matrix
+from vector import Vector
+import experiment
+
+
+class TestExperiment(unittest.TestCase):
+
+    def test_computational_experiment(self):
+        """Тестируем вычисление погрешности решения."""
+        matrix = Matrix.from_buffer(2, 2, [2, 1, 1, 3])
+        self.assertLess(experiment.computational_experiment(matrix, Vector(2, [1, 2])), 1e-12)
+
+    def test_trials_are_repeatable(self):
+        """Тестируем воспроизводимость запусков с одинаковым зерном."""
+        first = experiment.run_trial(6, 0, 42)
+        second = experiment.run_trial(6, 0, 42)
+        self.assertEqual(first['error'], second['error'])
+        self.assertEqual(tuple(first), experiment.TRIAL_FIELDS)
+        self.assertGreater(first['peak_memory'], 0)
+
+    def test_run_and_aggregate(self):
+        """Тестируем запуск в пуле процессов и агрегирование."""
+        serial = experiment.run_experiment([2, 4], trials=2, seed=1, workers=1)
+        pooled = experiment.run_experiment([2, 4], trials=2, seed=1, workers=2)
+        self.assertEqual([(r['size'], r['trial']) for r in serial], [(2, 0), (2, 1), (4, 0), (4, 1)])
+        self.assertEqual([r['error'] for r in serial], [r['error'] for r in pooled])
+
+        summary = experiment.aggregate(serial)
+        self.assertEqual([row['size'] for row in summary], [2, 4])
+        self.assertEqual(summary[0]['trials'], 2)
+        self.assertAlmostEqual(summary[0]['error_mean'], (serial[0]['error'] + serial[1]['error']) / 2)
+        with self.assertRaises(ValueError):
+            experiment.run_experiment([2], trials=0)
+
+    def test_modes(self):
+        """Тестируем сравнение режимов решения на одних и тех же системах."""
+        results = experiment.run_experiment([5], trials=2, seed=3, workers=1, modes=experiment.MODES)
+        self.assertEqual([(r['mode'], r['trial']) for r in results],
+                         [('double', 0), ('double', 1), ('mixed', 0), ('mixed', 1)])
+        self.assertEqual(results[0]['seed'], results[2]['seed'])
+        self.assertTrue(all(r['error'] < 1e-10 for r in results))
+        summary = experiment.aggregate(results)
+        self.assertEqual([(row['size'], row['mode']) for row in summary], [(5, 'double'), (5, 'mixed')])
+        with self.assertRaises(ValueError):
+            experiment.run_experiment([5], workers=1, modes=('half',))
+        with self.assertRaises(ValueError):
+            experiment.computational_experiment(Matrix.identity(2), Vector(2, [1, 2]), 'half')
+        with self.assertRaises(ValueError):
+            experiment.run_trial(2, 0, 0, 'half')
+
+    def test_export(self):
+        """Тестируем экспорт в CSV и JSON."""
+        results = experiment.run_experiment([3], trials=2, workers=1)
+        try:
+            experiment.export_csv(results, 'test_experiment.csv')
+            experiment.export_json(results, 'test_experiment.json')
+            with open('test_experiment.csv') as f:
+                self.assertEqual(len(list(csv.DictReader(f))), 2)
+            with open('test_experiment.json') as f:
+                data = json.load(f)
+            self.assertEqual(len(data['trials']), 2)
+            self.assertEqual(data['summary'][0]['size'], 3)
+        finally:
+            for filename in ('test_experiment.csv', 'test_experiment.json'):
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
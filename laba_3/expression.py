@@ -0,0 +1,285 @@
+from abc import ABC, abstractmethod
+from array import array
+from contextlib import contextmanager
+from itertools import islice, repeat
+from operator import add, mul, sub, truediv
+from typing import Callable, Iterator, Union
+from matrix import Matrix
+from vector import Vector
+
+
+class Expression(ABC):
+    """Узел дерева отложенного матричного выражения.
+
+    Операции над выражениями не вычисляют результат, а строят дерево. Метод
+    evaluate() вычисляет его: поэлементные операции (сложение, вычитание, умножение
+    и деление на число) сливаются в один проход по элементам без промежуточных
+    матриц, числовые множители выносятся из матричных произведений, а цепочки
+    произведений перемножаются в порядке с наименьшим количеством операций.
+    """
+
+    __slots__ = ('shape',)
+
+    def __init__(self, shape: tuple[int, int]) -> None:
+        self.shape: tuple[int, int] = shape
+
+    @staticmethod
+    def wrap(operand: Union['Expression', Matrix]) -> 'Expression':
+        """Приводит операнд к выражению."""
+        if isinstance(operand, Expression):
+            return operand
+        if isinstance(operand, Matrix):
+            return Leaf(operand)
+        raise TypeError("'other' can be only Matrix or Expression")
+
+    def __add__(self, other: Union['Expression', Matrix]) -> 'Expression':
+        """Отложенное сложение."""
+        other = Expression.wrap(other)
+        if self.shape != other.shape:
+            raise ValueError('Matrices must be of the same dimensions for addition.')
+        return Elementwise(add, self, other)
+
+    def __radd__(self, other: Matrix) -> 'Expression':
+        return Expression.wrap(other) + self
+
+    def __sub__(self, other: Union['Expression', Matrix]) -> 'Expression':
+        """Отложенное вычитание."""
+        other = Expression.wrap(other)
+        if self.shape != other.shape:
+            raise ValueError('Matrices must be of the same dimensions for subtraction.')
+        return Elementwise(sub, self, other)
+
+    def __rsub__(self, other: Matrix) -> 'Expression':
+        return Expression.wrap(other) - self
+
+    def __mul__(self, other: Union['Expression', Matrix, int, float]) -> 'Expression':
+        """Отложенное умножение на число или матрицу."""
+        if isinstance(other, (int, float)):
+            return Scale.of(self, other)
+        if isinstance(other, Vector):
+            raise TypeError('Unsupported type for multiplication.')
+        other = Expression.wrap(other)
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(
+                'Number of columns in the first matrix must equal the number of rows in the second matrix.')
+        # Числовые множители выносятся за произведение и применяются в поэлементном проходе
+        factor = 1.0
+        if isinstance(self, Scale) and self.op is mul:
+            factor, left = self.factor, self.operand
+        else:
+            left = self
+        if isinstance(other, Scale) and other.op is mul:
+            factor, right = factor * other.factor, other.operand
+        else:
+            right = other
+        product = Product(Product.operands(left) + Product.operands(right))
+        return product if factor == 1.0 else Scale(product, factor, mul)
+
+    def __rmul__(self, other: Union[Matrix, int, float]) -> 'Expression':
+        if isinstance(other, (int, float)):
+            return Scale.of(self, other)
+        return Expression.wrap(other) * self
+
+    def __truediv__(self, other: Union[int, float]) -> 'Expression':
+        """Отложенное деление на число."""
+        if not isinstance(other, (int, float)):
+            raise TypeError('Unsupported type for division.')
+        if other == 0:
+            raise ValueError("Division by zero is not allowed.")
+        return Scale(self, other, truediv)
+
+    def __neg__(self) -> 'Expression':
+        """Отложенное отрицание (в отличие от Matrix.__neg__ не изменяет операнд)."""
+        return Scale.of(self, -1.0)
+
+    @abstractmethod
+    def stream(self) -> Iterator[float]:
+        """Возвращает итератор по элементам результата по строкам."""
+
+    def evaluate(self, out: Matrix | None = None) -> Matrix:
+        """Вычисляет выражение.
+
+        Args:
+            out (Matrix | None): Матрица, в которую записывается результат; None - новая матрица.
+                Может совпадать с одним из операндов: каждый элемент читается до его перезаписи.
+
+        Returns:
+            Matrix: Результат (out, если он задан).
+
+        Raises:
+            ValueError: Если размеры out не совпадают с размерами результата.
+        """
+        rows, cols = self.shape
+        if out is None:
+            return Matrix.from_buffer(rows, cols, array('d', self.stream()), copy=False)
+        if not isinstance(out, Matrix):
+            raise TypeError("'out' can be only Matrix")
+        if out.__len__() != self.shape:
+            raise ValueError('The output matrix must have the dimensions of the result.')
+        elements = self.stream()
+        for i in range(rows):
+            out.row_buffer(i, writable=True)[:] = array('d', islice(elements, cols))
+        return out
+
+
+class Leaf(Expression):
+    """Операнд выражения - существующая матрица."""
+
+    __slots__ = ('matrix',)
+
+    def __init__(self, matrix: Matrix) -> None:
+        super().__init__(matrix.__len__())
+        self.matrix: Matrix = matrix
+
+    def stream(self) -> Iterator[float]:
+        return self.matrix.elements()
+
+    def __repr__(self) -> str:
+        return f'Leaf({self.shape[0]}x{self.shape[1]})'
+
+
+class Elementwise(Expression):
+    """Поэлементная операция над двумя выражениями одного размера."""
+
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op: Callable[[float, float], float], left: Expression, right: Expression) -> None:
+        super().__init__(left.shape)
+        self.op = op
+        self.left: Expression = left
+        self.right: Expression = right
+
+    def stream(self) -> Iterator[float]:
+        return map(self.op, self.left.stream(), self.right.stream())
+
+    def __repr__(self) -> str:
+        return f'({self.left!r} {"+" if self.op is add else "-"} {self.right!r})'
+
+
+class Scale(Expression):
+    """Умножение или деление выражения на число."""
+
+    __slots__ = ('operand', 'factor', 'op')
+
+    def __init__(self, operand: Expression, factor: Union[int, float],
+                 op: Callable[[float, float], float] = mul) -> None:
+        super().__init__(operand.shape)
+        self.operand: Expression = operand
+        self.factor: Union[int, float] = factor
+        self.op = op
+
+    @classmethod
+    def of(cls, operand: Expression, factor: Union[int, float]) -> Expression:
+        """Умножает выражение на число, объединяя последовательные множители."""
+        if isinstance(operand, Scale) and operand.op is mul:
+            return cls(operand.operand, operand.factor * factor)
+        return cls(operand, factor)
+
+    def stream(self) -> Iterator[float]:
+        return map(self.op, self.operand.stream(), repeat(self.factor))
+
+    def __repr__(self) -> str:
+        return f'({self.operand!r} {"*" if self.op is mul else "/"} {self.factor!r})'
+
+
+class Product(Expression):
+    """Цепочка матричных произведений, перемножаемая в оптимальном порядке."""
+
+    __slots__ = ('factors',)
+
+    def __init__(self, factors: list[Expression]) -> None:
+        super().__init__((factors[0].shape[0], factors[-1].shape[1]))
+        self.factors: list[Expression] = factors
+
+    @staticmethod
+    def operands(node: Expression) -> list[Expression]:
+        """Разворачивает вложенные произведения в список сомножителей."""
+        return list(node.factors) if isinstance(node, Product) else [node]
+
+    def order(self) -> list[list[int]]:
+        """Находит расстановку скобок с наименьшим количеством умножений (динамическое программирование).
+
+        Returns:
+            list[list[int]]: split[i][j] - индекс, после которого делится цепочка сомножителей i..j.
+        """
+        dims = [factor.shape[0] for factor in self.factors] + [self.shape[1]]
+        count = len(self.factors)
+        cost = [[0] * count for _ in range(count)]
+        split = [[0] * count for _ in range(count)]
+        for length in range(1, count):
+            for i in range(count - length):
+                j = i + length
+                cost[i][j], split[i][j] = min(
+                    (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k) for k in range(i, j))
+        return split
+
+    def compute(self) -> Matrix:
+        """Вычисляет произведение, предварительно вычислив сомножители-выражения."""
+        matrices = [factor.matrix if isinstance(factor, Leaf) else factor.evaluate() for factor in self.factors]
+        split = self.order()
+
+        def multiply(i: int, j: int) -> Matrix:
+            if i == j:
+                return matrices[i]
+            k = split[i][j]
+            return multiply(i, k).matmul(multiply(k + 1, j))
+        return multiply(0, len(matrices) - 1)
+
+    def stream(self) -> Iterator[float]:
+        return self.compute().elements()
+
+    def evaluate(self, out: Matrix | None = None) -> Matrix:
+        if out is None:
+            return self.compute()
+        return super().evaluate(out)
+
+    def __repr__(self) -> str:
+        return '(' + ' @ '.join(map(repr, self.factors)) + ')'
+
+
+def lazy(matrix: Matrix) -> Expression:
+    """Возвращает отложенное выражение, состоящее из одной матрицы."""
+    if not isinstance(matrix, Matrix):
+        raise TypeError("'matrix' can be only Matrix")
+    return Leaf(matrix)
+
+
+def _lazy_operator(name: str, original: Callable | None) -> Callable:
+    """Создает оператор Matrix, строящий выражение вместо вычисления."""
+    def operator(self, *args):
+        if args and isinstance(args[0], Vector):
+            # Произведение и деление на вектор остаются немедленными
+            return original(self, *args)
+        return getattr(Leaf(self), name)(*args)
+    operator.__name__ = name
+    return operator
+
+
+@contextmanager
+def lazy_mode() -> Iterator[None]:
+    """Включает отложенные вычисления для операторов Matrix на время работы контекста.
+
+    Внутри контекста +, -, * (на число или матрицу), / (на число) и унарный минус
+    возвращают Expression; результат получается вызовом evaluate().
+
+    Операторы подменяются в самом классе Matrix, то есть для всего процесса: на время
+    контекста отложенными становятся выражения во всех потоках и модулях, а не только
+    в коде внутри with. Поэтому lazy_mode() не потокобезопасен - его нельзя использовать,
+    пока другие потоки выполняют операции над матрицами, и нельзя вкладывать в потоках.
+
+    Пример:
+        with lazy_mode():
+            result = (a * b + c * 2 - d).evaluate()
+    """
+    names = ('__add__', '__sub__', '__mul__', '__rmul__', '__truediv__', '__neg__')
+    saved = {name: vars(Matrix).get(name) for name in names}
+    try:
+        for name in names:
+            setattr(Matrix, name, _lazy_operator(name, getattr(Matrix, name, None)))
+        yield
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                delattr(Matrix, name)
+            else:
+                setattr(Matrix, name, original)
@@ -0,0 +1,84 @@
+import unittest
+from array import array
+from expression import Expression, Product, Scale, lazy, lazy_mode
+from matrix import Matrix
+from vector import Vector
+
+
+def from_rows(rows: list[list[float]]) -> Matrix:
+    return Matrix.from_buffer(len(rows), len(rows[0]), array('d', [value for row in rows for value in row]))
+
+
+class TestExpression(unittest.TestCase):
+
+    def setUp(self):
+        self.a = from_rows([[1, 2, 3], [4, 5, 6]])
+        self.b = from_rows([[1, 0], [2, 1], [0, 3]])
+        self.c = from_rows([[1, 1], [2, 2]])
+        self.d = from_rows([[5, 4], [3, 2]])
+
+    def test_evaluate(self):
+        """Тестируем совпадение отложенного и немедленного вычисления."""
+        expected = self.a * self.b + self.c * 2 - self.d
+        result = (self.a.lazy() * self.b + lazy(self.c) * 2 - self.d).evaluate()
+        self.assertTrue(result == expected)
+        self.assertTrue((-(lazy(self.c) / 2) + self.d).evaluate() == self.d - self.c / 2)
+        self.assertTrue((2 * lazy(self.c)).evaluate() == self.c * 2)
+
+    def test_out(self):
+        """Тестируем запись результата в существующую матрицу, в том числе в операнд."""
+        expected = self.c * 3 - self.d
+        out = Matrix(2, 2)
+        self.assertIs((lazy(self.c) * 3 - self.d).evaluate(out), out)
+        self.assertTrue(out == expected)
+        (lazy(self.c) * 3 - self.d).evaluate(self.c)
+        self.assertTrue(self.c == expected)
+        with self.assertRaises(ValueError):
+            lazy(self.c).evaluate(Matrix(3, 3))
+
+    def test_rewrites(self):
+        """Тестируем вынос множителей и порядок перемножения цепочки."""
+        expression = (lazy(self.a) * 2) * (lazy(self.b) * 3)
+        self.assertIsInstance(expression, Scale)
+        self.assertEqual(expression.factor, 6)
+        self.assertIsInstance(expression.operand, Product)
+        self.assertTrue(expression.evaluate() == (self.a * self.b) * 6)
+
+        # (10x1 * 1x10) * 10x1: выгоднее сначала умножить правую пару
+        column = Matrix.from_buffer(10, 1, array('d', range(10)))
+        row = Matrix.from_buffer(1, 10, array('d', range(10)))
+        chain = lazy(column) * row * column
+        self.assertEqual(len(chain.factors), 3)
+        self.assertEqual(chain.order()[0][2], 0)
+        self.assertTrue(chain.evaluate() == column * row * column)
+
+    def test_errors(self):
+        """Тестируем проверки размеров и типов при построении выражения."""
+        with self.assertRaises(ValueError):
+            lazy(self.a) + self.c
+        with self.assertRaises(ValueError):
+            lazy(self.a) * self.a
+        with self.assertRaises(TypeError):
+            lazy(self.a) * Vector(3)
+        with self.assertRaises(ValueError):
+            lazy(self.a) / 0
+        with self.assertRaises(TypeError):
+            lazy([1, 2])
+        # Узел без stream() создать нельзя
+        with self.assertRaises(TypeError):
+            Expression((2, 2))
+
+    def test_lazy_mode(self):
+        """Тестируем отложенные операторы Matrix внутри контекста."""
+        expected = self.a * self.b + self.c * 2 - self.d
+        with lazy_mode():
+            expression = self.a * self.b + self.c * 2 - self.d
+            self.assertIsInstance(expression, Expression)
+            self.assertIsInstance(self.c * Vector(2, [1, 1]), Vector)
+        self.assertTrue(expression.evaluate() == expected)
+        self.assertNotIn('__rmul__', vars(Matrix))
+        self.assertIsInstance(self.c * 2, Matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import random
+from array import array
+from operator import mul
+from banded import BandMatrix
+from matrix import Matrix
+from sparse_matrix import SparseMatrix
+
+
+def make_rng(rng: random.Random | int | None = None):
+    """Приводит аргумент rng генераторов к источнику случайных чисел.
+
+    Args:
+        rng (random.Random | int | None): Генератор, зерно нового генератора или None -
+            функции модуля random (воспроизводимость через random.seed()).
+
+    Returns:
+        Объект с методами uniform(), gauss() и sample(): генератор или модуль random.
+    """
+    if rng is None or rng is random:
+        return random
+    if isinstance(rng, int) and not isinstance(rng, bool):
+        return random.Random(rng)
+    if isinstance(rng, random.Random):
+        return rng
+    raise TypeError("'rng' can be only random.Random, int or None")
+
+
+def uniform_values(count: int, start: float = -1.0, end: float = 1.0,
+                   rng: random.Random | int | None = None) -> array:
+    """Генерирует count равномерно распределенных чисел одним проходом в буфер array('d')."""
+    uniform = make_rng(rng).uniform
+    return array('d', [uniform(start, end) for _ in range(count)])
+
+
+def uniform_matrix(rows: int, cols: int, start: float = -1.0, end: float = 1.0,
+                   rng: random.Random | int | None = None) -> Matrix:
+    """Создает матрицу с равномерно распределенными элементами (без округления, в отличие от random_matrix)."""
+    Matrix.validated_rows(rows)
+    Matrix.validated_cols(cols)
+    return Matrix.from_buffer(rows, cols, uniform_values(rows * cols, start, end, rng), copy=False)
+
+
+def diagonally_dominant(size: int, rng: random.Random | int | None = None, start: float = -1.0,
+                        end: float = 1.0, margin: float = 1.0) -> Matrix:
+    """Создает матрицу со строгим диагональным преобладанием по строкам.
+
+    Внедиагональные элементы равномерно распределены в [start, end], диагональный
+    элемент равен сумме модулей остальных элементов строки плюс margin, поэтому
+    матрица невырождена и метод Гаусса не требует перестановок.
+
+    Raises:
+        ValueError: Если margin не положителен.
+    """
+    if margin <= 0:
+        raise ValueError('The margin must be positive.')
+    matrix = uniform_matrix(size, size, start, end, rng)
+    for i in range(size):
+        row = matrix.row_buffer(i, writable=True)
+        row[i] = 0.0
+        row[i] = sum(map(abs, row)) + margin
+    return matrix
+
+
+def spd(size: int, rng: random.Random | int | None = None, start: float = -1.0,
+        end: float = 1.0, margin: float = 1.0) -> Matrix:
+    """Создает симметричную положительно определенную матрицу.
+
+    Матрица симметрична и имеет положительную диагональ со строгим диагональным
+    преобладанием, поэтому по теореме Гершгорина ее собственные значения не меньше
+    margin. Генерация стоит O(n^2), в отличие от произведения B^T * B.
+
+    Raises:
+        ValueError: Если margin не положителен.
+    """
+    if margin <= 0:
+        raise ValueError('The margin must be positive.')
+    matrix = uniform_matrix(size, size, start, end, rng)
+    for i in range(size):
+        row = matrix.row_buffer(i, writable=True)
+        # Нижний треугольник зеркально копирует верхний
+        row[:i] = matrix.column_buffer(i)[:i]
+    for i in range(size):
+        row = matrix.row_buffer(i, writable=True)
+        row[i] = 0.0
+        row[i] = sum(map(abs, row)) + margin
+    return matrix
+
+
+def banded(size: int, lower: int, upper: int, rng: random.Random | int | None = None,
+           start: float = -1.0, end: float = 1.0, margin: float = 1.0) -> BandMatrix:
+    """Создает ленточную матрицу с диагональным преобладанием по строкам.
+
+    Args:
+        size (int): Порядок матрицы.
+        lower (int): Количество поддиагоналей.
+        upper (int): Количество наддиагоналей.
+        rng (random.Random | int | None): Генератор случайных чисел (см. make_rng()).
+        start (float): Начало диапазона внедиагональных элементов.
+        end (float): Конец диапазона внедиагональных элементов.
+        margin (float): Превышение диагонального элемента над суммой модулей остальных.
+
+    Returns:
+        BandMatrix: Новая ленточная матрица.
+    """
+    if margin <= 0:
+        raise ValueError('The margin must be positive.')
+    band = BandMatrix(size, lower, upper)
+    lower, upper = band.bandwidth
+    uniform = make_rng(rng).uniform
+    for i in range(size):
+        total = 0.0
+        for j in range(max(0, i - lower), min(size, i + upper + 1)):
+            if j != i:
+                value = uniform(start, end)
+                band[i, j] = value
+                total += abs(value)
+        band[i, i] = total + margin
+    return band
+
+
+def sparse(rows: int, cols: int, density: float, rng: random.Random | int | None = None,
+           start: float = -1.0, end: float = 1.0, dominant: bool = False) -> SparseMatrix:
+    """Создает разреженную матрицу с заданной долей ненулевых элементов.
+
+    Позиции выбираются без повторений одним вызовом sample() по номерам элементов,
+    поэтому генерация стоит O(nnz), а не O(rows * cols).
+
+    Args:
+        rows (int): Количество строк.
+        cols (int): Количество столбцов.
+        density (float): Доля ненулевых элементов от 0 до 1.
+        rng (random.Random | int | None): Генератор случайных чисел (см. make_rng()).
+        start (float): Начало диапазона значений.
+        end (float): Конец диапазона значений.
+        dominant (bool): Добавить диагональ со строгим диагональным преобладанием
+            (только для квадратной матрицы), чтобы система была разрешима.
+
+    Returns:
+        SparseMatrix: Новая разреженная матрица.
+
+    Raises:
+        ValueError: Если доля вне [0, 1] или dominant задан для неквадратной матрицы.
+    """
+    Matrix.validated_rows(rows)
+    Matrix.validated_cols(cols)
+    if not 0 <= density <= 1:
+        raise ValueError('The density must be between 0 and 1.')
+    if dominant and rows != cols:
+        raise ValueError('The matrix must be square (n x n) for diagonal dominance.')
+    rng = make_rng(rng)
+    positions = sorted(rng.sample(range(rows * cols), round(density * rows * cols)))
+    if dominant:
+        positions = [position for position in positions if position % (cols + 1)]
+    row_indices = array('q', [position // cols for position in positions])
+    col_indices = array('q', [position % cols for position in positions])
+    values = uniform_values(len(positions), start, end, rng)
+    if dominant:
+        totals = [1.0] * rows
+        for i, value in zip(row_indices, values):
+            totals[i] += abs(value)
+        row_indices.extend(range(rows))
+        col_indices.extend(range(rows))
+        values.extend(totals)
+    return SparseMatrix.from_coo(rows, cols, row_indices, col_indices, values)
+
+
+def with_condition_number(size: int, condition: float, rng: random.Random | int | None = None) -> Matrix:
+    """Создает матрицу с заданным числом обусловленности в спектральной норме.
+
+    Матрица строится как H1 * S * H2, где H1, H2 - случайные отражения Хаусхолдера,
+    а сингулярные значения S убывают в геометрической прогрессии от 1 до 1 / condition.
+    Произведение раскрывается явно, поэтому генерация стоит O(n^2).
+
+    Args:
+        size (int): Порядок матрицы.
+        condition (float): Число обусловленности, не меньше 1 (для size = 1 всегда 1).
+        rng (random.Random | int | None): Генератор случайных чисел (см. make_rng()).
+
+    Returns:
+        Matrix: Новая матрица.
+
+    Raises:
+        ValueError: Если число обусловленности меньше 1.
+    """
+    Matrix.validated_rows(size)
+    if condition < 1:
+        raise ValueError('The condition number must be at least 1.')
+    rng = make_rng(rng)
+    singular = array('d', [condition ** (-i / (size - 1)) if size > 1 else 1.0 for i in range(size)])
+    v1 = array('d', [rng.gauss(0.0, 1.0) for _ in range(size)])
+    v2 = array('d', [rng.gauss(0.0, 1.0) for _ in range(size)])
+    c1 = sum(map(mul, v1, v1))
+    c2 = sum(map(mul, v2, v2))
+    # w = v1^T * S * H2
+    t = sum(map(mul, map(mul, v1, singular), v2))
+    w = array('d', [v1[j] * singular[j] - 2 * t * v2[j] / c2 for j in range(size)])
+    result = array('d')
+    for i in range(size):
+        a = -2 * singular[i] * v2[i] / c2
+        b = -2 * v1[i] / c1
+        row = array('d', [a * x + b * y for x, y in zip(v2, w)])
+        row[i] += singular[i]
+        result.extend(row)
+    return Matrix.from_buffer(size, size, result, copy=False)
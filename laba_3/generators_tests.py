@@ -0,0 +1,79 @@
+import random
+import unittest
+from matrix import Matrix
+from vector import Vector
+import generators
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_reproducibility(self):
+        """Тестируем, что одно и то же зерно дает одну и ту же матрицу, а глобальный генератор не меняется."""
+        random.seed(1)
+        state = random.getstate()
+        first = generators.uniform_matrix(4, 5, rng=42)
+        second = generators.uniform_matrix(4, 5, rng=random.Random(42))
+        self.assertEqual(first.__len__(), (4, 5))
+        self.assertEqual(list(first.elements()), list(second.elements()))
+        self.assertEqual(random.getstate(), state)
+        self.assertNotEqual(list(first.elements()), list(generators.uniform_matrix(4, 5, rng=43).elements()))
+        with self.assertRaises(TypeError):
+            generators.make_rng('seed')
+
+    def test_diagonally_dominant(self):
+        """Тестируем строгое диагональное преобладание."""
+        matrix = generators.diagonally_dominant(6, 1)
+        for i in range(6):
+            row = matrix[i]
+            self.assertGreater(abs(row[i]), sum(abs(x) for j, x in enumerate(row) if j != i))
+        with self.assertRaises(ValueError):
+            generators.diagonally_dominant(3, margin=0)
+
+    def test_spd(self):
+        """Тестируем, что матрица симметрична и раскладывается по Холецкому."""
+        matrix = generators.spd(7, 2)
+        self.assertTrue(matrix.is_symmetric())
+        b = Vector(7, [1] * 7)
+        x = matrix.cholesky().solve(b)
+        for value, expected in zip(matrix * x, b):
+            self.assertAlmostEqual(value, expected, places=9)
+
+    def test_banded(self):
+        """Тестируем ширину ленты и диагональное преобладание ленточной матрицы."""
+        band = generators.banded(10, 2, 1, 3)
+        self.assertEqual(band.bandwidth, (2, 1))
+        self.assertTrue(band.is_diagonally_dominant())
+        self.assertNotEqual(band[5, 3], 0)
+        self.assertEqual(band[5, 2], 0)
+
+    def test_sparse(self):
+        """Тестируем долю ненулевых элементов и разрешимость разреженной матрицы."""
+        matrix = generators.sparse(20, 30, 0.1, 4)
+        self.assertEqual(matrix.__len__(), (20, 30))
+        self.assertEqual(matrix.nnz, 60)
+        dominant = generators.sparse(40, 40, 0.05, 5, dominant=True)
+        self.assertTrue(all(dominant[i, i] >= 1 for i in range(40)))
+        b = Vector(40, [1] * 40)
+        x = dominant.solve(b)
+        for value, expected in zip(dominant * x, b):
+            self.assertAlmostEqual(value, expected, places=9)
+        with self.assertRaises(ValueError):
+            generators.sparse(3, 3, 1.5)
+        with self.assertRaises(ValueError):
+            generators.sparse(3, 4, 0.5, dominant=True)
+
+    def test_condition_number(self):
+        """Тестируем заданные сингулярные значения через нормы Фробениуса матрицы и обратной к ней."""
+        size, condition = 6, 1e4
+        matrix = generators.with_condition_number(size, condition, 6)
+        inverse = matrix.gauss_batch(Matrix.identity(size))
+        singular = [condition ** (-i / (size - 1)) for i in range(size)]
+        self.assertAlmostEqual(matrix.norma('fro') ** 2, sum(s * s for s in singular), places=9)
+        self.assertAlmostEqual(inverse.norma('fro') ** 2 / sum(1 / (s * s) for s in singular), 1.0, places=6)
+        self.assertAlmostEqual(abs(generators.with_condition_number(1, 1.0)[0, 0]), 1.0)
+        with self.assertRaises(ValueError):
+            generators.with_condition_number(3, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator
+from decompositions import LUDecomposition
+from matrix import Matrix
+from vector import Vector
+
+# Методы, для которых считается только количество вызовов (без замера времени)
+COUNTED: tuple[str, ...] = ('__getitem__', '__setitem__')
+# Арифметические операции, время которых замеряется наравне с открытыми методами
+OPERATORS: tuple[str, ...] = ('__add__', '__sub__', '__mul__', '__truediv__', '__neg__',
+                              '__iadd__', '__isub__', '__imul__', '__itruediv__')
+# Методы, каждый вызов которых создает новый объект: конструктор и создание поверх буфера
+# (from_buffer создает объект через __new__, минуя __init__)
+ALLOCATORS: tuple[str, ...] = ('__init__', 'from_buffer')
+
+
+def _size(obj) -> tuple[int, int]:
+    """Возвращает размер матрицы или вектора (вектор считается столбцом)."""
+    if isinstance(obj, Matrix):
+        return obj.__len__()
+    return len(obj), 1
+
+
+def _mul_flops(self, other, *args, **kwargs) -> int:
+    """Оценивает количество операций с плавающей точкой при умножении."""
+    rows, inner = _size(self)
+    if isinstance(other, (Matrix, Vector)):
+        return 2 * rows * inner * _size(other)[1]
+    return rows * inner
+
+
+def _gauss_flops(self, col_of_free_mem=None, overwrite: bool = False, *args, **kwargs) -> int:
+    """Оценивает количество операций метода Гаусса на месте: 2/3 n^3 на исключение и 2 n^2 на подстановку.
+
+    Без overwrite метод Гаусса использует кэшированное разложение Matrix.lu(); операции
+    LUDecomposition учитываются отдельно и только при вычислении разложения.
+    """
+    if not overwrite:
+        return 0
+    n = self.__len__()[0]
+    return 2 * n ** 3 // 3 + 2 * n ** 2
+
+
+def _factorization_flops(self, matrix, *args, **kwargs) -> int:
+    """Оценивает количество операций LU-разложения: 2/3 n^3 (учитывается только при вычислении разложения)."""
+    return 2 * matrix.__len__()[0] ** 3 // 3
+
+
+def _substitution_flops(self, free_terms, *args, **kwargs) -> int:
+    """Оценивает количество операций прямой и обратной подстановки: 2 n^2 на каждую правую часть."""
+    if isinstance(free_terms, Matrix):
+        n, count = free_terms.__len__()
+    elif isinstance(free_terms, (list, tuple)):
+        n, count = (len(free_terms[0]) if free_terms else 0), len(free_terms)
+    else:
+        n, count = len(free_terms), 1
+    return 2 * n ** 2 * count
+
+
+# (класс, метод) -> оценка количества операций по аргументам вызова
+FLOP_ESTIMATES: dict[tuple[type, str], Callable[..., int]] = {
+    (Matrix, '__mul__'): _mul_flops,
+    (Vector, '__mul__'): _mul_flops,
+    (Matrix, 'gauss'): _gauss_flops,
+    (LUDecomposition, '__init__'): _factorization_flops,
+    (LUDecomposition, 'solve'): _substitution_flops,
+    (LUDecomposition, 'solve_batch'): _substitution_flops,
+}
+
+
+class Profile:
+    """Результаты измерений, накопленные за время работы контекста instrument().
+
+    Attributes:
+        calls (Counter): Количество вызовов по именам вида 'Класс.метод'.
+        times (Counter): Суммарное время выполнения методов в секундах (вложенные вызовы
+            других методов входят во время вызывающего метода).
+        flops (Counter): Оценка количества операций с плавающей точкой по методам.
+        allocations (Counter): Количество созданных объектов по именам классов.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self.times: Counter = Counter()
+        self.flops: Counter = Counter()
+        self.allocations: Counter = Counter()
+
+    def as_dict(self) -> dict:
+        """Возвращает результаты измерений в виде словаря (например, для записи в JSON)."""
+        return {'calls': dict(self.calls), 'times': dict(self.times),
+                'flops': dict(self.flops), 'allocations': dict(self.allocations)}
+
+    def report(self) -> str:
+        """Формирует текстовый отчет: методы по убыванию суммарного времени, затем счетчики."""
+        lines = [f'{"Метод":<32} {"Вызовы":>10} {"Время, с":>12} {"FLOP":>14} {"MFLOP/с":>10}']
+        names = sorted(self.calls, key=lambda name: (-self.times[name], -self.calls[name], name))
+        for name in names:
+            seconds = self.times.get(name)
+            flops = self.flops.get(name)
+            rate = f'{flops / seconds / 1e6:10.1f}' if flops and seconds else f'{"":>10}'
+            lines.append(f'{name:<32} {self.calls[name]:>10} '
+                         f'{"" if seconds is None else f"{seconds:.6f}":>12} '
+                         f'{"" if flops is None else flops:>14} {rate}')
+        for name, count in sorted(self.allocations.items()):
+            lines.append(f'Создано объектов {name}: {count}')
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
+
+
+# Активный профиль; None означает, что методы классов не подменены
+_active: Profile | None = None
+
+
+def _wrap(profile: Profile, cls: type, name: str, func: Callable, timed: bool) -> Callable:
+    """Оборачивает функцию счетчиком вызовов, замером времени и подсчетом операций."""
+    key = f'{cls.__name__}.{name}'
+    estimate = FLOP_ESTIMATES.get((cls, name))
+    allocates = name in ALLOCATORS
+    if not timed and estimate is None:
+        @wraps(func)
+        def counted(*args, **kwargs):
+            profile.calls[key] += 1
+            if allocates:
+                profile.allocations[cls.__name__] += 1
+            return func(*args, **kwargs)
+        return counted
+
+    # Повторный (рекурсивный) вход в тот же метод учитывается в количестве вызовов,
+    # но не во времени и операциях
+    depth = [0]
+
+    @wraps(func)
+    def timed_call(*args, **kwargs):
+        profile.calls[key] += 1
+        if allocates:
+            profile.allocations[cls.__name__] += 1
+        if depth[0]:
+            return func(*args, **kwargs)
+        if estimate is not None:
+            profile.flops[key] += estimate(*args, **kwargs)
+        depth[0] += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.times[key] += time.perf_counter() - start
+            depth[0] -= 1
+    return timed_call
+
+
+def _patches(profile: Profile, cls: type) -> dict[str, object]:
+    """Формирует подмененные атрибуты класса."""
+    patches = {}
+    for name, attribute in vars(cls).items():
+        timed = not name.startswith('_') or name in OPERATORS
+        if not (timed or name in COUNTED or name in ALLOCATORS):
+            continue
+        if name.startswith('validated_'):
+            timed = False
+        if isinstance(attribute, (classmethod, staticmethod)):
+            wrapped = _wrap(profile, cls, name, attribute.__func__, timed)
+            patches[name] = type(attribute)(wrapped)
+        elif callable(attribute):
+            patches[name] = _wrap(profile, cls, name, attribute, timed)
+    return patches
+
+
+@contextmanager
+def instrument(classes: tuple[type, ...] = (Matrix, Vector, LUDecomposition)) -> Iterator[Profile]:
+    """Включает сбор статистики по методам классов на время работы контекста.
+
+    Методы подменяются обертками только внутри контекста и восстанавливаются при
+    выходе из него, поэтому вне контекста измерения ничего не стоят. Считаются
+    вызовы __getitem__/__setitem__ и методов validated_*, время открытых методов
+    и арифметических операций, оценка количества операций умножения, LU-разложения
+    (только при его вычислении, а не при взятии из кэша) и подстановок, а также
+    количество созданных объектов.
+
+    Пример:
+        with instrument() as profile:
+            matrix.gauss(b)
+        print(profile.report())
+
+    Yields:
+        Profile: Накопитель результатов; остается доступным после выхода из контекста.
+
+    Raises:
+        RuntimeError: Если контекст уже активен.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError('Instrumentation is already enabled.')
+    profile = Profile()
+    saved: list[tuple[type, str, object]] = []
+    _active = profile
+    try:
+        for cls in classes:
+            for name, patched in _patches(profile, cls).items():
+                saved.append((cls, name, vars(cls).get(name)))
+                setattr(cls, name, patched)
+        yield profile
+    finally:
+        for cls, name, original in reversed(saved):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        _active = None
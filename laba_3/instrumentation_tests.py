@@ -0,0 +1,72 @@
+import pickle
+import unittest
+from instrumentation import instrument
+from matrix import Matrix
+from vector import Vector
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = Matrix(3, 3)
+        self.matrix[0] = Vector(3, [2, 1, -1])
+        self.matrix[1] = Vector(3, [-3, -1, 2])
+        self.matrix[2] = Vector(3, [-2, 1, 2])
+        self.free_terms = Vector(3, [8, -11, -3])
+
+    def test_counters(self):
+        """Тестируем подсчет вызовов, операций и созданных объектов."""
+        with instrument() as profile:
+            self.matrix.gauss(self.free_terms)
+            self.matrix * self.matrix
+            self.matrix * self.free_terms
+            self.matrix[0, 1] = 5
+            self.matrix.swap_rows(0, 0)
+            self.free_terms[0]
+        self.assertEqual(profile.calls['Matrix.__mul__'], 2)
+        self.assertEqual(profile.flops['Matrix.__mul__'], 2 * 27 + 2 * 9)
+        self.assertEqual(profile.calls['Matrix.gauss'], 1)
+        self.assertEqual(profile.flops['LUDecomposition.__init__'], 2 * 27 // 3)
+        self.assertEqual(profile.flops['LUDecomposition.solve'], 2 * 9)
+        self.assertEqual(profile.calls['Matrix.__setitem__'], 1)
+        self.assertEqual(profile.calls['Vector.__getitem__'], 1)
+        self.assertGreater(profile.calls['Matrix.validated_index'], 0)
+        self.assertGreater(profile.allocations['Vector'], 0)
+        self.assertGreater(profile.times['Matrix.gauss'], 0)
+        self.assertNotIn('Matrix.__setitem__', profile.times)
+        self.assertIn('Matrix.gauss', profile.report())
+        self.assertEqual(set(profile.as_dict()), {'calls', 'times', 'flops', 'allocations'})
+
+    def test_factorization_flops(self):
+        """Тестируем, что операции разложения учитываются только при его вычислении."""
+        with instrument() as profile:
+            lu = self.matrix.lu()
+            self.assertIs(self.matrix.lu(), lu)
+            lu.solve(self.free_terms)
+            lu.solve_batch([self.free_terms, self.free_terms])
+            self.matrix.copy().gauss(Vector.from_buffer(self.free_terms.buffer), overwrite=True)
+        self.assertEqual(profile.calls['LUDecomposition.__init__'], 1)
+        self.assertEqual(profile.flops['LUDecomposition.__init__'], 2 * 27 // 3)
+        self.assertEqual(profile.flops['LUDecomposition.solve'], 2 * 9)
+        self.assertEqual(profile.flops['LUDecomposition.solve_batch'], 2 * 9 * 2)
+        self.assertEqual(profile.flops['Matrix.gauss'], 2 * 27 // 3 + 2 * 9)
+
+    def test_restore(self):
+        """Тестируем восстановление методов после выхода из контекста."""
+        methods = dict(vars(Matrix)), dict(vars(Vector))
+        with self.assertRaises(KeyError):
+            with instrument():
+                with self.assertRaises(RuntimeError):
+                    with instrument():
+                        pass
+                raise KeyError
+        self.assertEqual((dict(vars(Matrix)), dict(vars(Vector))), methods)
+        with instrument() as profile:
+            pass
+        self.assertEqual(profile.calls['Matrix.gauss'], 0)
+        # Объекты по-прежнему сериализуются и создаются без подсчета
+        self.assertTrue(pickle.loads(pickle.dumps(self.matrix)) == self.matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,375 @@
+from array import array
+from itertools import repeat
+from math import hypot, sqrt
+from operator import add, mul, sub, truediv
+from typing import Union
+from matrix import Matrix
+from sparse_matrix import SparseMatrix
+from vector import Vector
+
+LinearOperator = Union[Matrix, SparseMatrix]
+
+
+class SolverResult:
+    """Результат итерационного решения системы линейных уравнений."""
+
+    def __init__(self, solution: Vector, iterations: int, history: list[float], converged: bool) -> None:
+        """Сохраняет результат решения.
+
+        Args:
+            solution (Vector): Найденное приближение к решению.
+            iterations (int): Количество выполненных итераций.
+            history (list[float]): Относительная евклидова норма невязки ||b - A * x|| / ||b||
+                до первой итерации и после каждой итерации.
+            converged (bool): Достигнута ли заданная точность.
+        """
+        self.solution: Vector = solution
+        self.iterations: int = iterations
+        self.history: list[float] = history
+        self.converged: bool = converged
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление результата."""
+        residual = self.history[-1] if self.history else None
+        return (f'{type(self).__name__}(iterations={self.iterations}, converged={self.converged}, '
+                f'residual={residual!r})')
+
+
+def validated_system(matrix: LinearOperator, col_of_free_mem: Vector | None = None,
+                     initial: Vector | None = None) -> int:
+    """Проверяет, что матрица квадратная, а векторы согласованы с ней по размеру.
+
+    Returns:
+        int: Порядок системы.
+    """
+    if not isinstance(matrix, (Matrix, SparseMatrix)):
+        raise TypeError("'matrix' can be only Matrix or SparseMatrix")
+    rows, cols = matrix.__len__()
+    if rows != cols:
+        raise ValueError('The matrix must be square (n x n) for iterative methods.')
+    for vector in (col_of_free_mem, initial):
+        if vector is None:
+            continue
+        if not isinstance(vector, Vector):
+            raise TypeError('The free terms and the initial guess must be vectors.')
+        if len(vector) != rows:
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+    return rows
+
+
+def matrix_rows(matrix: LinearOperator) -> list[tuple[array, array]]:
+    """Возвращает ненулевые элементы каждой строки в виде пар (номера столбцов, значения)."""
+    if isinstance(matrix, SparseMatrix):
+        indptr, indices, data = matrix.csr
+        return [(indices[indptr[i]:indptr[i + 1]], data[indptr[i]:indptr[i + 1]])
+                for i in range(len(indptr) - 1)]
+    rows = []
+    for i in range(matrix.__len__()[0]):
+        row = matrix.row_buffer(i)
+        cols = array('q', [j for j, value in enumerate(row) if value != 0])
+        rows.append((cols, array('d', map(row.__getitem__, cols))))
+    return rows
+
+
+def norm2(vector) -> float:
+    """Вычисляет евклидову норму буфера."""
+    return sqrt(sum(map(mul, vector, vector)))
+
+
+def dot(first, second) -> float:
+    """Вычисляет скалярное произведение двух буферов."""
+    return sum(map(mul, first, second))
+
+
+def axpy(alpha: float, x, y) -> array:
+    """Возвращает alpha * x + y."""
+    return array('d', map(add, map(mul, x, repeat(alpha)), y))
+
+
+def residual(matrix: LinearOperator, x: array, free_terms: array) -> array:
+    """Вычисляет невязку b - A * x."""
+    product = (matrix * Vector.from_buffer(x, copy=False)).buffer
+    return array('d', map(sub, free_terms, product))
+
+
+class JacobiPreconditioner:
+    """Диагональный предобусловливатель Якоби: M = diag(A)."""
+
+    def __init__(self, matrix: LinearOperator) -> None:
+        """Извлекает диагональ матрицы.
+
+        Raises:
+            ZeroDivisionError: Если на диагонали есть нулевой элемент.
+        """
+        size = validated_system(matrix)
+        diagonal = array('d', (matrix[i, i] for i in range(size)))
+        if 0 in diagonal:
+            raise ZeroDivisionError('The Jacobi preconditioner requires a non-zero diagonal.')
+        self.__diagonal: array = diagonal
+
+    def apply(self, vector) -> array:
+        """Решает систему M * z = r."""
+        return array('d', map(truediv, vector, self.__diagonal))
+
+
+class ILU0Preconditioner:
+    """Неполное LU-разложение без заполнения ILU(0): L и U сохраняют шаблон ненулевых элементов A."""
+
+    def __init__(self, matrix: LinearOperator) -> None:
+        """Вычисляет неполное разложение.
+
+        Raises:
+            ZeroDivisionError: Если в процессе разложения получен нулевой диагональный элемент.
+        """
+        validated_system(matrix)
+        rows = [dict(zip(cols, values)) for cols, values in matrix_rows(matrix)]
+        size = len(rows)
+        for i in range(size):
+            row = rows[i]
+            for k in sorted(col for col in row if col < i):
+                pivot_row = rows[k]
+                pivot = pivot_row.get(k, 0.0)
+                if pivot == 0:
+                    raise ZeroDivisionError(f'Zero pivot in the ILU(0) decomposition in row {k + 1}.')
+                factor = row[k] / pivot
+                row[k] = factor
+                for col, value in pivot_row.items():
+                    if col > k and col in row:
+                        row[col] -= factor * value
+            if row.get(i, 0.0) == 0:
+                raise ZeroDivisionError(f'Zero pivot in the ILU(0) decomposition in row {i + 1}.')
+
+        self.__lower: list[tuple[array, array]] = []
+        self.__upper: list[tuple[array, array]] = []
+        self.__diagonal: array = array('d', (rows[i][i] for i in range(size)))
+        for i, row in enumerate(rows):
+            lower = sorted(col for col in row if col < i)
+            upper = sorted(col for col in row if col > i)
+            self.__lower.append((array('q', lower), array('d', [row[col] for col in lower])))
+            self.__upper.append((array('q', upper), array('d', [row[col] for col in upper])))
+
+    def apply(self, vector) -> array:
+        """Решает систему L * U * z = r прямой и обратной подстановкой."""
+        result = array('d', vector)
+        for i, (cols, values) in enumerate(self.__lower):
+            if cols:
+                result[i] -= sum(map(mul, values, map(result.__getitem__, cols)))
+        for i in range(len(result) - 1, -1, -1):
+            cols, values = self.__upper[i]
+            if cols:
+                result[i] -= sum(map(mul, values, map(result.__getitem__, cols)))
+            result[i] /= self.__diagonal[i]
+        return result
+
+
+Preconditioner = Union[JacobiPreconditioner, ILU0Preconditioner]
+
+
+def jacobi(matrix: LinearOperator, col_of_free_mem: Vector, tolerance: float = 1e-10,
+           max_iterations: int = 1000, initial: Vector | None = None) -> SolverResult:
+    """Решает систему методом Якоби.
+
+    Сходится для матриц со строгим диагональным преобладанием.
+
+    Args:
+        matrix (Matrix | SparseMatrix): Квадратная матрица системы.
+        col_of_free_mem (Vector): Вектор свободных членов.
+        tolerance (float): Требуемая относительная норма невязки.
+        max_iterations (int): Максимальное количество итераций.
+        initial (Vector | None): Начальное приближение; по умолчанию нулевой вектор.
+
+    Returns:
+        SolverResult: Решение и история сходимости.
+
+    Raises:
+        ZeroDivisionError: Если на диагонали матрицы есть нулевой элемент.
+    """
+    size = validated_system(matrix, col_of_free_mem, initial)
+    rows = matrix_rows(matrix)
+    diagonal = array('d', (matrix[i, i] for i in range(size)))
+    if 0 in diagonal:
+        raise ZeroDivisionError('The Jacobi method requires a non-zero diagonal.')
+    free_terms = col_of_free_mem.buffer
+    x = array('d', initial) if initial is not None else array('d', bytes(8 * size))
+    scale = norm2(free_terms) or 1.0
+    history = [norm2(residual(matrix, x, free_terms)) / scale]
+
+    iterations = 0
+    while history[-1] > tolerance and iterations < max_iterations:
+        x = array('d', ((free_terms[i] - dot(values, map(x.__getitem__, cols)) + diagonal[i] * x[i]) / diagonal[i]
+                        for i, (cols, values) in enumerate(rows)))
+        iterations += 1
+        history.append(norm2(residual(matrix, x, free_terms)) / scale)
+    return SolverResult(Vector.from_buffer(x, copy=False), iterations, history, history[-1] <= tolerance)
+
+
+def gauss_seidel(matrix: LinearOperator, col_of_free_mem: Vector, tolerance: float = 1e-10,
+                 max_iterations: int = 1000, initial: Vector | None = None, omega: float = 1.0) -> SolverResult:
+    """Решает систему методом Гаусса-Зейделя или последовательной верхней релаксации (SOR).
+
+    Args:
+        matrix (Matrix | SparseMatrix): Квадратная матрица системы.
+        col_of_free_mem (Vector): Вектор свободных членов.
+        tolerance (float): Требуемая относительная норма невязки.
+        max_iterations (int): Максимальное количество итераций.
+        initial (Vector | None): Начальное приближение; по умолчанию нулевой вектор.
+        omega (float): Параметр релаксации из интервала (0, 2); 1 соответствует методу Гаусса-Зейделя.
+
+    Returns:
+        SolverResult: Решение и история сходимости.
+
+    Raises:
+        ValueError: Если параметр релаксации вне интервала (0, 2).
+        ZeroDivisionError: Если на диагонали матрицы есть нулевой элемент.
+    """
+    size = validated_system(matrix, col_of_free_mem, initial)
+    if not 0 < omega < 2:
+        raise ValueError('The relaxation parameter must be in the interval (0, 2).')
+    rows = matrix_rows(matrix)
+    diagonal = array('d', (matrix[i, i] for i in range(size)))
+    if 0 in diagonal:
+        raise ZeroDivisionError('The Gauss-Seidel method requires a non-zero diagonal.')
+    free_terms = col_of_free_mem.buffer
+    x = array('d', initial) if initial is not None else array('d', bytes(8 * size))
+    scale = norm2(free_terms) or 1.0
+    history = [norm2(residual(matrix, x, free_terms)) / scale]
+
+    iterations = 0
+    while history[-1] > tolerance and iterations < max_iterations:
+        for i, (cols, values) in enumerate(rows):
+            off_diagonal = dot(values, map(x.__getitem__, cols)) - diagonal[i] * x[i]
+            x[i] = (1 - omega) * x[i] + omega * (free_terms[i] - off_diagonal) / diagonal[i]
+        iterations += 1
+        history.append(norm2(residual(matrix, x, free_terms)) / scale)
+    return SolverResult(Vector.from_buffer(x, copy=False), iterations, history, history[-1] <= tolerance)
+
+
+def conjugate_gradient(matrix: LinearOperator, col_of_free_mem: Vector, tolerance: float = 1e-10,
+                       max_iterations: int | None = None, initial: Vector | None = None,
+                       preconditioner: Preconditioner | None = None) -> SolverResult:
+    """Решает систему с симметричной положительно определенной матрицей методом сопряженных градиентов.
+
+    Args:
+        matrix (Matrix | SparseMatrix): Симметричная положительно определенная матрица.
+        col_of_free_mem (Vector): Вектор свободных членов.
+        tolerance (float): Требуемая относительная норма невязки.
+        max_iterations (int | None): Максимальное количество итераций; по умолчанию порядок системы.
+        initial (Vector | None): Начальное приближение; по умолчанию нулевой вектор.
+        preconditioner (JacobiPreconditioner | ILU0Preconditioner | None): Предобусловливатель.
+
+    Returns:
+        SolverResult: Решение и история сходимости.
+    """
+    size = validated_system(matrix, col_of_free_mem, initial)
+    if max_iterations is None:
+        max_iterations = size
+    free_terms = col_of_free_mem.buffer
+    x = array('d', initial) if initial is not None else array('d', bytes(8 * size))
+    scale = norm2(free_terms) or 1.0
+    r = residual(matrix, x, free_terms)
+    history = [norm2(r) / scale]
+
+    z = preconditioner.apply(r) if preconditioner is not None else r
+    p = array('d', z)
+    rz = dot(r, z)
+    iterations = 0
+    while history[-1] > tolerance and iterations < max_iterations:
+        q = (matrix * Vector.from_buffer(p, copy=False)).buffer
+        pq = dot(p, q)
+        if pq == 0:
+            break
+        alpha = rz / pq
+        x = axpy(alpha, p, x)
+        r = axpy(-alpha, q, r)
+        iterations += 1
+        history.append(norm2(r) / scale)
+        z = preconditioner.apply(r) if preconditioner is not None else r
+        rz_next = dot(r, z)
+        p = axpy(rz_next / rz, p, z)
+        rz = rz_next
+    return SolverResult(Vector.from_buffer(x, copy=False), iterations, history, history[-1] <= tolerance)
+
+
+def gmres(matrix: LinearOperator, col_of_free_mem: Vector, tolerance: float = 1e-10,
+          max_iterations: int = 1000, initial: Vector | None = None, restart: int = 30,
+          preconditioner: Preconditioner | None = None) -> SolverResult:
+    """Решает систему методом обобщенных минимальных невязок с перезапуском GMRES(m).
+
+    Используется правое предобусловливание, поэтому в истории хранится истинная невязка.
+
+    Args:
+        matrix (Matrix | SparseMatrix): Квадратная матрица системы.
+        col_of_free_mem (Vector): Вектор свободных членов.
+        tolerance (float): Требуемая относительная норма невязки.
+        max_iterations (int): Максимальное общее количество итераций.
+        initial (Vector | None): Начальное приближение; по умолчанию нулевой вектор.
+        restart (int): Размерность подпространства Крылова m до перезапуска.
+        preconditioner (JacobiPreconditioner | ILU0Preconditioner | None): Предобусловливатель.
+
+    Returns:
+        SolverResult: Решение и история сходимости.
+
+    Raises:
+        ValueError: Если размерность перезапуска не положительна.
+    """
+    size = validated_system(matrix, col_of_free_mem, initial)
+    if not isinstance(restart, int) or restart <= 0:
+        raise ValueError('The restart parameter must be a positive integer.')
+    free_terms = col_of_free_mem.buffer
+    x = array('d', initial) if initial is not None else array('d', bytes(8 * size))
+    scale = norm2(free_terms) or 1.0
+    r = residual(matrix, x, free_terms)
+    history = [norm2(r) / scale]
+
+    iterations = 0
+    while history[-1] > tolerance and iterations < max_iterations:
+        beta = norm2(r)
+        basis = [array('d', map(truediv, r, repeat(beta)))]
+        directions = []
+        hessenberg: list[list[float]] = []
+        cosines: list[float] = []
+        sines: list[float] = []
+        g = [beta]
+
+        for j in range(restart):
+            z = preconditioner.apply(basis[j]) if preconditioner is not None else basis[j]
+            directions.append(z)
+            w = (matrix * Vector.from_buffer(z, copy=False)).buffer
+            column = []
+            # Ортогонализация Грама-Шмидта (модифицированная)
+            for v in basis:
+                h = dot(w, v)
+                column.append(h)
+                w = axpy(-h, v, w)
+            h_next = norm2(w)
+
+            # Применяем накопленные вращения Гивенса к новому столбцу
+            for k in range(j):
+                column[k], column[k + 1] = (cosines[k] * column[k] + sines[k] * column[k + 1],
+                                            -sines[k] * column[k] + cosines[k] * column[k + 1])
+            radius = hypot(column[j], h_next)
+            cosine, sine = (column[j] / radius, h_next / radius) if radius != 0 else (1.0, 0.0)
+            cosines.append(cosine)
+            sines.append(sine)
+            column[j] = radius
+            g.append(-sine * g[j])
+            g[j] = cosine * g[j]
+            hessenberg.append(column)
+
+            iterations += 1
+            history.append(abs(g[j + 1]) / scale)
+            if h_next == 0 or history[-1] <= tolerance or iterations >= max_iterations:
+                break
+            basis.append(array('d', map(truediv, w, repeat(h_next))))
+
+        # Решаем верхнюю треугольную систему H * y = g и обновляем приближение
+        count = len(hessenberg)
+        y = [0.0] * count
+        for i in range(count - 1, -1, -1):
+            y[i] = (g[i] - sum(hessenberg[k][i] * y[k] for k in range(i + 1, count))) / hessenberg[i][i]
+        for coefficient, direction in zip(y, directions):
+            x = axpy(coefficient, direction, x)
+        r = residual(matrix, x, free_terms)
+        history[-1] = norm2(r) / scale
+    return SolverResult(Vector.from_buffer(x, copy=False), iterations, history, history[-1] <= tolerance)
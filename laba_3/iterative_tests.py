@@ -0,0 +1,85 @@
+import unittest
+from matrix import Matrix
+from vector import Vector
+from sparse_matrix import SparseMatrix
+import iterative
+
+
+class TestIterativeSolvers(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем симметричную матрицу с диагональным преобладанием и известное решение."""
+        self.size = 8
+        self.sparse = SparseMatrix(self.size, self.size)
+        for i in range(self.size):
+            self.sparse.add(i, i, 4)
+            if i > 0:
+                self.sparse.add(i, i - 1, -1)
+            if i < self.size - 1:
+                self.sparse.add(i, i + 1, -1)
+        self.dense = self.sparse.to_matrix()
+        self.solution = Vector.from_iterable(range(1, self.size + 1))
+        self.free_terms = self.dense * self.solution
+
+    def assertSolved(self, result: iterative.SolverResult, places: int = 7):
+        self.assertTrue(result.converged)
+        self.assertEqual(len(result.history), result.iterations + 1)
+        for a, b in zip(result.solution, self.solution):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_jacobi(self):
+        """Тестируем метод Якоби для плотной и разреженной матриц."""
+        self.assertSolved(iterative.jacobi(self.dense, self.free_terms))
+        self.assertSolved(iterative.jacobi(self.sparse, self.free_terms))
+
+    def test_gauss_seidel_and_sor(self):
+        """Тестируем методы Гаусса-Зейделя и SOR."""
+        seidel = iterative.gauss_seidel(self.sparse, self.free_terms)
+        self.assertSolved(seidel)
+        self.assertLess(seidel.iterations, iterative.jacobi(self.sparse, self.free_terms).iterations)
+        self.assertSolved(iterative.gauss_seidel(self.dense, self.free_terms, omega=1.1))
+        with self.assertRaises(ValueError):
+            iterative.gauss_seidel(self.dense, self.free_terms, omega=2)
+
+    def test_conjugate_gradient(self):
+        """Тестируем метод сопряженных градиентов с предобусловливанием и без."""
+        self.assertSolved(iterative.conjugate_gradient(self.dense, self.free_terms))
+        for preconditioner in (iterative.JacobiPreconditioner(self.sparse),
+                               iterative.ILU0Preconditioner(self.sparse)):
+            self.assertSolved(iterative.conjugate_gradient(self.sparse, self.free_terms,
+                                                           preconditioner=preconditioner))
+
+    def test_gmres(self):
+        """Тестируем GMRES(m) на несимметричной системе."""
+        matrix = Matrix.from_buffer(3, 3, [4, 1, 0, 2, 5, 1, 0, 3, 6])
+        free_terms = matrix * Vector(3, [1, -2, 3])
+        for restart in (1, 2, 30):
+            result = iterative.gmres(matrix, free_terms, restart=restart)
+            self.assertTrue(result.converged)
+            for a, b in zip(result.solution, [1, -2, 3]):
+                self.assertAlmostEqual(a, b)
+        self.assertSolved(iterative.gmres(self.sparse, self.free_terms, restart=4,
+                                          preconditioner=iterative.ILU0Preconditioner(self.sparse)))
+
+    def test_ilu0_is_exact_for_tridiagonal(self):
+        """Тестируем, что ILU(0) трехдиагональной матрицы совпадает с полным LU."""
+        preconditioner = iterative.ILU0Preconditioner(self.dense)
+        result = preconditioner.apply(self.free_terms.buffer)
+        for a, b in zip(result, self.solution):
+            self.assertAlmostEqual(a, b)
+
+    def test_limits_and_validation(self):
+        """Тестируем ограничение числа итераций и проверки аргументов."""
+        result = iterative.jacobi(self.dense, self.free_terms, max_iterations=2)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 2)
+        with self.assertRaises(ValueError):
+            iterative.conjugate_gradient(Matrix(2, 3), Vector(2))
+        with self.assertRaises(ValueError):
+            iterative.jacobi(self.dense, Vector(3))
+        with self.assertRaises(ZeroDivisionError):
+            iterative.jacobi(Matrix(2, 2), Vector(2, [1, 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
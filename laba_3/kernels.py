@@ -0,0 +1,223 @@
+import os
+from array import array
+from functools import lru_cache
+from operator import add, mul, sub
+from typing import Sequence
+
+# Размер кэша, если его не удалось определить (байт)
+DEFAULT_CACHE_SIZE: int = 256 * 1024
+CACHE_INFO_PATH: str = '/sys/devices/system/cpu/cpu0/cache'
+
+
+@lru_cache(maxsize=None)
+def cache_size() -> int:
+    """Определяет размер кэша второго уровня процессора в байтах.
+
+    Returns:
+        int: Размер кэша L2 по данным sysfs или DEFAULT_CACHE_SIZE, если он недоступен.
+    """
+    try:
+        for entry in sorted(os.listdir(CACHE_INFO_PATH)):
+            path = os.path.join(CACHE_INFO_PATH, entry)
+            if not entry.startswith('index'):
+                continue
+            with open(os.path.join(path, 'level')) as f:
+                level = int(f.read())
+            with open(os.path.join(path, 'type')) as f:
+                kind = f.read().strip()
+            if level != 2 or kind == 'Instruction':
+                continue
+            with open(os.path.join(path, 'size')) as f:
+                size = f.read().strip().upper()
+            multiplier = {'K': 1024, 'M': 1024 ** 2}.get(size[-1:], 1)
+            return int(size.rstrip('KM')) * multiplier
+    except (OSError, ValueError):
+        pass
+    return DEFAULT_CACHE_SIZE
+
+
+def block_size(inner: int) -> int:
+    """Подбирает размер блока так, чтобы блок строк левого и блок столбцов правого операнда помещались в кэш.
+
+    Args:
+        inner (int): Длина скалярных произведений (общая размерность операндов).
+
+    Returns:
+        int: Количество строк (столбцов) в блоке, не меньше 1.
+    """
+    return max(1, cache_size() // (2 * 8 * max(1, inner)))
+
+
+def transpose(rows: Sequence[Sequence[float]], cols: int) -> array:
+    """Возвращает транспонированную копию набора строк в виде плоского буфера.
+
+    Args:
+        rows (Sequence): Строки исходной матрицы одинаковой длины cols.
+        cols (int): Количество столбцов исходной матрицы.
+
+    Returns:
+        array: Буфер размера cols * len(rows), упорядоченный по строкам транспонированной матрицы.
+    """
+    result = array('d', [0.0]) * (cols * len(rows))
+    view = memoryview(result)
+    count = len(rows)
+    for i, row in enumerate(rows):
+        view[i::count] = array('d', row)
+    return result
+
+
+def matmul(left_rows: Sequence[Sequence[float]], right_columns: Sequence[Sequence[float]],
+           block: int | None = None, out: array | None = None) -> array:
+    """Блочное умножение матриц.
+
+    Правый операнд передается по столбцам (строками транспонированной матрицы), поэтому
+    каждый элемент результата - скалярное произведение двух непрерывных буферов.
+    Блоки строк и столбцов подбираются по размеру кэша, результат накапливается
+    в заранее выделенном буфере.
+
+    Args:
+        left_rows (Sequence): Строки левой матрицы.
+        right_columns (Sequence): Столбцы правой матрицы.
+        block (int | None): Размер блока; по умолчанию подбирается по размеру кэша.
+        out (array | None): Буфер, к которому прибавляется произведение (out += A * B);
+            None - новый нулевой буфер.
+
+    Returns:
+        array: Плоский буфер результата размера len(left_rows) * len(right_columns) (out, если он задан).
+    """
+    rows = len(left_rows)
+    cols = len(right_columns)
+    inner = len(left_rows[0]) if rows else 0
+    if block is None:
+        block = block_size(inner)
+    if out is not None and len(out) != rows * cols:
+        raise ValueError('The output buffer size must be equal to the size of the product.')
+    result = array('d', [0.0]) * (rows * cols) if out is None else out
+    for i_start in range(0, rows, block):
+        i_stop = min(i_start + block, rows)
+        for j_start in range(0, cols, block):
+            tile = right_columns[j_start:j_start + block]
+            for i in range(i_start, i_stop):
+                row = left_rows[i]
+                start = i * cols + j_start
+                products = [sum(map(mul, row, column)) for column in tile]
+                if out is not None:
+                    products = map(add, result[start:start + len(tile)], products)
+                result[start:start + len(tile)] = array('d', products)
+    return result
+
+
+# Порядок, начиная с которого Matrix.matmul перемножает квадратные матрицы алгоритмом
+# Штрассена-Винограда; None - только классическое блочное умножение. Алгоритм меняет порядок
+# округлений, поэтому по умолчанию выключен; выигрыш начинается примерно со 128
+STRASSEN_CROSSOVER: int | None = None
+
+
+def _rows(a: array, n: int) -> list[memoryview]:
+    """Разбивает плоский буфер квадратной матрицы на представления строк."""
+    view = memoryview(a)
+    return [view[i * n:(i + 1) * n] for i in range(n)]
+
+
+def _classical(a: array, b: array, n: int) -> array:
+    """Перемножает квадратные матрицы, заданные плоскими буферами, блочным алгоритмом."""
+    return matmul(_rows(a, n), _rows(transpose(_rows(b, n), n), n))
+
+
+def _quadrants(a: array, n: int) -> tuple[array, array, array, array]:
+    """Делит матрицу четного порядка n на четыре блока порядка n / 2."""
+    h = n // 2
+    view = memoryview(a)
+    blocks = (array('d'), array('d'), array('d'), array('d'))
+    for i in range(n):
+        top = i < h
+        blocks[0 if top else 2].extend(view[i * n:i * n + h])
+        blocks[1 if top else 3].extend(view[i * n + h:(i + 1) * n])
+    return blocks
+
+
+def _join(c11: array, c12: array, c21: array, c22: array, h: int) -> array:
+    """Собирает матрицу порядка 2h из четырех блоков."""
+    result = array('d')
+    for top, bottom in ((c11, c12), (c21, c22)):
+        left, right = memoryview(top), memoryview(bottom)
+        for i in range(h):
+            result.extend(left[i * h:(i + 1) * h])
+            result.extend(right[i * h:(i + 1) * h])
+    return result
+
+
+def _pad(a: array, n: int) -> array:
+    """Дополняет матрицу порядка n нулевыми строкой и столбцом."""
+    result = array('d')
+    zero = array('d', [0.0])
+    for row in _rows(a, n):
+        result.extend(row)
+        result.extend(zero)
+    result.extend(bytes(8 * (n + 1)))
+    return result
+
+
+def _unpad(a: array, n: int) -> array:
+    """Отбрасывает последние строку и столбец матрицы порядка n + 1."""
+    result = array('d')
+    for row in _rows(a, n + 1)[:n]:
+        result.extend(row[:n])
+    return result
+
+
+def _add(x: array, y: array) -> array:
+    return array('d', map(add, x, y))
+
+
+def _sub(x: array, y: array) -> array:
+    return array('d', map(sub, x, y))
+
+
+def strassen(a: array, b: array, n: int, crossover: int = 64) -> array:
+    """Умножает квадратные матрицы алгоритмом Штрассена-Винограда (7 умножений и 15 сложений блоков).
+
+    Рекурсия продолжается, пока порядок больше crossover; меньшие блоки перемножаются
+    классическим блочным алгоритмом. Матрица нечетного порядка на каждом уровне
+    дополняется нулевыми строкой и столбцом, поэтому порядок не обязан быть степенью двойки.
+
+    Args:
+        a (array): Левая матрица порядка n по строкам.
+        b (array): Правая матрица порядка n по строкам.
+        n (int): Порядок матриц.
+        crossover (int): Порядок, до которого используется классическое умножение.
+
+    Returns:
+        array: Произведение по строкам.
+    """
+    if crossover < 1:
+        raise ValueError('The crossover size must be a positive integer.')
+    if n <= crossover:
+        return _classical(a, b, n)
+    if n % 2:
+        return _unpad(strassen(_pad(a, n), _pad(b, n), n + 1, crossover), n)
+
+    h = n // 2
+    a11, a12, a21, a22 = _quadrants(a, n)
+    b11, b12, b21, b22 = _quadrants(b, n)
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    m1 = strassen(a11, b11, h, crossover)
+    m2 = strassen(a12, b21, h, crossover)
+    m3 = strassen(s4, b22, h, crossover)
+    m4 = strassen(a22, t4, h, crossover)
+    m5 = strassen(s1, t1, h, crossover)
+    m6 = strassen(s2, t2, h, crossover)
+    m7 = strassen(s3, t3, h, crossover)
+
+    u2 = _add(m1, m6)
+    u3 = _add(u2, m7)
+    u4 = _add(u2, m5)
+    return _join(_add(m1, m2), _add(u4, m3), _sub(u3, m4), _add(u3, m5), h)
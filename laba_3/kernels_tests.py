@@ -0,0 +1,46 @@
+import unittest
+from array import array
+import kernels
+
+
+class TestKernels(unittest.TestCase):
+
+    def test_cache_size(self):
+        """Тестируем определение размера кэша и блока."""
+        self.assertGreater(kernels.cache_size(), 0)
+        self.assertGreaterEqual(kernels.block_size(10 ** 9), 1)
+        self.assertGreaterEqual(kernels.block_size(4), kernels.block_size(4096))
+
+    def test_transpose(self):
+        """Тестируем транспонирование набора строк."""
+        rows = [array('d', [1, 2, 3]), array('d', [4, 5, 6])]
+        self.assertEqual(kernels.transpose(rows, 3).tolist(), [1, 4, 2, 5, 3, 6])
+
+    def test_matmul_blocks(self):
+        """Тестируем независимость результата от размера блока."""
+        left = [array('d', [i + j for j in range(5)]) for i in range(7)]
+        right = [array('d', [i * j - 3 for j in range(5)]) for i in range(6)]
+        expected = [sum(a * b for a, b in zip(row, column)) for row in left for column in right]
+        for block in (1, 2, 3, 100, None):
+            self.assertEqual(kernels.matmul(left, right, block).tolist(), expected)
+        # Накопление в заданном буфере
+        out = array('d', [1.0]) * len(expected)
+        self.assertIs(kernels.matmul(left, right, 2, out=out), out)
+        self.assertEqual(out.tolist(), [value + 1 for value in expected])
+        with self.assertRaises(ValueError):
+            kernels.matmul(left, right, out=array('d', [0.0]))
+
+    def test_strassen(self):
+        """Тестируем алгоритм Штрассена-Винограда на четных и нечетных порядках."""
+        for n in (1, 4, 7, 10, 13):
+            a = array('d', [(i * 7 + 3) % 11 - 5 for i in range(n * n)])
+            b = array('d', [(i * 5 + 1) % 13 - 6 for i in range(n * n)])
+            expected = kernels.strassen(a, b, n, n)
+            for crossover in (1, 2, 3):
+                self.assertEqual(kernels.strassen(a, b, n, crossover).tolist(), expected.tolist())
+        with self.assertRaises(ValueError):
+            kernels.strassen(a, b, n, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,48 +1,34 @@
-from matrix import Matrix
-from vector import Vector
 from prettytable import PrettyTable
+from experiment import MODES, aggregate, export_csv, export_json, run_experiment
 
-
-def computational_experiment(matrix: Matrix, exact_solution: Vector) -> float:
-    size = matrix.__len__()[0]
-    b_vector = Vector(size)
-
-    # Вычисляем вектор правой части b
-    for i in range(size):
-        b_vector[i] = sum(matrix[i][j] * exact_solution[j] for j in range(size))
-
-    # Решаем полученную систему
-    found_solution = matrix.gauss(b_vector)
-
-    # Вычисляем погрешность
-    error_vector = exact_solution - found_solution
-    error_norm = error_vector.norma()
-
-    return error_norm
+# Количество запусков для каждого размера и базовое зерно генератора
+TRIALS = 3
+SEED = 2024
 
 
 def main():
-    sizes = [2 ** i for i in range(1, 9)]  # Размеры матриц от 2^1 до 2^7 (2, 4, 8, ..., 256)
+    sizes = [2 ** i for i in range(1, 9)]  # Размеры матриц от 2^1 до 2^8 (2, 4, 8, ..., 256)
+
+    # Запускаем эксперименты параллельно: по TRIALS случайных систем каждого размера,
+    # каждая решается в двойной точности и LU в одинарной с итерационным уточнением
+    results = run_experiment(sizes, trials=TRIALS, seed=SEED, modes=MODES)
+    summary = aggregate(results)
 
     # Создаем объект таблицы
     table = PrettyTable()
-    table.field_names = ["Размер системы", "Погрешность"]
-
-    for size in sizes:
-        # Генерация случайной обусловленной матрицы
-        matrix = Matrix.random_matrix(size, size, 1, 10)
-
-        # Простой способ получить известное решение
-        exact_solution = Vector.random_vector(size, 1, 10)
-
-        # Проведение вычислительного эксперимента
-        error = computational_experiment(matrix, exact_solution)
+    table.field_names = ["Размер системы", "Режим", "Погрешность", "Ст. откл. погрешности",
+                         "Время, с", "Память, КБ"]
 
+    for row in summary:
         # Добавляем результат в таблицу
-        table.add_row([size, f"{error}"])
+        table.add_row([row['size'], row['mode'], f"{row['error_mean']}", f"{row['error_stdev']:.3g}",
+                       f"{row['time_mean']:.4f} ± {row['time_stdev']:.4f}", f"{row['peak_memory_mean'] / 1024:.1f}"])
 
-    # Вывод таблицы
+    # Вывод таблицы и сохранение результатов
     print(table)
+    export_csv(results, 'experiment_results.csv')
+    export_json(results, 'experiment_results.json')
 
 
-main()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
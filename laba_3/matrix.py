@@ -1,9 +1,98 @@
-from vector import Vector
-from typing import Union
+from array import array
+from collections import OrderedDict
+from itertools import chain, repeat
+from math import gcd, sqrt
+from operator import add, mul, neg, sub, truediv
+import random
+import binary_format
+import kernels
+import text_format
+from vector import Vector, WRITE_BLOCK
+from typing import Callable, Iterator, Union
+
+# Наибольшее количество производных величин (разложений, норм, сумм), хранимых в кэше матрицы
+CACHE_SIZE: int = 8
+
+
+def _ranges_overlap(first: range, second: range) -> bool:
+    """Проверяет, есть ли у двух арифметических прогрессий с положительными шагами общий элемент.
+
+    Общие элементы образуют прогрессию с шагом НОК шагов (китайская теорема об остатках),
+    поэтому проверка стоит O(log(step)), а не O(длины).
+    """
+    low = max(first.start, second.start)
+    high = min(first[-1], second[-1])
+    if low > high:
+        return False
+    step = gcd(first.step, second.step)
+    difference = second.start - first.start
+    if difference % step:
+        return False
+    modulus = second.step // step
+    # first.start + first.step * k = second.start (mod second.step)
+    k = difference // step * pow(first.step // step, -1, modulus) % modulus if modulus > 1 else 0
+    period = first.step * modulus
+    common = first.start + first.step * k
+    return low + (common - low) % period <= high
+
+
+class _RowViews:
+    """Строки-векторы, выданные по m[i] матрицей и ее представлениями с общим буфером.
+
+    Векторы хранятся по раскладке строк (смещение, шаг строк, шаг столбцов, длина строки)
+    и номеру строки: повторный m[i] возвращает тот же вектор, а векторы, которые нужно
+    отделить при присваивании строки, находятся без перебора ячеек. Строки одной раскладки
+    не пересекаются, поэтому для нее проверяется только строка с тем же номером.
+    """
+
+    __slots__ = ('__layouts',)
+
+    def __init__(self) -> None:
+        self.__layouts: dict[tuple[int, int, int, int], dict[int, Vector]] = {}
+
+    def rows(self, layout: tuple[int, int, int, int]) -> dict[int, Vector]:
+        """Возвращает векторы строк раскладки по их номерам (общие для представлений с этой раскладкой)."""
+        return self.__layouts.setdefault(layout, {})
+
+    def detach(self, layout: tuple[int, int, int, int], index: int) -> None:
+        """Отделяет от буфера векторы, разделяющие ячейки со строкой index раскладки layout."""
+        rows = self.__layouts.get(layout)
+        if rows:
+            row = rows.pop(index, None)
+            if row is not None:
+                row.detach()
+        if len(self.__layouts) < 2:
+            return
+        # Строки других представлений (транспонированного, подматриц) проверяются арифметически
+        offset, row_stride, col_stride, cols = layout
+        start = offset + index * row_stride
+        cells = range(start, start + cols * col_stride, col_stride)
+        for other, rows in self.__layouts.items():
+            if other == layout or not rows:
+                continue
+            offset, row_stride, col_stride, cols = other
+            for i in [i for i in rows if _ranges_overlap(cells, range(
+                    offset + i * row_stride, offset + i * row_stride + cols * col_stride, col_stride))]:
+                rows.pop(i).detach()
 
 
 class Matrix:
-    """Класс, представляющий математическую матрицу."""
+    """Класс, представляющий математическую матрицу.
+
+    Элементы хранятся в одном непрерывном буфере чисел двойной точности. Элемент (i, j)
+    расположен по смещению ``offset + i * row_stride + j * col_stride``, а строки
+    матрицы возвращаются как векторы-представления этого буфера без копирования.
+
+    Повторное обращение ``m[i]`` возвращает тот же вектор. Присваивание строки ``m[i] = v``
+    копирует элементы v в буфер, а вектор, полученный ранее по ``m[i]``, перед этим получает
+    собственную копию прежних элементов, как если бы строка была заменена новым объектом;
+    поэтому обмен ``m[i], m[j] = m[j], m[i]`` работает.
+
+    Все представления одного буфера разделяют счетчик изменений, который увеличивается
+    при каждой записи через методы матрицы и ее строк. Производные величины (LU-разложение,
+    определитель, нормы, сумма элементов) кэшируются и используются повторно, пока
+    счетчик не изменится.
+    """
 
     def __init__(self, rows: int, cols: int) -> None:
         """Инициализирует матрицу заданного размера, заполняя ее векторами.
@@ -19,7 +108,286 @@ class Matrix:
         self.validated_cols(cols)
         self.__rows: int = rows
         self.__cols: int = cols
-        self.__matrix: list[Vector] = [Vector(cols) for _ in range(rows)]
+        self.__data: memoryview = memoryview(array('d', bytes(8 * rows * cols)))
+        self.__readonly: memoryview = self.__data.toreadonly()
+        self.__offset: int = 0
+        self.__row_stride: int = cols
+        self.__col_stride: int = 1
+        self.__version: list[int] = [0]
+        self.__row_views: _RowViews = _RowViews()
+        self.__row_cache: dict[int, Vector] = self.__row_views.rows(self.__layout())
+        self.__cache: OrderedDict = OrderedDict()
+        self.__cache_version: int = 0
+
+    @classmethod
+    def from_buffer(cls, rows: int, cols: int, buffer: array | memoryview, copy: bool = True) -> 'Matrix':
+        """Создает матрицу поверх плоского буфера чисел типа 'd', упорядоченного по строкам.
+
+        Args:
+            rows (int): Количество строк.
+            cols (int): Количество столбцов.
+            buffer (array | memoryview): Буфер ``array('d')`` или ``memoryview`` формата 'd'.
+            copy (bool): Если False, матрица разделяет память с буфером; после записи
+                в этот буфер помимо методов матрицы нужно вызвать mark_modified().
+
+        Returns:
+            Matrix: Новая матрица.
+
+        Raises:
+            ValueError: Если размер буфера не равен rows * cols.
+        """
+        cls.validated_rows(rows)
+        cls.validated_cols(cols)
+        if copy or not isinstance(buffer, (array, memoryview)):
+            buffer = array('d', buffer)
+        data = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        if data.format != 'd':
+            raise TypeError('The buffer must contain doubles (format "d").')
+        if len(data) != rows * cols:
+            raise ValueError('The buffer size must be equal to rows * cols.')
+        matrix = cls.__new__(cls)
+        matrix.__rows = rows
+        matrix.__cols = cols
+        matrix.__data = data
+        matrix.__readonly = data.toreadonly()
+        matrix.__offset = 0
+        matrix.__row_stride = cols
+        matrix.__col_stride = 1
+        matrix.__version = [0]
+        matrix.__row_views = _RowViews()
+        matrix.__row_cache = matrix.__row_views.rows(matrix.__layout())
+        matrix.__cache = OrderedDict()
+        matrix.__cache_version = 0
+        return matrix
+
+    @classmethod
+    def from_columns(cls, columns: list[Vector] | tuple) -> 'Matrix':
+        """Создает матрицу, столбцами которой являются заданные векторы.
+
+        Args:
+            columns (list[Vector] | tuple): Векторы одинаковой длины.
+
+        Returns:
+            Matrix: Матрица размера len(columns[0]) x len(columns).
+
+        Raises:
+            TypeError: Если элементы не являются векторами или список пуст.
+            ValueError: Если векторы имеют разную длину.
+        """
+        if not isinstance(columns, (list, tuple)) or not columns:
+            raise TypeError('Columns must be a non-empty list or tuple of vectors.')
+        if not all(isinstance(column, Vector) for column in columns):
+            raise TypeError('Every column must be a Vector.')
+        rows = len(columns[0])
+        if any(len(column) != rows for column in columns):
+            raise ValueError('All columns must be of the same length.')
+        buffer = kernels.transpose([column.buffer for column in columns], rows)
+        return cls.from_buffer(rows, len(columns), buffer, copy=False)
+
+    @classmethod
+    def identity(cls, size: int) -> 'Matrix':
+        """Создает единичную матрицу заданного порядка."""
+        matrix = cls(size, size)
+        matrix.__data[::size + 1] = array('d', [1.0]) * size
+        return matrix
+
+    def __view(self, rows: int, cols: int, offset: int, row_stride: int, col_stride: int) -> 'Matrix':
+        """Создает матрицу-представление общего буфера с заданными смещением и шагами."""
+        view = Matrix.__new__(type(self))
+        view.__rows = rows
+        view.__cols = cols
+        view.__data = self.__data
+        view.__readonly = self.__readonly
+        view.__offset = offset
+        view.__row_stride = row_stride
+        view.__col_stride = col_stride
+        view.__version = self.__version
+        view.__row_views = self.__row_views
+        # Строки представления регистрируются при первом обращении к ним
+        view.__row_cache = None
+        view.__cache = OrderedDict()
+        view.__cache_version = self.__version[0]
+        return view
+
+    @property
+    def version(self) -> int:
+        """Возвращает счетчик изменений буфера матрицы."""
+        return self.__version[0]
+
+    def mark_modified(self) -> None:
+        """Отмечает изменение матрицы, сбрасывая кэш производных величин.
+
+        Вызывается методами матрицы и доступом к буферу для записи (writable_buffer,
+        row_buffer и column_buffer с writable=True) автоматически; вручную - только после
+        записи в буфер, переданный в from_buffer(copy=False).
+        """
+        self.__version[0] += 1
+
+    def __cached(self, key, compute: Callable[[], object]):
+        """Возвращает величину из кэша или вычисляет и сохраняет ее.
+
+        Кэш очищается, если матрица изменилась с момента его заполнения; при переполнении
+        вытесняется величина, к которой дольше всего не обращались.
+        """
+        cache = self.__cache
+        if self.__cache_version != self.__version[0]:
+            cache.clear()
+            self.__cache_version = self.__version[0]
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = compute()
+        cache[key] = value
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+    @property
+    def T(self) -> 'Matrix':
+        """Возвращает транспонированную матрицу-представление без копирования элементов.
+
+        Запись в представление изменяет исходную матрицу.
+        """
+        return self.__view(self.__cols, self.__rows, self.__offset, self.__col_stride, self.__row_stride)
+
+    def copy(self) -> 'Matrix':
+        """Возвращает копию матрицы с собственным непрерывным буфером."""
+        return Matrix.from_buffer(self.__rows, self.__cols, array('d', self.elements()), copy=False)
+
+    @staticmethod
+    def validated_slice(index: Union[int, slice], size: int) -> tuple[int, int, int]:
+        """Проверяет срез (или индекс) по одному измерению и возвращает начало, длину и шаг."""
+        if isinstance(index, int):
+            if index < 0 or index >= size:
+                raise IndexError('Index must be non-negative and less than the dimension of the matrix.')
+            return index, 1, 1
+        if not isinstance(index, slice):
+            raise TypeError('Index must be an integer or a slice.')
+        start, stop, step = index.indices(size)
+        if step <= 0:
+            raise ValueError('Slice step must be positive.')
+        length = len(range(start, stop, step))
+        if length == 0:
+            raise IndexError('The slice of the matrix must not be empty.')
+        return start, length, step
+
+    def __submatrix(self, index: Union[slice, tuple]) -> 'Matrix':
+        """Возвращает подматрицу-представление по срезу строк или паре (строки, столбцы)."""
+        row_index, col_index = (index, slice(None)) if isinstance(index, slice) else index
+        row_start, rows, row_step = self.validated_slice(row_index, self.__rows)
+        col_start, cols, col_step = self.validated_slice(col_index, self.__cols)
+        return self.__view(rows, cols,
+                           self.__offset + row_start * self.__row_stride + col_start * self.__col_stride,
+                           self.__row_stride * row_step, self.__col_stride * col_step)
+
+    @staticmethod
+    def is_slice_index(index) -> bool:
+        """Проверяет, задает ли индекс подматрицу (содержит срез)."""
+        return type(index) is slice or (
+            type(index) is tuple and len(index) == 2 and (type(index[0]) is slice or type(index[1]) is slice))
+
+    def __reduce__(self):
+        """Сериализует матрицу через копию ее элементов."""
+        return type(self).from_buffer, (self.__rows, self.__cols, array('d', self.elements()))
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Проверяет, лежат ли элементы матрицы в буфере подряд по строкам."""
+        return self.__col_stride == 1 and (self.__row_stride == self.__cols or self.__rows == 1)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Возвращает плоский буфер элементов матрицы только для чтения (без копирования).
+
+        Raises:
+            ValueError: Если элементы матрицы не лежат в буфере подряд.
+        """
+        if not self.is_contiguous:
+            raise ValueError('The matrix storage is not contiguous.')
+        return self.__readonly[self.__offset:self.__offset + self.__rows * self.__cols]
+
+    def writable_buffer(self) -> memoryview:
+        """Возвращает плоский буфер элементов матрицы для записи, отмечая изменение матрицы.
+
+        Кэш производных величин сбрасывается при вызове, поэтому значения, вычисленные
+        после записи в буфер, используют новые элементы.
+
+        Raises:
+            ValueError: Если элементы матрицы не лежат в буфере подряд.
+        """
+        if not self.is_contiguous:
+            raise ValueError('The matrix storage is not contiguous.')
+        self.mark_modified()
+        return self.__data[self.__offset:self.__offset + self.__rows * self.__cols]
+
+    def row_buffer(self, index: int, writable: bool = False) -> memoryview:
+        """Возвращает представление строки матрицы в общем буфере без проверки индекса.
+
+        Представление доступно только для чтения; с writable=True - для записи, при этом
+        изменение матрицы отмечается (см. writable_buffer()).
+        """
+        start = self.__offset + index * self.__row_stride
+        if writable:
+            self.mark_modified()
+            return self.__data[start:start + (self.__cols - 1) * self.__col_stride + 1:self.__col_stride]
+        return self.__readonly[start:start + (self.__cols - 1) * self.__col_stride + 1:self.__col_stride]
+
+    def __layout(self) -> tuple[int, int, int, int]:
+        """Возвращает раскладку строк в общем буфере: смещение, шаги строк и столбцов, длину строки."""
+        return self.__offset, self.__row_stride, self.__col_stride, self.__cols
+
+    def __row(self, index: int) -> Vector:
+        """Возвращает вектор-представление строки, созданный при первом обращении к ней."""
+        rows = self.__row_cache
+        if rows is None:
+            rows = self.__row_cache = self.__row_views.rows(self.__layout())
+        row = rows.get(index)
+        # Вектор, отделенный вызовом detach(), больше не является представлением строки
+        if row is None or row.version is None:
+            # Запись через вектор отмечается им самим, поэтому строка выдается для записи
+            start = self.__offset + index * self.__row_stride
+            row = rows[index] = Vector.from_buffer(
+                self.__data[start:start + (self.__cols - 1) * self.__col_stride + 1:self.__col_stride],
+                copy=False, version=self.__version)
+        return row
+
+    def column_buffer(self, index: int, writable: bool = False) -> memoryview:
+        """Возвращает представление столбца матрицы в общем буфере без проверки индекса (см. row_buffer())."""
+        start = self.__offset + index * self.__col_stride
+        if writable:
+            self.mark_modified()
+            return self.__data[start:start + (self.__rows - 1) * self.__row_stride + 1:self.__row_stride]
+        return self.__readonly[start:start + (self.__rows - 1) * self.__row_stride + 1:self.__row_stride]
+
+    def diagonal(self) -> Vector:
+        """Возвращает главную диагональ матрицы как представление общего буфера."""
+        size = min(self.__rows, self.__cols)
+        step = self.__row_stride + self.__col_stride
+        return Vector.from_buffer(self.__data[self.__offset:self.__offset + (size - 1) * step + 1:step], copy=False,
+                                  version=self.__version)
+
+    def elements(self) -> Iterator[float]:
+        """Итерирует по всем элементам матрицы по строкам."""
+        if self.is_contiguous:
+            return iter(self.buffer)
+        return chain.from_iterable(self.row_buffer(i) for i in range(self.__rows))
+
+    def swap_rows(self, first: int, second: int) -> None:
+        """Меняет местами две строки матрицы.
+
+        В отличие от обмена ``m[i], m[j] = m[j], m[i]`` элементы переставляются на месте:
+        ранее полученные строки-векторы остаются привязанными к своим позициям в буфере.
+        """
+        self.validated_index(first)
+        self.validated_index(second)
+        if first == second:
+            return
+        self.mark_modified()
+        first_row = self.row_buffer(first, writable=True)
+        second_row = self.row_buffer(second, writable=True)
+        saved = array('d', first_row)
+        first_row[:] = second_row
+        second_row[:] = saved
 
     @staticmethod
     def validated_rows(rows: int) -> None:
@@ -57,27 +425,85 @@ class Matrix:
             if len(value) != self.__cols:
                 raise ValueError('Vector length must be equal to the number of columns.')
 
-    def __getitem__(self, index: Union[int, tuple[int, int], list[int]]) -> Union[Vector, int, float]:
-        """Получает элемент матрицы по индексу."""
+    def __getitem__(self, index: Union[int, slice, tuple, list[int]]) -> Union['Matrix', Vector, int, float]:
+        """Получает элемент матрицы по индексу.
+
+        ``m[i]`` - строка (вектор-представление), ``m[i, j]`` - элемент, ``m[r0:r1, c0:c1]``
+        и ``m[r0:r1]`` - подматрица-представление общего буфера без копирования.
+        """
+        if type(index) is int:
+            if index < 0 or index >= self.__rows:
+                raise IndexError('The index of the row must be non-negative and less than the number of rows.')
+            return self.__row(index)
+        if type(index) is tuple and len(index) == 2:
+            row_index, col_index = index
+            if type(row_index) is int and type(col_index) is int:
+                if row_index < 0 or row_index >= self.__rows:
+                    raise IndexError('Row index must be non-negative and less than the number of rows.')
+                if col_index < 0 or col_index >= self.__cols:
+                    raise IndexError('Column index must be non-negative and less than the number of columns.')
+                return self.__data[self.__offset + row_index * self.__row_stride + col_index * self.__col_stride]
+        if self.is_slice_index(index):
+            return self.__submatrix(index)
         self.validated_index(index)
         if isinstance(index, int):
-            return self.__matrix[index]
+            return self.__row(index)
         if isinstance(index, (tuple, list)):
             row_index, col_index = index
-            return self.__matrix[row_index][col_index]
+            return self.__data[self.__offset + row_index * self.__row_stride + col_index * self.__col_stride]
 
-    def __setitem__(self, index: Union[int, tuple[int, int], list[int]], value: Union[Vector, int, float]) -> None:
-        """Устанавливает элемент матрицы по индексу."""
+    def __setitem__(self, index: Union[int, slice, tuple, list[int]],
+                    value: Union['Matrix', Vector, int, float]) -> None:
+        """Устанавливает элемент матрицы по индексу.
+
+        Подматрице (``m[r0:r1, c0:c1] = value``) можно присвоить матрицу того же размера
+        или число, которым заполняются все ее элементы.
+        """
+        if type(index) is tuple and len(index) == 2 and type(value) in (float, int):
+            row_index, col_index = index
+            if type(row_index) is int and type(col_index) is int:
+                if row_index < 0 or row_index >= self.__rows:
+                    raise IndexError('Row index must be non-negative and less than the number of rows.')
+                if col_index < 0 or col_index >= self.__cols:
+                    raise IndexError('Column index must be non-negative and less than the number of columns.')
+                self.__version[0] += 1
+                self.__data[self.__offset + row_index * self.__row_stride + col_index * self.__col_stride] = value
+                return
+        if self.is_slice_index(index):
+            target = self.__submatrix(index)
+            self.mark_modified()
+            if isinstance(value, Matrix):
+                if value.__rows != target.__rows or value.__cols != target.__cols:
+                    raise ValueError('The assigned matrix must have the dimensions of the slice.')
+                # Копия защищает от наложения, если value - представление того же буфера
+                rows = [array('d', value.row_buffer(i)) for i in range(value.__rows)]
+                for i, row in enumerate(rows):
+                    target.row_buffer(i, writable=True)[:] = row
+            elif isinstance(value, (int, float)):
+                filler = array('d', [value]) * target.__cols
+                for i in range(target.__rows):
+                    target.row_buffer(i, writable=True)[:] = filler
+            else:
+                raise TypeError('Value of a submatrix must be a Matrix, an integer or a float.')
+            return
         self.validated_index(index)
         self.validated_value(value)
+        self.mark_modified()
 
         if isinstance(index, int):
             if not isinstance(value, Vector):
                 raise ValueError('Value must be a Vector of length equal to the number of columns.')
-            self.__matrix[index] = value
+            # Прежние строки-векторы отделяются от буфера, а источник, разделяющий память
+            # с матрицей, копируется до записи
+            self.__row_views.detach(self.__layout(), index)
+            source = value.buffer
+            source = source if isinstance(source, array) else array('d', source.tobytes())
+            self.row_buffer(index, writable=True)[:] = source
         elif isinstance(index, (tuple, list)):
+            if isinstance(value, Vector):
+                raise TypeError('Value of a single element must be an integer or a float.')
             row_index, col_index = index
-            self.__matrix[row_index][col_index] = value
+            self.__data[self.__offset + row_index * self.__row_stride + col_index * self.__col_stride] = value
 
     def __add__(self, other: 'Matrix') -> 'Matrix':
         """Операция сложения двух матриц."""
@@ -85,10 +511,8 @@ class Matrix:
             raise TypeError("'other' can be only Matrix")
         if self.__rows != other.__rows or self.__cols != other.__cols:
             raise ValueError('Matrices must be of the same dimensions for addition.')
-        new_matrix = Matrix(self.__rows, self.__cols)
-        for i in range(self.__rows):
-            new_matrix[i] = self[i] + other[i]
-        return new_matrix
+        return Matrix.from_buffer(self.__rows, self.__cols,
+                                  array('d', map(add, self.elements(), other.elements())), copy=False)
 
     def __radd__(self, other: Union[int, float]) -> 'Matrix':
         """Операция сложения: число + матрица."""
@@ -96,13 +520,123 @@ class Matrix:
 
     def __iadd__(self, other: 'Matrix') -> 'Matrix':
         """Присваивающее сложение."""
+        return self.add_into(other)
+
+    def __target(self, out: Union['Matrix', None]) -> 'Matrix':
+        """Проверяет матрицу для записи результата (None - сама матрица)."""
+        if out is None:
+            return self
+        if not isinstance(out, Matrix):
+            raise TypeError("'out' can be only Matrix")
+        if self.__rows != out.__rows or self.__cols != out.__cols:
+            raise ValueError('The output matrix must have the dimensions of the result.')
+        return out
+
+    def __write_rows(self, out: 'Matrix', block: Callable[[int, int, int], Iterator[float]]) -> 'Matrix':
+        """Записывает результат в out по строкам блоками по WRITE_BLOCK элементов.
+
+        block(i, start, stop) возвращает значения элементов [start, stop) строки i, поэтому
+        временный буфер не превышает одного блока даже для длинных строк.
+        """
+        out.mark_modified()
+        for i in range(self.__rows):
+            target = out.row_buffer(i, writable=True)
+            for start in range(0, self.__cols, WRITE_BLOCK):
+                stop = min(start + WRITE_BLOCK, self.__cols)
+                target[start:stop] = array('d', block(i, start, stop))
+        return out
+
+    def add_into(self, other: 'Matrix', out: Union['Matrix', None] = None) -> 'Matrix':
+        """Записывает сумму матриц в out (по умолчанию в саму матрицу), не создавая новую матрицу.
+
+        Args:
+            other (Matrix): Второе слагаемое.
+            out (Matrix | None): Матрица для результата; может совпадать с self или other,
+                но не должна частично перекрываться с ними (например, быть их транспонированием).
+
+        Returns:
+            Matrix: out.
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError("'other' can be only Matrix")
+        if self.__rows != other.__rows or self.__cols != other.__cols:
+            raise ValueError('Matrices must be of the same dimensions for addition.')
+        return self.__write_rows(self.__target(out), lambda i, start, stop: map(
+            add, self.row_buffer(i)[start:stop], other.row_buffer(i)[start:stop]))
+
+    def sub_into(self, other: 'Matrix', out: Union['Matrix', None] = None) -> 'Matrix':
+        """Записывает разность матриц в out (по умолчанию в саму матрицу), не создавая новую матрицу."""
+        if not isinstance(other, Matrix):
+            raise TypeError("'other' can be only Matrix")
+        if self.__rows != other.__rows or self.__cols != other.__cols:
+            raise ValueError('Matrices must be of the same dimensions for subtraction.')
+        return self.__write_rows(self.__target(out), lambda i, start, stop: map(
+            sub, self.row_buffer(i)[start:stop], other.row_buffer(i)[start:stop]))
+
+    def scale_into(self, factor: Union[int, float], out: Union['Matrix', None] = None) -> 'Matrix':
+        """Записывает произведение матрицы на число в out (по умолчанию в саму матрицу)."""
+        if not isinstance(factor, (int, float)):
+            raise TypeError('Unsupported type for multiplication.')
+        return self.__write_rows(self.__target(out), lambda i, start, stop: map(
+            mul, self.row_buffer(i)[start:stop], repeat(factor)))
+
+    def axpy(self, alpha: Union[int, float], x: 'Matrix') -> 'Matrix':
+        """Прибавляет к матрице alpha * x на месте (Y <- Y + alpha * X) за один проход по строкам.
+
+        Returns:
+            Matrix: Сама матрица.
+        """
+        if not isinstance(alpha, (int, float)):
+            raise TypeError('Unsupported type for multiplication.')
+        if not isinstance(x, Matrix):
+            raise TypeError("'other' can be only Matrix")
+        if self.__rows != x.__rows or self.__cols != x.__cols:
+            raise ValueError('Matrices must be of the same dimensions for addition.')
+        return self.__write_rows(self, lambda i, start, stop: map(
+            add, self.row_buffer(i)[start:stop], map(mul, x.row_buffer(i)[start:stop], repeat(alpha))))
+
+    def scale_add(self, factor: Union[int, float], other: 'Matrix') -> 'Matrix':
+        """Заменяет матрицу на factor * Y + other на месте за один проход по строкам.
+
+        Returns:
+            Matrix: Сама матрица.
+        """
+        if not isinstance(factor, (int, float)):
+            raise TypeError('Unsupported type for multiplication.')
         if not isinstance(other, Matrix):
             raise TypeError("'other' can be only Matrix")
         if self.__rows != other.__rows or self.__cols != other.__cols:
             raise ValueError('Matrices must be of the same dimensions for addition.')
+        return self.__write_rows(self, lambda i, start, stop: map(
+            add, map(mul, self.row_buffer(i)[start:stop], repeat(factor)), other.row_buffer(i)[start:stop]))
+
+    def mul_into(self, vector: Vector, out: Vector) -> Vector:
+        """Записывает произведение матрицы на вектор в заранее созданный вектор out.
+
+        Args:
+            vector (Vector): Вектор длины, равной количеству столбцов.
+            out (Vector): Вектор длины, равной количеству строк; не должен разделять память с vector.
+
+        Returns:
+            Vector: out.
+
+        Raises:
+            ValueError: Если размеры не согласованы или out совпадает с vector.
+        """
+        if not isinstance(vector, Vector) or not isinstance(out, Vector):
+            raise TypeError('Unsupported type for multiplication.')
+        if self.__cols != len(vector):
+            raise ValueError('Number of columns in the matrix must equal the size of the vector.')
+        if self.__rows != len(out):
+            raise ValueError('The output vector length must equal the number of rows in the matrix.')
+        if out is vector:
+            raise ValueError('The output vector must not be the multiplied vector.')
+        source = vector.buffer
+        result = out.writable_buffer()
+        out.mark_modified()
         for i in range(self.__rows):
-            self[i] += other[i]
-        return self
+            result[i] = sum(map(mul, self.row_buffer(i), source))
+        return out
 
     def __sub__(self, other: 'Matrix') -> 'Matrix':
         """Операция вычитания двух матриц."""
@@ -110,60 +644,101 @@ class Matrix:
             raise TypeError("'other' can be only Matrix")
         if self.__rows != other.__rows or self.__cols != other.__cols:
             raise ValueError('Matrices must be of the same dimensions for subtraction.')
-        new_matrix = Matrix(self.__rows, self.__cols)
-        for i in range(self.__rows):
-            new_matrix[i] = self[i] - other[i]
-        return new_matrix
+        return Matrix.from_buffer(self.__rows, self.__cols,
+                                  array('d', map(sub, self.elements(), other.elements())), copy=False)
 
     def __rsub__(self, other: 'Matrix') -> 'Matrix':
         return -self + other
 
     def __isub__(self, other: 'Matrix') -> 'Matrix':
         """Присваивающее вычитание."""
-        if not isinstance(other, Matrix):
-            raise TypeError("'other' can be only Matrix")
-        if self.__rows != other.__rows or self.__cols != other.__cols:
-            raise ValueError('Matrices must be of the same dimensions for subtraction.')
-        for i in range(self.__rows):
-            self[i] -= other[i]
-        return self
+        return self.sub_into(other)
 
     def __mul__(self, other: Union['Matrix', Vector, int, float]) -> Union['Matrix', Vector]:
         """Операция умножения матрицы на вектор, число или матрицу."""
         if isinstance(other, Matrix):
-            if self.__cols != other.__rows:
-                raise ValueError(
-                    'Number of columns in the first matrix must equal the number of rows in the second matrix.')
-
-            new_matrix = Matrix(self.__rows, other.__cols)
-            for i in range(self.__rows):
-                for j in range(other.__cols):
-                    sum_product = sum(self[i][k] * other[k][j] for k in range(self.__cols))
-                    new_matrix[i][j] = sum_product
-            return new_matrix
+            return self.matmul(other)
 
         elif isinstance(other, Vector):
             if self.__cols != len(other):
                 raise ValueError('Number of columns in the matrix must equal the size of the vector.')
-            result_vector = Vector(self.__rows)
-            for i in range(self.__rows):
-                sum_product = sum(self[i][j] * other[j] for j in range(self.__cols))
-                result_vector[i] = sum_product
-            return result_vector
+            vector = other.buffer
+            return Vector.from_iterable(sum(map(mul, self.row_buffer(i), vector)) for i in range(self.__rows))
 
         elif isinstance(other, (int, float)):
-            new_matrix = Matrix(self.__rows, self.__cols)
-            for i in range(self.__rows):
-                new_matrix[i] = self[i] * other
-            return new_matrix
+            return Matrix.from_buffer(self.__rows, self.__cols,
+                                      array('d', map(mul, self.elements(), repeat(other))), copy=False)
 
         else:
             raise TypeError('Unsupported type for multiplication.')
 
+    def matmul(self, other: 'Matrix', block_size: int | None = None, workers: int | None = 1,
+               crossover: int | None = None) -> 'Matrix':
+        """Умножает матрицу на матрицу блочным алгоритмом.
+
+        Правый операнд предварительно транспонируется в непрерывный буфер, чтобы
+        столбцы читались подряд, а размер блоков подбирается по размеру кэша.
+        Квадратные матрицы порядка больше crossover перемножаются алгоритмом
+        Штрассена-Винограда (см. kernels.strassen).
+
+        Args:
+            other (Matrix): Правый операнд.
+            block_size (int | None): Размер блока; по умолчанию определяется по кэшу процессора.
+            workers (int | None): Количество процессов (см. parallel.matmul); None - по числу ядер,
+                1 - последовательное умножение.
+            crossover (int | None): Порядок, до которого используется классическое умножение;
+                по умолчанию kernels.STRASSEN_CROSSOVER (None - алгоритм Штрассена не используется).
+
+        Returns:
+            Matrix: Произведение матриц.
+
+        Raises:
+            ValueError: Если размеры матриц несовместимы.
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError("'other' can be only Matrix")
+        if self.__cols != other.__rows:
+            raise ValueError(
+                'Number of columns in the first matrix must equal the number of rows in the second matrix.')
+        if block_size is not None and (not isinstance(block_size, int) or block_size <= 0):
+            raise ValueError('Block size must be a positive integer.')
+        if crossover is None:
+            crossover = kernels.STRASSEN_CROSSOVER
+        if crossover is not None and (not isinstance(crossover, int) or crossover <= 0):
+            raise ValueError('The crossover size must be a positive integer.')
+        if workers != 1:
+            import parallel
+            return parallel.matmul(self, other, workers, block_size)
+        size = self.__rows
+        if crossover is not None and size > crossover and self.__cols == size and other.__cols == size:
+            result = kernels.strassen(array('d', self.elements()), array('d', other.elements()), size, crossover)
+            return Matrix.from_buffer(size, size, result, copy=False)
+
+        inner = self.__cols
+        transposed = memoryview(kernels.transpose([other.row_buffer(k) for k in range(inner)], other.__cols))
+        columns = [transposed[j * inner:(j + 1) * inner] for j in range(other.__cols)]
+        rows = [self.row_buffer(i) for i in range(self.__rows)]
+        result = kernels.matmul(rows, columns, block_size)
+        return Matrix.from_buffer(self.__rows, other.__cols, result, copy=False)
+
+    def lazy(self) -> 'Expression':
+        """Возвращает отложенное выражение для матрицы.
+
+        Операции над выражением строят дерево, которое вычисляется методом evaluate()
+        за один проход по элементам без промежуточных матриц (см. expression.py).
+
+        Пример:
+            result = (a.lazy() * b + c * 2 - d).evaluate()
+        """
+        from expression import lazy
+        return lazy(self)
+
     def __neg__(self) -> 'Matrix':
         """Оператор отрицания."""
+        self.mark_modified()
         for i in range(self.__rows):
-            self.__matrix[i] = -self.__matrix[i]
+            row = self.row_buffer(i)
+            row[:] = array('d', map(neg, row))
         return self
 
     def __truediv__(self, other: Union[int, float, Vector]) -> 'Matrix':
@@ -171,21 +746,19 @@ class Matrix:
         if isinstance(other, (int, float)):
             if other == 0:
                 raise ValueError("Division by zero is not allowed.")
-            new_matrix = Matrix(self.__rows, self.__cols)
-            for i in range(self.__rows):
-                new_matrix[i] = self[i] / other
-            return new_matrix
+            return Matrix.from_buffer(self.__rows, self.__cols,
+                                      array('d', map(truediv, self.elements(), repeat(other))), copy=False)
 
         elif isinstance(other, Vector):
             if self.__cols != len(other):
                 raise ValueError('Number of columns in the matrix must equal the size of the vector.')
-            new_matrix = Matrix(self.__rows, self.__cols)
+            divisors = other.buffer
+            if 0 in divisors:
+                raise ValueError('Division by zero is not allowed in vector division.')
+            result = array('d')
             for i in range(self.__rows):
-                for j in range(self.__cols):
-                    if other[j] == 0:
-                        raise ValueError('Division by zero is not allowed in vector division.')
-                    new_matrix[i][j] = self[i][j] / other[j]
-            return new_matrix
+                result.extend(map(truediv, self.row_buffer(i), divisors))
+            return Matrix.from_buffer(self.__rows, self.__cols, result, copy=False)
 
         else:
             raise TypeError('Unsupported type for division.')
@@ -201,16 +774,12 @@ class Matrix:
 
         """
         # Находим максимальную ширину для установки отступа
-        max_width: int = max(
-            len(str(self.__matrix[row][col]))
-            for row in range(self.__rows)
-            for col in range(self.__cols)
-        )
+        max_width: int = max(len(str(elem)) for elem in self.elements())
 
         # Форматируем строку с фиксированной шириной
         return '\n'.join(
-            ' '.join(f'{str(elem):>{max_width}}' for elem in row)
-            for row in self.__matrix
+            ' '.join(f'{str(elem):>{max_width}}' for elem in self.row_buffer(row))
+            for row in range(self.__rows)
         )
 
     def __repr__(self):
@@ -221,7 +790,7 @@ class Matrix:
         """Сравнение на равенство."""
         if self.__rows != other.__rows or self.__cols != other.__cols:
             return False
-        return all(self[i] == other[i] for i in range(self.__rows))
+        return all(self.row_buffer(i) == other.row_buffer(i) for i in range(self.__rows))
 
     def __ne__(self, other: 'Matrix') -> bool:
         """Сравнение на неравенство."""
@@ -244,28 +813,34 @@ class Matrix:
         return self.sum_elements() >= other.sum_elements()
 
     def sum_elements(self) -> float:
-        """Суммирует все элементы матрицы."""
-        return sum(self[i][j] for i in range(self.__rows) for j in range(self.__cols))
+        """Суммирует все элементы матрицы (результат кэшируется до изменения матрицы)."""
+        return self.__cached('sum', lambda: sum(self.elements()))
 
     @classmethod
-    def random_matrix(cls, rows: int, cols: int, start: Union[int, float], end: Union[int, float]) -> 'Matrix':
+    def random_matrix(cls, rows: int, cols: int, start: Union[int, float], end: Union[int, float],
+                      rng: random.Random | None = None) -> 'Matrix':
         """Создает случайную матрицу заданного размера с элементами в указанном диапазоне.
 
+        Элементы генерируются по строкам в один буфер, поэтому при том же зерне матрица
+        совпадает с полученной построчными вызовами Vector.random_vector.
+
         Args:
             rows (int): Количество строк.
             cols (int): Количество столбцов.
             start (int | float): Начало диапазона значений.
             end (int | float): Конец диапазона значений.
+            rng (random.Random | None): Генератор случайных чисел; по умолчанию глобальный модуля random.
 
         Returns:
             Matrix: Новая матрица с случайными элементами.
         """
         cls.validated_rows(rows)
         cls.validated_cols(cols)
-        new_matrix = cls(rows, cols)
-        for i in range(rows):
-            new_matrix[i] = Vector.random_vector(cols, start, end)
-        return new_matrix
+        Vector.validated_value(start)
+        Vector.validated_value(end)
+        uniform = (rng or random).uniform
+        return cls.from_buffer(rows, cols, array('d', [round(uniform(start, end), 2) for _ in range(rows * cols)]),
+                               copy=False)
 
     @classmethod
     def from_input(cls) -> 'Matrix':
@@ -288,22 +863,28 @@ class Matrix:
 
         return matrix
 
-    def write_to_file(self, filename: str) -> None:
+    def write_to_file(self, filename: str, precision: int | None = None) -> None:
         """Записывает матрицу в файл.
 
+        Строки форматируются целиком и пишутся через буфер (см. text_format.write).
+
         Args:
             filename (str): Имя файла, в который нужно записать матрицу.
+            precision (int | None): Количество знаков после запятой в экспоненциальной записи;
+                по умолчанию числа записываются точно.
         """
-        with open(filename, 'w') as f:
-            for row in self.__matrix:
-                f.write(' '.join(str(value) for value in row) + '\n')
+        text_format.write(filename, (self.row_buffer(row) for row in range(self.__rows)), precision)
 
     @classmethod
-    def from_file(cls, filename: str) -> 'Matrix':
+    def from_file(cls, filename: str, workers: int = 1) -> 'Matrix':
         """Читает матрицу из файла.
 
+        Строки разбираются генератором и сразу записываются в заранее выделенный буфер
+        матрицы; при workers > 1 части файла разбираются параллельно (см. text_format.read).
+
         Args:
             filename (str): Имя файла для чтения.
+            workers (int): Количество процессов для разбора файла.
 
         Returns:
             Matrix: Новая матрица, считанная из файла.
@@ -311,36 +892,189 @@ class Matrix:
         Raises:
             ValueError: Если возникает ошибка при чтении файла.
         """
-        with open(filename, 'r') as f:
-            rows = 0
-            cols = 0
-            matrix_data = []
-
-            for line in f:
-                row = list(map(float, line.split()))
-                if cols == 0:
-                    cols = len(row)
-                elif cols != len(row):
-                    raise ValueError(f'The number of elements in the row {rows + 1} does not match the previous rows.')
-                matrix_data.append(row)
-                rows += 1
-
-            matrix = cls(rows, cols)
-            for row in range(rows):
-                matrix[row] = Vector(cols)
-                for col in range(cols):
-                    matrix[row][col] = matrix_data[row][col]
-
-            return matrix
-
-    def gauss(self, col_of_free_mem: Vector) -> Vector:
-        """Решает систему линейных уравнений методом Гаусса с помощью единственного деления.
+        rows, cols, data = text_format.read(filename, workers)
+        return cls.from_buffer(rows, cols, data, copy=False)
+
+    def write_binary(self, filename: str) -> None:
+        """Записывает матрицу в двоичный файл: заголовок (размеры, тип, порядок хранения)
+        и далее элементы по строкам как числа двойной точности little-endian.
+
+        Args:
+            filename (str): Имя файла, в который нужно записать матрицу.
+        """
+        if self.is_contiguous:
+            chunks = [self.buffer]
+        else:
+            chunks = (self.row_buffer(row) for row in range(self.__rows))
+        binary_format.write(filename, self.__rows, self.__cols, chunks)
+
+    @classmethod
+    def from_binary(cls, filename: str, mode: str | None = 'r') -> 'Matrix':
+        """Открывает матрицу из двоичного файла, отображая его в память.
+
+        Файл не читается целиком: данные подгружаются с диска по мере обращения к элементам,
+        поэтому открытие многогигабайтной матрицы происходит мгновенно.
+
+        Args:
+            filename (str): Имя файла для чтения.
+            mode (str | None): 'r' - только чтение, 'r+' - изменения записываются в файл,
+                'c' - изменения остаются в памяти, None - чтение файла целиком без отображения.
+
+        Returns:
+            Matrix: Матрица, разделяющая память с отображением файла.
+
+        Raises:
+            ValueError: Если файл имеет неверный формат.
+        """
+        rows, cols, data = binary_format.load(filename, mode)
+        return cls.from_buffer(rows, cols, data, copy=False)
+
+    def lu(self) -> 'LUDecomposition':
+        """Вычисляет LU-разложение матрицы с выбором ведущего элемента.
+
+        Returns:
+            LUDecomposition: Разложение с методами solve(), det() и inverse(),
+                позволяющее решать систему с новыми правыми частями за O(n^2).
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если матрица вырождена.
+        """
+        from decompositions import LUDecomposition
+        return self.__cached('lu', lambda: LUDecomposition(self))
+
+    def mixed_lu(self) -> 'MixedPrecisionLU':
+        """Вычисляет LU-разложение в одинарной точности для решения с итерационным уточнением.
+
+        Returns:
+            MixedPrecisionLU: Разложение, занимающее вдвое меньше памяти, чем lu(); его метод
+                solve() уточняет решение до точности двойной арифметики.
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если матрица вырождена.
+        """
+        from decompositions import MixedPrecisionLU
+        return self.__cached('mixed_lu', lambda: MixedPrecisionLU(self))
+
+    def det(self) -> float:
+        """Вычисляет определитель по LU-разложению; для вырожденной матрицы возвращает 0.
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+        """
+        def compute() -> float:
+            try:
+                return self.lu().det()
+            except ZeroDivisionError:
+                return 0.0
+        return self.__cached('det', compute)
+
+    def norma(self, kind: str = 'inf') -> float:
+        """Вычисляет норму матрицы (результат кэшируется до изменения матрицы).
+
+        Args:
+            kind (str): 'inf' - максимальная сумма модулей по строкам, '1' - по столбцам,
+                'fro' - норма Фробениуса, 'max' - максимальный элемент по модулю.
+
+        Raises:
+            ValueError: Если вид нормы неизвестен.
+        """
+        if kind == 'inf':
+            compute = lambda: max(sum(map(abs, self.row_buffer(i))) for i in range(self.__rows))
+        elif kind == '1':
+            compute = lambda: max(sum(map(abs, self.column_buffer(j))) for j in range(self.__cols))
+        elif kind == 'fro':
+            compute = lambda: sqrt(sum(map(mul, self.elements(), self.elements())))
+        elif kind == 'max':
+            compute = lambda: max(map(abs, self.elements()))
+        else:
+            raise ValueError(f"Unknown norm {kind!r}; expected 'inf', '1', 'fro' or 'max'.")
+        return self.__cached(('norma', kind), compute)
+
+    def is_symmetric(self, tolerance: float = 0.0) -> bool:
+        """Проверяет симметричность матрицы, сравнивая строки со столбцами до первого расхождения.
+
+        Args:
+            tolerance (float): Допустимое абсолютное расхождение симметричных элементов.
+        """
+        if self.__rows != self.__cols:
+            return False
+        for i in range(self.__rows):
+            row = self.row_buffer(i)[:i]
+            column = self.column_buffer(i)[:i]
+            if tolerance == 0:
+                if row != column:
+                    return False
+            elif any(abs(a - b) > tolerance for a, b in zip(row, column)):
+                return False
+        return True
+
+    def cholesky(self) -> 'CholeskyDecomposition':
+        """Вычисляет разложение Холецкого A = L * L^T симметричной положительно определенной матрицы.
+
+        Returns:
+            CholeskyDecomposition: Разложение с методами solve() и det().
+
+        Raises:
+            ValueError: Если матрица не квадратная или не является положительно определенной.
+        """
+        from decompositions import CholeskyDecomposition
+        return self.__cached('cholesky', lambda: CholeskyDecomposition(self))
+
+    def ldl(self) -> 'LDLDecomposition':
+        """Вычисляет разложение A = L * D * L^T симметричной матрицы.
+
+        Returns:
+            LDLDecomposition: Разложение с методами solve() и det().
+
+        Raises:
+            ValueError: Если матрица не квадратная.
+            ZeroDivisionError: Если получен нулевой диагональный элемент D.
+        """
+        from decompositions import LDLDecomposition
+        return self.__cached('ldl', lambda: LDLDecomposition(self))
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему, выбирая метод по структуре матрицы.
+
+        Ленточные и трехдиагональные матрицы решаются за O(n * b^2) и O(n) соответственно
+        (см. BandMatrix.solve), симметричные матрицы с положительной диагональю - разложением
+        Холецкого, а если матрица не оказалась положительно определенной или не имеет
+        особой структуры - методом Гаусса.
 
         Args:
             col_of_free_mem (Vector): Вектор свободных членов.
 
         Returns:
             Vector: Вектор решений системы.
+        """
+        import banded
+        if self.__rows != self.__cols:
+            raise ValueError('The matrix must be square (n x n) for the Gauss method.')
+        lower, upper = banded.bandwidth(self)
+        if banded.is_narrow_band(self.__rows, lower, upper):
+            return banded.BandMatrix.from_matrix(self, lower, upper).solve(col_of_free_mem)
+        if self.is_symmetric() and all(value > 0 for value in self.diagonal()):
+            try:
+                return self.cholesky().solve(col_of_free_mem)
+            except ValueError:
+                # Матрица не положительно определена
+                pass
+        return self.gauss(col_of_free_mem)
+
+    def gauss(self, col_of_free_mem: Vector, overwrite: bool = False) -> Vector:
+        """Решает систему линейных уравнений методом Гаусса с помощью единственного деления.
+
+        Args:
+            col_of_free_mem (Vector): Вектор свободных членов.
+            overwrite (bool): Если True, исключение выполняется прямо в памяти матрицы и вектора
+                свободных членов: матрица после вызова содержит множители L и U разложения,
+                а вектор - решение системы. Строки не переставляются физически, вместо этого
+                используется перестановка индексов, и расширенная матрица не создается.
+
+        Returns:
+            Vector: Вектор решений системы (при overwrite=True - сам col_of_free_mem).
 
         Raises:
             ValueError: Если система уравнений несовместна или неопределена.
@@ -353,35 +1087,46 @@ class Matrix:
             raise ValueError(
                 "The length of the column of free terms must be equal to the number of rows in the matrix.")
 
-        # Формируем расширенную матрицу
-        extended_matrix: 'Matrix' = Matrix(self.__rows, self.__cols + 1)
+        if not overwrite:
+            # Исходные данные не изменяются: решение строится по кэшированному LU-разложению,
+            # которое выполняет те же операции, что и прямой ход ниже, поэтому повторные
+            # решения с неизмененной матрицей стоят O(n^2)
+            if not isinstance(col_of_free_mem, Vector):
+                col_of_free_mem = Vector.from_iterable(col_of_free_mem)
+            return self.lu().solve(col_of_free_mem)
+
+        if not isinstance(col_of_free_mem, Vector):
+            raise TypeError('The column of free terms must be a Vector when overwrite=True.')
+        from decompositions import eliminate, multiplier_columns, substitute
+
+        # Прямой ход выполняется по представлениям строк: переставляются только ссылки на них
+        rows = [self.row_buffer(i, writable=True) for i in range(self.__rows)]
+        permutation = eliminate(rows)[0]
+        # Столбцы множителей L выдаются по одному, чтобы не создавать копию треугольника
+        free_terms = col_of_free_mem.writable_buffer()
+        free_terms[:] = substitute(rows, multiplier_columns(rows), permutation, free_terms)
+        col_of_free_mem.mark_modified()
+        return col_of_free_mem
+
+    def gauss_batch(self, free_terms: Union['Matrix', list[Vector], tuple]) -> 'Matrix':
+        """Решает систему методом Гаусса сразу для нескольких правых частей.
+
+        Все правые части решаются по кэшированному LU-разложению (см. lu()),
+        поэтому k систем стоят не больше одного исключения и k подстановок.
 
-        for row in range(self.__rows):
-            for col in range(self.__cols):
-                extended_matrix[row][col] = self[row][col]
-            extended_matrix[row][self.__cols] = col_of_free_mem[row]
+        Args:
+            free_terms (Matrix | list[Vector]): Матрица n x k, столбцы которой - правые части,
+                или список векторов свободных членов.
 
-        # Прямой ход с выбором ведущего элемента
-        for i in range(self.__rows):
-            # Поиск строки с максимальным по модулю элементом в текущем столбце
-            max_row = i + max(range(self.__rows - i), key=lambda r: abs(extended_matrix[i + r][i]))
-            extended_matrix[i], extended_matrix[max_row] = extended_matrix[max_row], extended_matrix[i]
-
-            # Проверка на вырожденность: если ведущий элемент равен нулю после перестановки
-            if abs(extended_matrix[i][i]) < 1e-12:  # Пороговое значение для определения нуля
-                raise ZeroDivisionError(
-                    f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
-
-            # Обнуление под ведущим элементом
-            for j in range(i + 1, self.__rows):
-                factor = extended_matrix[j][i] / extended_matrix[i][i]
-                for k in range(i, self.__cols + 1):
-                    extended_matrix[j][k] -= factor * extended_matrix[i][k]
-
-        # Обратный ход для нахождения решения
-        solution: 'Vector' = Vector(self.__rows)
-        for i in range(self.__rows - 1, -1, -1):
-            sum_ax = sum(extended_matrix[i][j] * solution[j] for j in range(i + 1, self.__rows))
-            solution[i] = (extended_matrix[i][self.__cols] - sum_ax) / extended_matrix[i][i]
-
-        return solution
+        Returns:
+            Matrix: Матрица n x k, столбцы которой - решения соответствующих систем.
+
+        Raises:
+            ValueError: Если матрица не квадратная или размеры правых частей не совпадают.
+            ZeroDivisionError: Если обнаружена вырожденная матрица.
+        """
+        if not isinstance(free_terms, (Matrix, list, tuple)):
+            raise TypeError('Free terms must be a Matrix or a list of vectors.')
+        if self.__rows != self.__cols:
+            raise ValueError('The matrix must be square (n x n) for the Gauss method.')
+        return self.lu().solve_batch(free_terms)
@@ -1,4 +1,7 @@
+import random
+import time
 import unittest
+from array import array
 import os
 from vector import Vector
 from matrix import Matrix
@@ -51,6 +54,22 @@ class TestMatrix(unittest.TestCase):
             self.matrix_a.validated_index((2, 1))
         with self.assertRaises(IndexError):
             self.matrix_a.validated_index((-1, 1))
+        # Те же проверки выполняются при обращении по целым индексам
+        with self.assertRaises(IndexError):
+            self.matrix_a[2]
+        with self.assertRaises(IndexError):
+            self.matrix_a[0, 3]
+        with self.assertRaises(IndexError):
+            self.matrix_a[-1, 0] = 1.0
+        with self.assertRaises(TypeError):
+            self.matrix_a[0, 0] = Vector(3, [1, 2, 3])
+        self.assertEqual(self.matrix_a.sum_elements(), 18)
+        self.matrix_a[[1, 2]] = 10
+        self.assertEqual(self.matrix_a[1, 2], 10)
+        self.assertEqual(self.matrix_a.sum_elements(), 22)
+        self.matrix_a[0, 0] = 5
+        self.assertEqual(self.matrix_a[[0, 0]], 5)
+        self.assertEqual(self.matrix_a.sum_elements(), 26)
 
     def test_validated_value(self):
         """Тестируем проверки значений."""
@@ -89,6 +108,168 @@ class TestMatrix(unittest.TestCase):
         expected_matrix[1] = Vector(2, [28, 56])
         self.assertTrue(result_matrix == expected_matrix)
 
+    def test_strassen_multiplication(self):
+        """Тестируем умножение квадратных матриц алгоритмом Штрассена-Винограда."""
+        import kernels
+        from array import array
+        n = 9
+        left = Matrix.from_buffer(n, n, array('d', [(i * 7 + 3) % 11 - 5 for i in range(n * n)]))
+        right = Matrix.from_buffer(n, n, array('d', [(i * 5 + 1) % 13 - 6 for i in range(n * n)]))
+        expected = left.matmul(right)
+        self.assertTrue(left.matmul(right, crossover=2) == expected)
+        kernels.STRASSEN_CROSSOVER = 4
+        try:
+            self.assertTrue(left * right == expected)
+        finally:
+            kernels.STRASSEN_CROSSOVER = None
+        with self.assertRaises(ValueError):
+            left.matmul(right, crossover=0)
+
+    def test_views(self):
+        """Тестируем транспонирование и подматрицы без копирования."""
+        from array import array
+        matrix = Matrix.from_buffer(3, 4, array('d', range(12)))
+        transposed = matrix.T
+        self.assertEqual(transposed.__len__(), (4, 3))
+        self.assertEqual(transposed[3, 1], 7)
+        transposed[1, 2] = 100
+        self.assertEqual(matrix[2, 1], 100)
+        self.assertTrue(transposed.T == matrix)
+
+        block = matrix[1:3, 1:]
+        self.assertEqual(block.__len__(), (2, 3))
+        self.assertFalse(block.is_contiguous)
+        self.assertEqual(list(block.elements()), [5, 6, 7, 100, 10, 11])
+        block[0, 0] = -1
+        self.assertEqual(matrix[1, 1], -1)
+        self.assertEqual(list(matrix[:, 3].elements()), [3, 7, 11])
+        self.assertEqual(list(matrix[::2, ::3].elements()), [0, 3, 8, 11])
+        self.assertEqual(list(matrix[1:2].elements()), [4, -1, 6, 7])
+        self.assertTrue(matrix[0:2, 0:2] * matrix[0:2, 0:2].T == matrix[0:2, 0:2].copy() * matrix[0:2, 0:2].T.copy())
+
+        # Присваивание подматрице, в том числе перекрывающейся с источником
+        matrix[0:2, 0:2] = matrix[1:3, 1:3]
+        self.assertEqual(list(matrix[0:2, 0:2].elements()), [-1, 6, 100, 10])
+        matrix[2:, :] = 0
+        self.assertEqual(matrix.sum_elements(), -1 + 6 + 2 + 3 + 100 + 10 + 6 + 7)
+
+        with self.assertRaises(IndexError):
+            matrix[2:2, :]
+        with self.assertRaises(IndexError):
+            matrix[0:2, 5]
+        with self.assertRaises(ValueError):
+            matrix[::-1, :]
+        with self.assertRaises(ValueError):
+            matrix[0:2, 0:2] = Matrix(3, 3)
+
+    def test_cache(self):
+        """Тестируем кэширование производных величин и его сброс при изменении матрицы."""
+        import matrix as matrix_module
+        matrix = Matrix(3, 3)
+        matrix[0] = Vector(3, [2, 1, -1])
+        matrix[1] = Vector(3, [-3, -1, 2])
+        matrix[2] = Vector(3, [-2, 1, 2])
+        lu = matrix.lu()
+        self.assertIs(matrix.lu(), lu)
+        self.assertAlmostEqual(matrix.det(), -1)
+        self.assertEqual(matrix.norma(), 6)
+        self.assertEqual(matrix.norma('1'), 7)
+        self.assertEqual(matrix.norma('max'), 3)
+        self.assertAlmostEqual(matrix.norma('fro'), 29 ** 0.5)
+        self.assertEqual(matrix.sum_elements(), 1)
+        with self.assertRaises(ValueError):
+            matrix.norma('2')
+
+        # Каждый способ записи увеличивает счетчик изменений и сбрасывает кэш
+        version = matrix.version
+        writes = [lambda: matrix.__setitem__((0, 0), 4), lambda: matrix[0].__setitem__(1, 5),
+                  lambda: matrix.T.__setitem__((2, 1), 7), lambda: matrix.__iadd__(Matrix.identity(3)),
+                  lambda: matrix.swap_rows(0, 1), lambda: matrix.diagonal().__imul__(2)]
+        for write in writes:
+            write()
+            self.assertGreater(matrix.version, version)
+            version = matrix.version
+            self.assertIsNot(matrix.lu(), lu)
+            lu = matrix.lu()
+            self.assertEqual(matrix.sum_elements(), sum(matrix.elements()))
+
+        # Метод Гаусса использует кэшированное разложение; буферы для чтения не позволяют
+        # записать элементы в обход счетчика, а доступ для записи его увеличивает
+        vector = Vector(3, [1, 2, 3])
+        self.assertEqual(matrix.gauss(vector), lu.solve(vector))
+        self.assertEqual(matrix.gauss_batch([vector]).column_buffer(0).tolist(), lu.solve(vector).tolist())
+        self.assertIs(matrix.lu(), lu)
+        identity = Matrix.identity(3)
+        self.assertEqual(identity.gauss(vector).tolist(), [1, 2, 3])
+        for buffer in (identity.buffer, identity.row_buffer(0), identity.column_buffer(0), identity[0].buffer):
+            with self.assertRaises(TypeError):
+                buffer[0] = 2.0
+        identity.writable_buffer()[0] = 2.0
+        self.assertEqual(identity.gauss(vector).tolist(), [0.5, 2, 3])
+        identity.row_buffer(1, writable=True)[1] = 4.0
+        self.assertEqual(identity.gauss(vector).tolist(), [0.5, 0.5, 3])
+        identity[2].writable_buffer()[2] = 3.0
+        self.assertEqual(identity.gauss(vector).tolist(), [0.5, 0.5, 1])
+        # Запись во внешний буфер, переданный без копирования, отмечается вручную
+        external = array('d', [1, 0, 0, 1])
+        shared = Matrix.from_buffer(2, 2, external, copy=False)
+        self.assertEqual(shared.gauss(Vector(2, [1, 1])).tolist(), [1, 1])
+        external[3] = 4.0
+        shared.mark_modified()
+        self.assertEqual(shared.gauss(Vector(2, [1, 1])).tolist(), [1, 0.25])
+        self.assertEqual(Matrix(2, 2).det(), 0)
+
+        # При переполнении вытесняется величина, к которой дольше всего не обращались
+        matrix_module.CACHE_SIZE = 2
+        try:
+            matrix.norma('inf')
+            self.assertIs(matrix.lu(), lu)
+            matrix.norma('1')
+            matrix.norma('max')
+            self.assertIsNot(matrix.lu(), lu)
+        finally:
+            matrix_module.CACHE_SIZE = 8
+
+    def test_out_parameters(self):
+        """Тестируем запись результатов в заранее созданную матрицу и совмещенные операции."""
+        a = Matrix.from_buffer(2, 2, [1, 2, 3, 4])
+        b = Matrix.from_buffer(2, 2, [10, 20, 30, 40])
+        out = Matrix(2, 2)
+        self.assertIs(a.add_into(b, out), out)
+        self.assertEqual(list(out.elements()), [11, 22, 33, 44])
+        a.sub_into(b, out)
+        self.assertEqual(list(out.elements()), [-9, -18, -27, -36])
+        a.scale_into(3, out)
+        self.assertEqual(list(out.elements()), [3, 6, 9, 12])
+        self.assertEqual(list(a.elements()), [1, 2, 3, 4])
+        # Запись в подматрицу-представление и изменение версии матрицы-владельца
+        big = Matrix(3, 3)
+        version = big.version
+        a.add_into(b, big[1:, 1:])
+        self.assertEqual(list(big.elements()), [0, 0, 0, 0, 11, 22, 0, 33, 44])
+        self.assertGreater(big.version, version)
+        self.assertIs(a.axpy(0.1, b), a)
+        self.assertEqual(list(a.elements()), [2, 4, 6, 8])
+        a.scale_add(2, b)
+        self.assertEqual(list(a.elements()), [14, 28, 42, 56])
+        a += b
+        self.assertEqual(list(a.elements()), [24, 48, 72, 96])
+        with self.assertRaises(ValueError):
+            a.add_into(b, Matrix(2, 3))
+
+        vector = Vector(2, [1, 1])
+        result = Vector(2)
+        self.assertIs(b.mul_into(vector, result), result)
+        self.assertEqual(result.tolist(), [30, 70])
+        row_version = big.version
+        b.mul_into(vector, big[0:1, 0:2][0])
+        self.assertEqual(list(big[0]), [30, 70, 0])
+        self.assertGreater(big.version, row_version)
+        with self.assertRaises(ValueError):
+            b.mul_into(vector, vector)
+        with self.assertRaises(ValueError):
+            b.mul_into(vector, Vector(3))
+
     def test_division(self):
         """Тестируем операцию деления матрицы на число."""
         matrix_c = self.matrix_a / 2
@@ -117,6 +298,61 @@ class TestMatrix(unittest.TestCase):
             singular_matrix[1] = Vector(2, [2, 4])  # Вырожденная матрица
             singular_matrix.gauss(Vector(2, [5, 10]))
 
+    def test_gauss_overwrite(self):
+        """Тестируем метод Гаусса с решением на месте."""
+        matrix = Matrix(3, 3)
+        matrix[0] = Vector(3, [2, 1, -1])
+        matrix[1] = Vector(3, [-3, -1, 2])
+        matrix[2] = Vector(3, [-2, 1, 2])
+        original = Matrix.from_buffer(3, 3, matrix.buffer)
+        vector = Vector(3, [8, -11, -3])
+        expected = matrix.gauss(vector)
+        self.assertTrue(matrix == original)
+        self.assertEqual(vector, Vector(3, [8, -11, -3]))
+
+        solution = matrix.gauss(vector, overwrite=True)
+        self.assertIs(solution, vector)
+        self.assertEqual(vector, expected)
+        self.assertFalse(matrix == original)
+
+        with self.assertRaises(TypeError):
+            original.gauss([8, -11, -3], overwrite=True)
+
+        # Решение, записанное в строку другой матрицы, отмечается ее счетчиком изменений
+        free_terms = Matrix.from_buffer(2, 3, [8, -11, -3, 1, 2, 3])
+        self.assertEqual(free_terms.sum_elements(), 0)
+        original.copy().gauss(free_terms[0], overwrite=True)
+        self.assertEqual(free_terms[0], expected)
+        self.assertEqual(free_terms.sum_elements(), sum(expected) + 6)
+
+    def test_gauss_batch(self):
+        """Тестируем метод Гаусса для нескольких правых частей."""
+        matrix = Matrix(3, 3)
+        matrix[0] = Vector(3, [2, 1, -1])
+        matrix[1] = Vector(3, [-3, -1, 2])
+        matrix[2] = Vector(3, [-2, 1, 2])
+        free_terms = [Vector(3, [8, -11, -3]), Vector(3, [1, 2, 3]), Vector(3, [0, 0, 0])]
+        solutions = matrix.gauss_batch(free_terms)
+        self.assertEqual(solutions.__len__(), (3, 3))
+        for k, vector in enumerate(free_terms):
+            expected = matrix.gauss(vector)
+            for i in range(3):
+                self.assertAlmostEqual(solutions[i, k], expected[i])
+        self.assertTrue(matrix.gauss_batch(Matrix.from_columns(free_terms)) == solutions)
+
+        with self.assertRaises(ValueError):
+            matrix.gauss_batch([Vector(2, [1, 2])])
+        with self.assertRaises(TypeError):
+            matrix.gauss_batch(Vector(3, [1, 2, 3]))
+
+    def test_from_columns_and_identity(self):
+        """Тестируем создание матрицы из столбцов и единичной матрицы."""
+        matrix = Matrix.from_columns([Vector(2, [1, 2]), Vector(2, [3, 4]), Vector(2, [5, 6])])
+        self.assertEqual(matrix[0], Vector(3, [1, 3, 5]))
+        self.assertTrue(self.matrix_a * Matrix.identity(3) == self.matrix_a)
+        with self.assertRaises(ValueError):
+            Matrix.from_columns([Vector(2), Vector(3)])
+
     def test_equivalence(self):
         """Тестируем сравнение матриц."""
         self.assertTrue(self.matrix_a == self.matrix_a)
@@ -130,16 +366,147 @@ class TestMatrix(unittest.TestCase):
         self.assertTrue(self.matrix_a == loaded_matrix)
         os.remove(filename)  # Удалить файл после теста
 
+    def test_text_file_streaming(self):
+        """Тестируем потоковое чтение, параллельный разбор и запись с фиксированной точностью."""
+        filename = 'test_matrix.txt'
+        matrix = Matrix.random_matrix(25, 4, -100, 100)
+        matrix.write_to_file(filename)
+        self.assertTrue(Matrix.from_file(filename) == matrix)
+        self.assertTrue(Matrix.from_file(filename, workers=3) == matrix)
+
+        matrix.write_to_file(filename, precision=3)
+        with open(filename) as f:
+            first = f.readline().split()
+        self.assertEqual(first[0], f'{matrix[0, 0]:.3e}')
+        loaded = Matrix.from_file(filename)
+        self.assertAlmostEqual(loaded[3, 2], matrix[3, 2], places=0)
+
+        with open(filename, 'w') as f:
+            f.write('1 2\n\n3 4\n5 6')
+        self.assertTrue(Matrix.from_file(filename) == Matrix.from_buffer(3, 2, [1, 2, 3, 4, 5, 6]))
+        with open(filename, 'w') as f:
+            f.write('1 2\n3 4 5\n')
+        with self.assertRaises(ValueError):
+            Matrix.from_file(filename)
+        with self.assertRaises(ValueError):
+            Matrix.from_file(filename, workers=2)
+
+    def test_binary_file(self):
+        """Тестируем двоичный формат и отображение файла в память."""
+        filename = 'test_matrix.bin'
+        try:
+            self.matrix_a.write_binary(filename)
+            self.assertEqual(os.path.getsize(filename), 32 + 8 * 6)
+            for mode in ('r', 'c', None):
+                self.assertTrue(Matrix.from_binary(filename, mode) == self.matrix_a)
+
+            readonly = Matrix.from_binary(filename)
+            with self.assertRaises(TypeError):
+                readonly[0, 0] = 5
+
+            mapped = Matrix.from_binary(filename, 'r+')
+            mapped[1, 2] = 100
+            del mapped
+            self.assertEqual(Matrix.from_binary(filename)[1, 2], 100)
+
+            with open(filename, 'r+b') as f:
+                f.write(b'XXXX')
+            with self.assertRaises(ValueError):
+                Matrix.from_binary(filename)
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
     def test_random_matrix(self):
         """Тестируем создание случайной матрицы."""
         random_matrix = Matrix.random_matrix(3, 3, 0, 10)
         self.assertEqual(random_matrix.__len__(), (3, 3))
+        # Одинаковое зерно дает одинаковую матрицу, совпадающую с построчной генерацией векторов
+        first = Matrix.random_matrix(3, 4, 0, 10, random.Random(7))
+        second = Matrix.random_matrix(3, 4, 0, 10, random.Random(7))
+        self.assertEqual(list(first.elements()), list(second.elements()))
+        rng = random.Random(7)
+        rows = [Vector.random_vector(4, 0, 10, rng) for _ in range(3)]
+        self.assertEqual(list(first.elements()), [x for row in rows for x in row])
 
     def test_invalid_file_input(self):
         """Тестируем, что выбрасывается исключение при неправильном вводе файла."""
         with self.assertRaises(FileNotFoundError):
             Matrix.from_file('non_existent_file.txt')
 
+    def test_flat_storage_and_row_views(self):
+        """Тестируем плоское хранение и строки-представления без копирования."""
+        row = self.matrix_a[1]
+        row[0] = 10
+        self.assertEqual(self.matrix_a[1, 0], 10)
+        self.matrix_a[0, 2] = 7
+        self.assertEqual(self.matrix_a[0][2], 7)
+        self.assertTrue(self.matrix_a.is_contiguous)
+        self.assertEqual(self.matrix_a.buffer.tolist(), [1, 2, 7, 10, 4, 6])
+        self.assertEqual(self.matrix_a.column_buffer(1).tolist(), [2, 4])
+
+        matrix = Matrix.from_buffer(2, 3, [1, 2, 3, 2, 4, 6])
+        self.assertTrue(matrix[1] == Vector(3, [2, 4, 6]))
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(2, 2, [1, 2, 3])
+
+    def test_swap_rows(self):
+        """Тестируем перестановку строк матрицы."""
+        self.matrix_b.swap_rows(0, 2)
+        self.assertEqual(self.matrix_b[0], Vector(2, [3, 6]))
+        self.assertEqual(self.matrix_b[2], Vector(2, [1, 2]))
+
+        # Обмен присваиванием строк переставляет их так же, как swap_rows
+        matrix = Matrix.from_buffer(3, 2, [0, 2, 1, 3, 4, 5])
+        matrix[0], matrix[2] = matrix[2], matrix[0]
+        self.assertEqual(list(matrix.elements()), [4, 5, 1, 3, 0, 2])
+        matrix.T[0], matrix.T[1] = matrix.T[1], matrix.T[0]
+        self.assertEqual(list(matrix.elements()), [5, 4, 3, 1, 2, 0])
+        # Строка, полученная до присваивания, отделяется от матрицы
+        old = matrix[1]
+        matrix[1] = Vector(2, [7, 8])
+        old[0] = 9
+        self.assertEqual(old.tolist(), [9, 1])
+        self.assertEqual(matrix[1].tolist(), [7, 8])
+        # Повторное обращение возвращает тот же вектор, пока строке не присвоено новое значение
+        self.assertIs(matrix[0], matrix[0])
+        # Отделяются и пересекающиеся строки других представлений того же буфера
+        transposed = matrix.T
+        column, other = transposed[1], transposed[0]
+        matrix[2] = Vector(2, [10, 11])
+        self.assertEqual(column.tolist(), [4, 8, 0])
+        self.assertEqual(other.tolist(), [5, 7, 2])
+        self.assertEqual(transposed[1].tolist(), [4, 8, 11])
+        self.assertIsNot(transposed[0], other)
+        # Вектор, отделенный вручную, заменяется новым представлением
+        row = matrix[0]
+        row.detach()
+        self.assertIsNot(matrix[0], row)
+        matrix[0, 0] = 12
+        self.assertEqual(matrix[0][0], 12)
+
+    def test_row_assignment_scaling(self):
+        """Тестируем, что время присваивания строки не растет с количеством выданных строк."""
+        def assign_time(rows: int) -> float:
+            matrix = Matrix(rows, 50)
+            views = [matrix[i] for i in range(rows)]
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                for i in range(199):
+                    matrix[i] = views[i + 1]
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        self.assertLess(assign_time(3200), 4 * assign_time(200) + 0.01)
+
+    def test_pickle(self):
+        """Тестируем сериализацию матрицы."""
+        import pickle
+        restored = pickle.loads(pickle.dumps(self.matrix_a))
+        self.assertTrue(restored == self.matrix_a)
+        self.assertEqual(pickle.loads(pickle.dumps(self.matrix_a[0])), Vector(3, [1, 2, 3]))
+
     def tearDown(self) -> None:
         """Очистка файлов после тестов."""
         if os.path.exists('test_matrix.txt'):
@@ -0,0 +1,281 @@
+import shutil
+from array import array
+from itertools import repeat
+from math import isqrt
+from operator import mul, sub
+import binary_format
+import kernels
+from vector import Vector
+
+# Предел памяти под рабочие блоки по умолчанию (байт)
+DEFAULT_MEMORY_LIMIT: int = 256 * 1024 * 1024
+# Накладные расходы на одну строку блока в matmul(): заголовок array строки блока A и объекты
+# memoryview строки блока B и столбца транспонированного блока (байт)
+TILE_ROW_OVERHEAD: int = 512
+
+
+def matmul_tile_size(memory_limit: int) -> int:
+    """Вычисляет сторону квадратного блока, при которой рабочий набор matmul() помещается в memory_limit.
+
+    Рабочий набор - три блока t x t (блок A, транспонированный блок B и блок C, в который
+    произведения накапливаются на месте) и TILE_ROW_OVERHEAD байт объектов на каждую
+    строку блока: 24 t^2 + TILE_ROW_OVERHEAD * t <= memory_limit.
+
+    Raises:
+        ValueError: Если в пределе памяти не помещается блок 1 x 1.
+    """
+    tile = (isqrt(TILE_ROW_OVERHEAD ** 2 + 4 * 24 * max(memory_limit, 0)) - TILE_ROW_OVERHEAD) // (2 * 24)
+    if tile < 1:
+        raise ValueError('The memory limit is too small to hold a single tile.')
+    return tile
+
+
+def panel_width(size: int, memory_limit: int) -> int:
+    """Вычисляет ширину панели LU-разложения: панель size x w и два блока w x w помещаются в memory_limit.
+
+    Raises:
+        ValueError: Если в пределе памяти не помещается даже панель шириной в один столбец.
+    """
+    width = min(size, memory_limit // (8 * 3 * size))
+    if width < 1:
+        raise ValueError('The memory limit is too small to hold a single column panel.')
+    return width
+
+
+def read_tile(view: memoryview, cols: int, row_start: int, row_stop: int,
+              col_start: int, col_stop: int) -> list[array]:
+    """Читает прямоугольный блок матрицы, хранящейся в отображенном файле, в виде списка строк."""
+    return [array('d', view[i * cols + col_start:i * cols + col_stop]) for i in range(row_start, row_stop)]
+
+
+def write_tile(view: memoryview, cols: int, row_start: int, col_start: int, tile: list[array]) -> None:
+    """Записывает блок строк в отображенный файл, начиная с позиции (row_start, col_start)."""
+    for offset, row in enumerate(tile):
+        start = (row_start + offset) * cols + col_start
+        view[start:start + len(row)] = row
+
+
+def matmul(left_file: str, right_file: str, result_file: str, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> None:
+    """Умножает матрицы, хранящиеся в двоичных файлах, не загружая их в память целиком.
+
+    Операнды отображаются в память, а вычисление идет по квадратным блокам: в памяти
+    одновременно находятся только блок левого операнда, транспонированный блок правого
+    (собирается прямо из отображенного файла) и блок результата, к которому произведения
+    прибавляются на месте и который затем записывается в файл результата.
+
+    Args:
+        left_file (str): Файл левого операнда (формат binary_format).
+        right_file (str): Файл правого операнда.
+        result_file (str): Файл, в который записывается произведение.
+        memory_limit (int): Предел памяти под рабочие блоки в байтах.
+
+    Raises:
+        ValueError: Если размеры матриц несовместимы или предел памяти слишком мал.
+    """
+    rows, inner, left = binary_format.load(left_file)
+    right_rows, cols, right = binary_format.load(right_file)
+    if inner != right_rows:
+        raise ValueError(
+            'Number of columns in the first matrix must equal the number of rows in the second matrix.')
+    tile = matmul_tile_size(memory_limit)
+
+    binary_format.create(result_file, rows, cols)
+    _, _, result = binary_format.load(result_file, 'r+')
+    try:
+        for i_start in range(0, rows, tile):
+            i_stop = min(i_start + tile, rows)
+            for j_start in range(0, cols, tile):
+                j_stop = min(j_start + tile, cols)
+                block = j_stop - j_start
+                accumulated = array('d', [0.0]) * ((i_stop - i_start) * block)
+                for k_start in range(0, inner, tile):
+                    k_stop = min(k_start + tile, inner)
+                    left_tile = read_tile(left, inner, i_start, i_stop, k_start, k_stop)
+                    # Строки блока B берутся срезами отображенного файла, без промежуточной копии блока
+                    transposed = memoryview(kernels.transpose(
+                        [right[k * cols + j_start:k * cols + j_stop] for k in range(k_start, k_stop)], block))
+                    width = k_stop - k_start
+                    columns = [transposed[j * width:(j + 1) * width] for j in range(block)]
+                    kernels.matmul(left_tile, columns, tile, out=accumulated)
+                    del left_tile, transposed, columns
+                rows_view = memoryview(accumulated)
+                write_tile(result, cols, i_start, j_start,
+                           [rows_view[r * block:(r + 1) * block] for r in range(i_stop - i_start)])
+                del rows_view
+    finally:
+        result.obj.flush()
+        del result, left, right
+
+
+class OutOfCoreLU:
+    """Блочное LU-разложение с выбором ведущего элемента для матрицы, хранящейся в двоичном файле.
+
+    Разложение выполняется в рабочем файле по панелям столбцов: в памяти находятся
+    только текущая панель (все строки, w столбцов) и пара блоков w x w, где ширина w
+    определяется пределом памяти. Множители L и элементы U записываются на место
+    исходной матрицы в рабочем файле, поэтому решение с новой правой частью требует
+    лишь двух последовательных проходов по файлу.
+    """
+
+    def __init__(self, filename: str, work_file: str | None = None,
+                 memory_limit: int = DEFAULT_MEMORY_LIMIT) -> None:
+        """Копирует матрицу в рабочий файл и выполняет разложение.
+
+        Args:
+            filename (str): Файл квадратной матрицы (формат binary_format).
+            work_file (str | None): Файл для хранения разложения; по умолчанию filename + '.lu'.
+            memory_limit (int): Предел памяти под рабочие блоки в байтах.
+
+        Raises:
+            ValueError: Если матрица не квадратная или предел памяти слишком мал.
+            ZeroDivisionError: Если матрица вырождена.
+        """
+        with open(filename, 'rb') as f:
+            rows, cols = binary_format.read_header(f)
+        if rows != cols:
+            raise ValueError('The matrix must be square (n x n) for the LU decomposition.')
+        self.__size: int = rows
+        self.__width: int = panel_width(rows, memory_limit)
+        self.__work_file: str = work_file if work_file is not None else filename + '.lu'
+        self.__pivots: list[int] = []
+        shutil.copyfile(filename, self.__work_file)
+        self.__factorize()
+
+    @property
+    def size(self) -> int:
+        """Возвращает порядок разложенной матрицы."""
+        return self.__size
+
+    @property
+    def work_file(self) -> str:
+        """Возвращает имя рабочего файла с множителями L и элементами U."""
+        return self.__work_file
+
+    def __factorize(self) -> None:
+        """Правостороннее блочное LU-разложение по панелям столбцов."""
+        n = self.__size
+        _, _, view = binary_format.load(self.__work_file, 'r+')
+        try:
+            for k_start in range(0, n, self.__width):
+                k_stop = min(k_start + self.__width, n)
+                width = k_stop - k_start
+                # Панель: строки k_start..n, столбцы k_start..k_stop
+                panel = read_tile(view, n, k_start, n, k_start, k_stop)
+                for jj in range(width):
+                    j = k_start + jj
+                    local = max(range(jj, len(panel)), key=lambda r: abs(panel[r][jj]))
+                    pivot_index = k_start + local
+                    self.__pivots.append(pivot_index)
+                    if local != jj:
+                        panel[jj], panel[local] = panel[local], panel[jj]
+                        self.__swap_outside(view, j, pivot_index, k_start, k_stop)
+                    pivot_row = panel[jj]
+                    pivot = pivot_row[jj]
+                    if abs(pivot) < 1e-12:
+                        raise ZeroDivisionError(
+                            f"System of equations is inconsistent or underdetermined (leading element = 0) "
+                            f"in row {j + 1}.")
+                    tail = pivot_row[jj + 1:]
+                    for r in range(jj + 1, len(panel)):
+                        row = panel[r]
+                        factor = row[jj] / pivot
+                        row[jj] = factor
+                        if factor != 0 and tail:
+                            row[jj + 1:] = array('d', map(sub, row[jj + 1:], map(mul, tail, repeat(factor))))
+                write_tile(view, n, k_start, k_start, panel)
+
+                # Блочная строка U12 = L11^-1 * A12 и обновление A22 -= L21 * U12 по блокам
+                lower_diagonal = panel[:width]
+                lower_rows = panel[width:]
+                for j_start in range(k_stop, n, self.__width):
+                    j_stop = min(j_start + self.__width, n)
+                    upper = read_tile(view, n, k_start, k_stop, j_start, j_stop)
+                    for i in range(1, width):
+                        row = upper[i]
+                        for m in range(i):
+                            factor = lower_diagonal[i][m]
+                            if factor != 0:
+                                row[:] = array('d', map(sub, row, map(mul, upper[m], repeat(factor))))
+                    write_tile(view, n, k_start, j_start, upper)
+
+                    transposed = memoryview(kernels.transpose(upper, j_stop - j_start))
+                    columns = [transposed[c * width:(c + 1) * width] for c in range(j_stop - j_start)]
+                    block = j_stop - j_start
+                    for i_start in range(0, len(lower_rows), self.__width):
+                        i_stop = min(i_start + self.__width, len(lower_rows))
+                        factors = [row[:width] for row in lower_rows[i_start:i_stop]]
+                        product = kernels.matmul(factors, columns, self.__width)
+                        target = read_tile(view, n, k_stop + i_start, k_stop + i_stop, j_start, j_stop)
+                        for r, row in enumerate(target):
+                            row[:] = array('d', map(sub, row, product[r * block:(r + 1) * block]))
+                        write_tile(view, n, k_stop + i_start, j_start, target)
+                    del transposed, columns
+        finally:
+            view.obj.flush()
+            del view
+
+    def __swap_outside(self, view: memoryview, first: int, second: int, col_start: int, col_stop: int) -> None:
+        """Меняет местами строки first и second в файле вне столбцов текущей панели."""
+        n = self.__size
+        for start, stop in ((0, col_start), (col_stop, n)):
+            if start == stop:
+                continue
+            a = slice(first * n + start, first * n + stop)
+            b = slice(second * n + start, second * n + stop)
+            saved = array('d', view[a])
+            view[a] = view[b]
+            view[b] = saved
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему по разложению, читая рабочий файл построчно в двух проходах.
+
+        Args:
+            col_of_free_mem (Vector): Вектор свободных членов.
+
+        Returns:
+            Vector: Вектор решений системы.
+
+        Raises:
+            ValueError: Если длина вектора не совпадает с порядком матрицы.
+        """
+        n = self.__size
+        if len(col_of_free_mem) != n:
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+        solution = array('d', col_of_free_mem)
+        for i, pivot_index in enumerate(self.__pivots):
+            solution[i], solution[pivot_index] = solution[pivot_index], solution[i]
+
+        _, _, view = binary_format.load(self.__work_file)
+        try:
+            # Прямая подстановка: L * y = P * b
+            for i in range(1, n):
+                solution[i] -= sum(map(mul, view[i * n:i * n + i], solution[:i]))
+            # Обратная подстановка: U * x = y
+            for i in range(n - 1, -1, -1):
+                row = view[i * n + i:(i + 1) * n]
+                solution[i] = (solution[i] - sum(map(mul, row[1:], solution[i + 1:]))) / row[0]
+                del row
+        finally:
+            del view
+        return Vector.from_buffer(solution, copy=False)
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление разложения."""
+        return f'{type(self).__name__}(size={self.__size}, panel_width={self.__width})'
+
+
+def solve(filename: str, col_of_free_mem: Vector, memory_limit: int = DEFAULT_MEMORY_LIMIT,
+          work_file: str | None = None) -> Vector:
+    """Решает систему с матрицей, хранящейся в двоичном файле, блочным LU-разложением вне памяти.
+
+    Args:
+        filename (str): Файл квадратной матрицы (формат binary_format).
+        col_of_free_mem (Vector): Вектор свободных членов.
+        memory_limit (int): Предел памяти под рабочие блоки в байтах.
+        work_file (str | None): Файл для хранения разложения; по умолчанию filename + '.lu'.
+
+    Returns:
+        Vector: Вектор решений системы.
+    """
+    return OutOfCoreLU(filename, work_file, memory_limit).solve(col_of_free_mem)
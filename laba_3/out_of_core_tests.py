@@ -0,0 +1,108 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+from array import array
+import out_of_core
+from matrix import Matrix
+from vector import Vector
+
+
+def from_rows(rows: list[list[float]]) -> Matrix:
+    return Matrix.from_buffer(len(rows), len(rows[0]), array('d', [value for row in rows for value in row]))
+
+
+class TestOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.left = from_rows([[float(3 * i - j + (i == j) * 20) for j in range(7)] for i in range(7)])
+        self.right = from_rows([[float(i * j % 5 - 2) for j in range(5)] for i in range(7)])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_tile_sizes(self):
+        """Тестируем выбор размеров блоков по пределу памяти."""
+        overhead = out_of_core.TILE_ROW_OVERHEAD
+        self.assertEqual(out_of_core.matmul_tile_size(3 * 8 * 16 + 4 * overhead), 4)
+        self.assertEqual(out_of_core.matmul_tile_size(3 * 8 * 16 + 4 * overhead - 1), 3)
+        self.assertEqual(out_of_core.panel_width(10, 3 * 8 * 10 * 2), 2)
+        self.assertEqual(out_of_core.panel_width(10, 10 ** 9), 10)
+        with self.assertRaises(ValueError):
+            out_of_core.matmul_tile_size(8)
+        with self.assertRaises(ValueError):
+            out_of_core.panel_width(10, 100)
+
+    def test_matmul(self):
+        """Тестируем блочное умножение матриц из файлов при разных пределах памяти."""
+        self.left.write_binary(self.path('a.bin'))
+        self.right.write_binary(self.path('b.bin'))
+        expected = self.left * self.right
+        overhead = out_of_core.TILE_ROW_OVERHEAD
+        for memory_limit in (24 + overhead, 3 * 8 * 9 + 3 * overhead, out_of_core.DEFAULT_MEMORY_LIMIT):
+            out_of_core.matmul(self.path('a.bin'), self.path('b.bin'), self.path('c.bin'), memory_limit)
+            result = Matrix.from_binary(self.path('c.bin'))
+            for i in range(7):
+                for j in range(5):
+                    self.assertAlmostEqual(result[i, j], expected[i, j])
+        with self.assertRaises(ValueError):
+            out_of_core.matmul(self.path('b.bin'), self.path('b.bin'), self.path('c.bin'))
+
+    def test_matmul_memory(self):
+        """Тестируем, что пиковая память умножения не превышает предел."""
+        size, tile = 64, 32
+        left = from_rows([[float((i * 7 + j) % 11) for j in range(size)] for i in range(size)])
+        left.write_binary(self.path('a.bin'))
+        memory_limit = 3 * 8 * tile * tile + out_of_core.TILE_ROW_OVERHEAD * tile
+        self.assertEqual(out_of_core.matmul_tile_size(memory_limit), tile)
+        tracemalloc.start()
+        try:
+            out_of_core.matmul(self.path('a.bin'), self.path('a.bin'), self.path('c.bin'), memory_limit)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(peak, memory_limit)
+        result = Matrix.from_binary(self.path('c.bin'))
+        expected = left * left
+        self.assertEqual(list(result.elements()), list(expected.elements()))
+
+    def test_solve(self):
+        """Тестируем блочное LU-разложение в файле с перестановками строк."""
+        matrix = from_rows([[0.0, 2.0, 1.0, 4.0], [1.0, 1.0, 0.0, 2.0],
+                                   [3.0, 0.0, 5.0, 1.0], [2.0, 7.0, 1.0, 0.0]])
+        matrix.write_binary(self.path('a.bin'))
+        b = Vector(4, [1.0, 2.0, 3.0, 4.0])
+        expected = matrix.gauss(b)
+        for memory_limit in (3 * 8 * 4, 3 * 8 * 4 * 3, out_of_core.DEFAULT_MEMORY_LIMIT):
+            decomposition = out_of_core.OutOfCoreLU(self.path('a.bin'), self.path('a.lu'), memory_limit)
+            solution = decomposition.solve(b)
+            for k in range(4):
+                self.assertAlmostEqual(solution[k], expected[k])
+        # Исходный файл не изменяется
+        self.assertTrue(Matrix.from_binary(self.path('a.bin')) == matrix)
+
+        self.left.write_binary(self.path('big.bin'))
+        b = Vector(7, [float(k) for k in range(7)])
+        solution = out_of_core.solve(self.path('big.bin'), b, memory_limit=3 * 8 * 7 * 3)
+        residual = self.left * solution - b
+        self.assertLess(residual.norma(), 1e-9)
+
+    def test_solve_errors(self):
+        """Тестируем исключения блочного решения."""
+        self.right.write_binary(self.path('b.bin'))
+        with self.assertRaises(ValueError):
+            out_of_core.OutOfCoreLU(self.path('b.bin'))
+        from_rows([[1.0, 2.0], [2.0, 4.0]]).write_binary(self.path('s.bin'))
+        with self.assertRaises(ZeroDivisionError):
+            out_of_core.OutOfCoreLU(self.path('s.bin'), memory_limit=48)
+        Matrix.identity(3).write_binary(self.path('i.bin'))
+        with self.assertRaises(ValueError):
+            out_of_core.solve(self.path('i.bin'), Vector(2, [1.0, 2.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import kernels
+from matrix import Matrix
+
+# Минимальный объем работы (rows * cols * inner), начиная с которого выгодно запускать процессы
+PARALLEL_THRESHOLD: int = 96 ** 3
+# Количество блоков строк на один процесс для выравнивания нагрузки
+BLOCKS_PER_WORKER: int = 4
+
+
+def _attach(name: str) -> tuple[shared_memory.SharedMemory, memoryview]:
+    """Подключается к существующему блоку общей памяти и возвращает его вместе с представлением 'd'."""
+    block = shared_memory.SharedMemory(name=name)
+    return block, block.buf.cast('d')
+
+
+def _multiply_rows(left_name: str, right_name: str, result_name: str,
+                   inner: int, cols: int, row_start: int, row_stop: int, block: int | None) -> None:
+    """Вычисляет строки row_start..row_stop произведения в общей памяти (выполняется в дочернем процессе)."""
+    left_block, left = _attach(left_name)
+    right_block, right = _attach(right_name)
+    result_block, result = _attach(result_name)
+    try:
+        rows = [left[i * inner:(i + 1) * inner] for i in range(row_start, row_stop)]
+        columns = [right[j * inner:(j + 1) * inner] for j in range(cols)]
+        result[row_start * cols:row_stop * cols] = kernels.matmul(rows, columns, block)
+        del rows, columns
+    finally:
+        # Представления должны быть освобождены до закрытия блоков
+        del left, right, result
+        left_block.close()
+        right_block.close()
+        result_block.close()
+
+
+def _shared_copy(values, size: int) -> shared_memory.SharedMemory:
+    """Создает блок общей памяти на size чисел и копирует в него values."""
+    block = shared_memory.SharedMemory(create=True, size=max(8, 8 * size))
+    view = block.buf.cast('d')
+    view[:size] = array('d', values)
+    view.release()
+    return block
+
+
+def matmul(left: Matrix, right: Matrix, workers: int | None = None, block_size: int | None = None) -> Matrix:
+    """Умножает матрицы, распределяя блоки строк результата по пулу процессов.
+
+    Операнды (правый - в транспонированном виде) и результат размещаются в
+    multiprocessing.shared_memory, поэтому задачи передают только имена блоков
+    и границы строк, а не сами данные. Для малых матриц и workers=1 используется
+    последовательное блочное умножение Matrix.matmul.
+
+    Args:
+        left (Matrix): Левый операнд.
+        right (Matrix): Правый операнд.
+        workers (int | None): Количество процессов; по умолчанию os.cpu_count().
+        block_size (int | None): Размер блока для ядра умножения в каждом процессе.
+
+    Returns:
+        Matrix: Произведение матриц.
+
+    Raises:
+        ValueError: Если размеры матриц несовместимы или количество процессов не положительно.
+    """
+    if not isinstance(left, Matrix) or not isinstance(right, Matrix):
+        raise TypeError("'left' and 'right' can be only Matrix")
+    rows, inner = left.__len__()
+    right_rows, cols = right.__len__()
+    if inner != right_rows:
+        raise ValueError(
+            'Number of columns in the first matrix must equal the number of rows in the second matrix.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError('The number of workers must be a positive integer.')
+    workers = min(workers, rows)
+    if workers == 1 or rows * cols * inner < PARALLEL_THRESHOLD:
+        return left.matmul(right, block_size)
+
+    left_block = _shared_copy(left.elements(), rows * inner)
+    right_block = _shared_copy(kernels.transpose([right.row_buffer(k) for k in range(inner)], cols), cols * inner)
+    result_block = shared_memory.SharedMemory(create=True, size=8 * rows * cols)
+    try:
+        step = max(1, -(-rows // (workers * BLOCKS_PER_WORKER)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_multiply_rows, left_block.name, right_block.name, result_block.name,
+                                       inner, cols, start, min(start + step, rows), block_size)
+                       for start in range(0, rows, step)]
+            for future in futures:
+                future.result()
+        view = result_block.buf.cast('d')
+        result = array('d', view[:rows * cols])
+        view.release()
+    finally:
+        for block in (left_block, right_block, result_block):
+            block.close()
+            block.unlink()
+    return Matrix.from_buffer(rows, cols, result, copy=False)
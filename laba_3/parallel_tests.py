@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+from matrix import Matrix
+import parallel
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем операнды, достаточно большие для параллельного умножения."""
+        self.left = Matrix.random_matrix(40, 30, -5, 5)
+        self.right = Matrix.random_matrix(30, 20, -5, 5)
+
+    def test_parallel_matches_serial(self):
+        """Тестируем совпадение параллельного и последовательного умножения."""
+        expected = self.left * self.right
+        with mock.patch.object(parallel, 'PARALLEL_THRESHOLD', 0):
+            self.assertTrue(parallel.matmul(self.left, self.right, workers=3) == expected)
+            self.assertTrue(self.left.matmul(self.right, workers=2, block_size=4) == expected)
+
+    def test_small_inputs_are_serial(self):
+        """Тестируем, что малые задачи и workers=1 не запускают процессы."""
+        with mock.patch.object(parallel, 'ProcessPoolExecutor') as executor:
+            self.assertTrue(parallel.matmul(self.left, self.right, workers=4) == self.left * self.right)
+            with mock.patch.object(parallel, 'PARALLEL_THRESHOLD', 0):
+                parallel.matmul(self.left, self.right, workers=1)
+            executor.assert_not_called()
+
+    def test_validation(self):
+        """Тестируем проверки аргументов."""
+        with self.assertRaises(ValueError):
+            parallel.matmul(self.left, self.left)
+        with self.assertRaises(ValueError):
+            parallel.matmul(self.left, self.right, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Hashable
+from matrix import Matrix
+from vector import Vector
+
+# Количество матриц с ключами вызывающего, разложения которых сохраняются между пакетами
+OPERATOR_CACHE_SIZE: int = 16
+
+
+def solve_batch(matrix: Matrix, free_terms: list[Vector]) -> list[Vector]:
+    """Решает систему для нескольких правых частей за одно разложение (выполняется в пуле).
+
+    Разложение берется из кэша матрицы (Matrix.lu()), поэтому повторные пакеты с той же
+    неизмененной матрицей обходятся без исключения. Версия матрицы здесь не проверяется:
+    в пуле процессов функция получает копию матрицы с нулевой версией.
+    """
+    solutions = matrix.lu().solve_batch(free_terms)
+    return [Vector.from_buffer(solutions.column_buffer(j)) for j in range(len(free_terms))]
+
+
+class _Request:
+    """Ожидающий решения запрос."""
+
+    __slots__ = ('free_terms', 'future')
+
+    def __init__(self, free_terms: Vector, future: asyncio.Future) -> None:
+        self.free_terms: Vector = free_terms
+        self.future: asyncio.Future = future
+
+
+class _Batch:
+    """Запросы с одной и той же матрицей, собираемые в одно решение с несколькими правыми частями."""
+
+    __slots__ = ('key', 'matrix', 'version', 'requests', 'timer')
+
+    def __init__(self, key: tuple, matrix: Matrix) -> None:
+        self.key: tuple = key
+        self.matrix: Matrix = matrix
+        self.version: int = matrix.version
+        self.requests: list[_Request] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class SolveService:
+    """Асинхронный решатель систем линейных уравнений.
+
+    Вычисления выполняются в пуле потоков или процессов, поэтому цикл событий не
+    блокируется. Запросы с одной и той же матрицей (тот же объект и та же версия
+    либо одинаковый ключ, заданный вызывающим), поступившие в течение batch_window,
+    объединяются в одно решение с несколькими правыми частями. Ключ вычисляется за O(1),
+    а матрица не копируется: LU-разложение строится в пуле и кэшируется самой матрицей,
+    поэтому ее нельзя изменять, пока запрос не решен (изменение, отмеченное счетчиком
+    версий, приводит к ValueError). Количество одновременно обрабатываемых запросов
+    ограничено max_pending: следующие запросы ждут освобождения места (с учетом своего
+    тайм-аута).
+
+    Пример:
+        async with SolveService() as solver:
+            x = await solver.solve(a, b, timeout=1.0)
+    """
+
+    def __init__(self, executor: Executor | None = None, max_pending: int = 64,
+                 batch_window: float = 0.002, max_batch: int = 64) -> None:
+        """Создает сервис.
+
+        Args:
+            executor (Executor | None): Пул для вычислений; по умолчанию пул из одного потока,
+                которым владеет сервис. Для ProcessPoolExecutor матрицы сериализуются в пуле
+                при каждом пакете, и разложения между пакетами не сохраняются.
+            max_pending (int): Наибольшее количество принятых, но не решенных запросов.
+            batch_window (float): Время в секундах, в течение которого собирается пакет.
+            max_batch (int): Наибольшее количество правых частей в пакете.
+
+        Raises:
+            ValueError: Если параметры не положительны.
+        """
+        if not isinstance(max_pending, int) or max_pending <= 0:
+            raise ValueError('The maximum number of pending requests must be a positive integer.')
+        if not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError('The maximum batch size must be a positive integer.')
+        if batch_window < 0:
+            raise ValueError('The batch window must be non-negative.')
+        self.__owns_executor: bool = executor is None
+        self.__executor: Executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        self.__slots: asyncio.Semaphore = asyncio.Semaphore(max_pending)
+        self.__batch_window: float = batch_window
+        self.__max_batch: int = max_batch
+        self.__batches: dict[tuple, _Batch] = {}
+        self.__operators: OrderedDict[Hashable, tuple[Matrix, int]] = OrderedDict()
+        self.__running: set[asyncio.Task] = set()
+        self.__closed: bool = False
+        self.batches_solved: int = 0
+        self.requests_solved: int = 0
+
+    async def solve(self, matrix: Matrix, col_of_free_mem: Vector, timeout: float | None = None,
+                    key: Hashable | None = None) -> Vector:
+        """Решает систему A * x = b, не блокируя цикл событий.
+
+        Args:
+            matrix (Matrix): Квадратная матрица системы; не должна изменяться до получения решения.
+            col_of_free_mem (Vector): Вектор свободных членов (копируется при постановке в очередь).
+            timeout (float | None): Наибольшее время ожидания в секундах, включая ожидание места в очереди.
+            key (Hashable | None): Ключ матрицы, позволяющий объединять запросы с разными объектами
+                Matrix с одинаковыми элементами; по умолчанию - объект матрицы и ее версия.
+                Для одного ключа используется матрица первого запроса.
+
+        Returns:
+            Vector: Вектор решений системы.
+
+        Raises:
+            ValueError: Если размеры не согласованы или матрица изменилась до решения.
+            ZeroDivisionError: Если матрица вырождена.
+            TimeoutError: Если решение не получено за timeout.
+            RuntimeError: Если сервис закрыт.
+        """
+        if self.__closed:
+            raise RuntimeError('The solve service is closed.')
+        if not isinstance(matrix, Matrix):
+            raise TypeError("'matrix' can be only Matrix")
+        if not isinstance(col_of_free_mem, Vector):
+            raise TypeError('The "col_of_free_mem" argument is not a vector.')
+        rows, cols = matrix.__len__()
+        if rows != cols:
+            raise ValueError('The matrix must be square (n x n) for the Gauss method.')
+        if len(col_of_free_mem) != rows:
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+        key = ('matrix', id(matrix), matrix.version) if key is None else ('key', key)
+        return await asyncio.wait_for(
+            self.__submit(key, matrix, Vector.from_buffer(col_of_free_mem.buffer)), timeout)
+
+    async def __submit(self, key: tuple, matrix: Matrix, free_terms: Vector) -> Vector:
+        """Ждет места в очереди, добавляет запрос в пакет и ждет его решения."""
+        async with self.__slots:
+            future = asyncio.get_running_loop().create_future()
+            request = _Request(free_terms, future)
+            batch = self.__enqueue(key, matrix, request)
+            try:
+                return await future
+            except asyncio.CancelledError:
+                # Тайм-аут или отмена: запрос, еще не отправленный на решение, убирается из пакета
+                if self.__batches.get(batch.key) is batch and request in batch.requests:
+                    batch.requests.remove(request)
+                    if not batch.requests:
+                        self.__discard(batch)
+                raise
+
+    def __enqueue(self, key: tuple, matrix: Matrix, request: _Request) -> _Batch:
+        """Добавляет запрос в пакет своей матрицы, создавая пакет при необходимости."""
+        batch = self.__batches.get(key)
+        if batch is None:
+            if key[0] == 'key':
+                # Для ключа вызывающего сохраняется матрица первого запроса вместе с ее кэшем
+                # разложений; id() для этого не подходит, так как может быть переиспользован
+                operator = self.__operators.get(key)
+                if operator is None or operator[0].version != operator[1]:
+                    self.__operators[key] = (matrix, matrix.version)
+                    if len(self.__operators) > OPERATOR_CACHE_SIZE:
+                        self.__operators.popitem(last=False)
+                else:
+                    self.__operators.move_to_end(key)
+                    matrix = operator[0]
+            batch = _Batch(key, matrix)
+            self.__batches[key] = batch
+            batch.timer = asyncio.get_running_loop().call_later(self.__batch_window, self.__flush, batch)
+        batch.requests.append(request)
+        if len(batch.requests) >= self.__max_batch:
+            self.__flush(batch)
+        return batch
+
+    def __discard(self, batch: _Batch) -> None:
+        """Убирает пакет из очереди, не отправляя его на решение."""
+        if batch.timer is not None:
+            batch.timer.cancel()
+        del self.__batches[batch.key]
+
+    def __flush(self, batch: _Batch) -> None:
+        """Отправляет пакет на решение в пул."""
+        if self.__batches.get(batch.key) is not batch:
+            return
+        self.__discard(batch)
+        task = asyncio.get_running_loop().create_task(self.__run(batch))
+        self.__running.add(task)
+        task.add_done_callback(self.__running.discard)
+
+    async def __run(self, batch: _Batch) -> None:
+        """Решает пакет в пуле и передает решения ожидающим запросам."""
+        requests = [request for request in batch.requests if not request.future.done()]
+        if not requests:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            # Версия сверяется в цикле событий до отправки и после получения решения: копия
+            # матрицы в пуле процессов своей версии не знает
+            self.__check_version(batch)
+            solutions = await loop.run_in_executor(self.__executor, solve_batch, batch.matrix,
+                                                   [request.free_terms for request in requests])
+            self.__check_version(batch)
+        except Exception as error:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(error)
+            return
+        self.batches_solved += 1
+        self.requests_solved += len(requests)
+        for request, solution in zip(requests, solutions):
+            if not request.future.done():
+                request.future.set_result(solution)
+
+    @staticmethod
+    def __check_version(batch: _Batch) -> None:
+        """Проверяет, что матрица пакета не изменилась после постановки запросов в очередь.
+
+        Raises:
+            ValueError: Если матрица изменилась.
+        """
+        if batch.matrix.version != batch.version:
+            raise ValueError('The matrix was modified while its solve was pending.')
+
+    async def close(self) -> None:
+        """Решает уже принятые запросы и закрывает сервис (и собственный пул потоков)."""
+        self.__closed = True
+        for batch in list(self.__batches.values()):
+            self.__flush(batch)
+        if self.__running:
+            await asyncio.gather(*self.__running, return_exceptions=True)
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'SolveService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
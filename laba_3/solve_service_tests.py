@@ -0,0 +1,153 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from matrix import Matrix
+from vector import Vector
+from solve_service import SolveService
+
+
+class TestSolveService(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем систему с известным решением."""
+        self.matrix = Matrix(3, 3)
+        self.matrix[0] = Vector(3, [2, 1, -1])
+        self.matrix[1] = Vector(3, [-3, -1, 2])
+        self.matrix[2] = Vector(3, [-2, 1, 2])
+        self.free_terms = Vector(3, [8, -11, -3])
+        self.solution = Vector(3, [2, 3, -1])
+
+    def assertVectorAlmostEqual(self, first: Vector, second: Vector, places: int = 9):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_solve(self):
+        """Тестируем решение одной системы."""
+        async def run():
+            async with SolveService() as solver:
+                return await solver.solve(self.matrix, self.free_terms)
+        self.assertVectorAlmostEqual(asyncio.run(run()), self.solution)
+
+    def test_batching(self):
+        """Тестируем объединение одновременных запросов с одной матрицей или одним ключом в пакет."""
+        same = self.matrix.copy()
+        other = Matrix(3, 3)
+        for i in range(3):
+            other[i, i] = i + 1.0
+        terms = [Vector(3, [k, 2 * k, -k]) for k in range(1, 6)]
+
+        async def run():
+            async with SolveService(batch_window=0.05) as solver:
+                results = await asyncio.gather(
+                    *(solver.solve(self.matrix, b) for b in terms[:2]),
+                    *(solver.solve(self.matrix if k % 2 else same, b, key='system') for k, b in enumerate(terms)),
+                    solver.solve(other, self.free_terms))
+                return results[2:], solver.batches_solved, solver.requests_solved
+
+        results, batches, requests = asyncio.run(run())
+        self.assertEqual((batches, requests), (3, 8))
+        for b, x in zip(terms, results):
+            self.assertVectorAlmostEqual(x, self.matrix.gauss(b))
+        self.assertVectorAlmostEqual(results[-1], Vector(3, [8, -5.5, -1]))
+
+    def test_max_batch(self):
+        """Тестируем отправку пакета при достижении наибольшего размера."""
+        async def run():
+            async with SolveService(batch_window=10, max_batch=2) as solver:
+                await asyncio.gather(*(solver.solve(self.matrix, self.free_terms) for _ in range(4)))
+                return solver.batches_solved
+        self.assertEqual(asyncio.run(run()), 2)
+
+    def test_modified_matrix(self):
+        """Тестируем отказ при изменении матрицы до решения и новый пакет после изменения."""
+        matrix = self.matrix.copy()
+
+        async def run():
+            async with SolveService(batch_window=0.05) as solver:
+                pending = asyncio.ensure_future(solver.solve(matrix, self.free_terms))
+                await asyncio.sleep(0)
+                matrix[0, 0] = 100.0
+                with self.assertRaises(ValueError):
+                    await pending
+                solution = await solver.solve(matrix, self.free_terms, key='system')
+                matrix[0, 0] = 2.0
+                return solution, await solver.solve(matrix, self.free_terms, key='system')
+
+        modified, restored = asyncio.run(run())
+        matrix[0, 0] = 100.0
+        self.assertVectorAlmostEqual(modified, matrix.gauss(self.free_terms))
+        self.assertVectorAlmostEqual(restored, self.solution)
+
+    def test_process_pool(self):
+        """Тестируем решение измененной матрицы в пуле процессов."""
+        matrix = self.matrix.copy()
+        matrix[0, 0] = 100.0
+        matrix[0, 0] = 2.0
+        self.assertGreater(matrix.version, 0)
+        executor = ProcessPoolExecutor(max_workers=1)
+
+        async def run():
+            async with SolveService(executor, batch_window=0.05) as solver:
+                solutions = await asyncio.gather(solver.solve(matrix, self.free_terms),
+                                                 solver.solve(matrix, self.free_terms * 2, key='system'))
+                pending = asyncio.ensure_future(solver.solve(matrix, self.free_terms))
+                await asyncio.sleep(0)
+                matrix[0, 0] = 100.0
+                with self.assertRaises(ValueError):
+                    await pending
+                return solutions
+
+        try:
+            solution, doubled = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        self.assertVectorAlmostEqual(solution, self.solution)
+        self.assertVectorAlmostEqual(doubled, self.solution * 2)
+
+    def test_timeout_and_backpressure(self):
+        """Тестируем тайм-аут ожидания места в очереди и решения."""
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        async def run():
+            solver = SolveService(executor, max_pending=1, batch_window=0)
+            executor.submit(time.sleep, 0.3)
+            first = asyncio.ensure_future(solver.solve(self.matrix, self.free_terms))
+            await asyncio.sleep(0)
+            with self.assertRaises(asyncio.TimeoutError):
+                await solver.solve(self.matrix, self.free_terms, timeout=0.05)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(first), 0.05)
+            solution = await first
+            await solver.close()
+            with self.assertRaises(RuntimeError):
+                await solver.solve(self.matrix, self.free_terms)
+            return solution
+
+        try:
+            self.assertVectorAlmostEqual(asyncio.run(run()), self.solution)
+        finally:
+            executor.shutdown()
+
+    def test_errors(self):
+        """Тестируем передачу ошибок вызывающему."""
+        singular = Matrix(2, 2)
+
+        async def run():
+            async with SolveService() as solver:
+                with self.assertRaises(ValueError):
+                    await solver.solve(self.matrix, Vector(2))
+                with self.assertRaises(ValueError):
+                    await solver.solve(Matrix(2, 3), Vector(2))
+                with self.assertRaises(TypeError):
+                    await solver.solve(self.matrix, [1, 2, 3])
+                with self.assertRaises(ZeroDivisionError):
+                    await solver.solve(singular, Vector(2, [1, 1]))
+        asyncio.run(run())
+        with self.assertRaises(ValueError):
+            SolveService(max_pending=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
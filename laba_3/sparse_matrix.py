@@ -0,0 +1,339 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import mul
+from typing import Iterator, Union
+from matrix import Matrix
+from vector import Vector
+
+
+class SparseMatrix:
+    """Класс, представляющий разреженную матрицу.
+
+    Матрица собирается в координатном формате (COO) через add(), а для вычислений
+    сжимается в формат CSR: массивы начал строк, номеров столбцов и значений.
+    Хранятся и обрабатываются только ненулевые элементы.
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        """Создает пустую разреженную матрицу заданного размера.
+
+        Args:
+            rows (int): Количество строк.
+            cols (int): Количество столбцов.
+
+        Raises:
+            TypeError: Если количество строк или столбцов не является положительным целым числом.
+        """
+        Matrix.validated_rows(rows)
+        Matrix.validated_cols(cols)
+        self.__rows: int = rows
+        self.__cols: int = cols
+        # Несжатые элементы в формате COO
+        self.__coo_rows: array = array('q')
+        self.__coo_cols: array = array('q')
+        self.__coo_values: array = array('d')
+        # Сжатое представление CSR
+        self.__indptr: array = array('q', bytes(8 * (rows + 1)))
+        self.__indices: array = array('q')
+        self.__data: array = array('d')
+
+    def validated_index(self, index: tuple[int, int] | list[int]) -> None:
+        """Проверяет валидность пары индексов (строка, столбец)."""
+        if not isinstance(index, (tuple, list)) or len(index) != 2 or not all(isinstance(i, int) for i in index):
+            raise TypeError('Index must be a tuple or list of two integers.')
+        row_index, col_index = index
+        if row_index < 0 or row_index >= self.__rows:
+            raise IndexError('Row index must be non-negative and less than the number of rows.')
+        if col_index < 0 or col_index >= self.__cols:
+            raise IndexError('Column index must be non-negative and less than the number of columns.')
+
+    def add(self, row: int, col: int, value: int | float) -> None:
+        """Добавляет слагаемое к элементу (row, col) в формате COO.
+
+        Повторные добавления к одному элементу суммируются при сжатии.
+        """
+        self.validated_index((row, col))
+        Vector.validated_value(value)
+        self.__coo_rows.append(row)
+        self.__coo_cols.append(col)
+        self.__coo_values.append(value)
+
+    @classmethod
+    def from_coo(cls, rows: int, cols: int, row_indices, col_indices, values) -> 'SparseMatrix':
+        """Создает разреженную матрицу из трех последовательностей координатного формата.
+
+        Args:
+            rows (int): Количество строк.
+            cols (int): Количество столбцов.
+            row_indices: Номера строк элементов.
+            col_indices: Номера столбцов элементов.
+            values: Значения элементов.
+
+        Returns:
+            SparseMatrix: Сжатая разреженная матрица.
+
+        Raises:
+            ValueError: Если длины последовательностей различаются.
+            IndexError: Если индекс выходит за пределы матрицы.
+        """
+        matrix = cls(rows, cols)
+        row_indices = array('q', row_indices)
+        col_indices = array('q', col_indices)
+        values = array('d', values)
+        if not len(row_indices) == len(col_indices) == len(values):
+            raise ValueError('Row indices, column indices and values must be of the same length.')
+        if row_indices and (min(row_indices) < 0 or max(row_indices) >= rows):
+            raise IndexError('Row index must be non-negative and less than the number of rows.')
+        if col_indices and (min(col_indices) < 0 or max(col_indices) >= cols):
+            raise IndexError('Column index must be non-negative and less than the number of columns.')
+        matrix.__coo_rows = row_indices
+        matrix.__coo_cols = col_indices
+        matrix.__coo_values = values
+        matrix.compress()
+        return matrix
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, tolerance: float = 0.0) -> 'SparseMatrix':
+        """Создает разреженную матрицу из плотной, отбрасывая элементы с модулем не больше tolerance."""
+        if not isinstance(matrix, Matrix):
+            raise TypeError("'matrix' can be only Matrix")
+        rows, cols = matrix.__len__()
+        sparse = cls(rows, cols)
+        for i in range(rows):
+            for j, value in enumerate(matrix.row_buffer(i)):
+                if abs(value) > tolerance:
+                    sparse.__indices.append(j)
+                    sparse.__data.append(value)
+            sparse.__indptr[i + 1] = len(sparse.__indices)
+        return sparse
+
+    def compress(self) -> None:
+        """Переносит накопленные COO-элементы в CSR, суммируя повторы и отбрасывая нули."""
+        if not self.__coo_values:
+            return
+        entries: list[dict[int, float]] = [{} for _ in range(self.__rows)]
+        for i in range(self.__rows):
+            for k in range(self.__indptr[i], self.__indptr[i + 1]):
+                entries[i][self.__indices[k]] = self.__data[k]
+        for row, col, value in zip(self.__coo_rows, self.__coo_cols, self.__coo_values):
+            entries[row][col] = entries[row].get(col, 0.0) + value
+
+        self.__indptr = array('q', [0])
+        self.__indices = array('q')
+        self.__data = array('d')
+        for row in entries:
+            for col in sorted(row):
+                if row[col] != 0:
+                    self.__indices.append(col)
+                    self.__data.append(row[col])
+            self.__indptr.append(len(self.__indices))
+        self.__coo_rows = array('q')
+        self.__coo_cols = array('q')
+        self.__coo_values = array('d')
+
+    @property
+    def nnz(self) -> int:
+        """Возвращает количество хранимых ненулевых элементов."""
+        self.compress()
+        return len(self.__data)
+
+    @property
+    def csr(self) -> tuple[array, array, array]:
+        """Возвращает массивы CSR (начала строк, номера столбцов, значения) без копирования."""
+        self.compress()
+        return self.__indptr, self.__indices, self.__data
+
+    def row(self, index: int) -> Iterator[tuple[int, float]]:
+        """Итерирует по ненулевым элементам строки в виде пар (столбец, значение)."""
+        self.compress()
+        start, stop = self.__indptr[index], self.__indptr[index + 1]
+        return zip(self.__indices[start:stop], self.__data[start:stop])
+
+    def diagonal(self) -> Vector:
+        """Возвращает главную диагональ матрицы."""
+        return Vector.from_iterable(self[i, i] for i in range(min(self.__rows, self.__cols)))
+
+    def to_matrix(self) -> Matrix:
+        """Преобразует разреженную матрицу в плотную."""
+        self.compress()
+        dense = Matrix(self.__rows, self.__cols)
+        data = dense.writable_buffer()
+        for i in range(self.__rows):
+            offset = i * self.__cols
+            for k in range(self.__indptr[i], self.__indptr[i + 1]):
+                data[offset + self.__indices[k]] = self.__data[k]
+        return dense
+
+    def __getitem__(self, index: tuple[int, int] | list[int]) -> float:
+        """Получает элемент матрицы по паре индексов."""
+        self.validated_index(index)
+        self.compress()
+        row_index, col_index = index
+        start, stop = self.__indptr[row_index], self.__indptr[row_index + 1]
+        position = bisect_left(self.__indices, col_index, start, stop)
+        if position < stop and self.__indices[position] == col_index:
+            return self.__data[position]
+        return 0.0
+
+    def __len__(self) -> tuple[int, int]:
+        """Возвращает размеры матрицы."""
+        return self.__rows, self.__cols
+
+    def __mul__(self, other: Union[Vector, int, float]) -> Union[Vector, 'SparseMatrix']:
+        """Умножение на вектор за O(nnz) или на число."""
+        self.compress()
+        if isinstance(other, Vector):
+            if self.__cols != len(other):
+                raise ValueError('Number of columns in the matrix must equal the size of the vector.')
+            vector = other.buffer
+            indices = self.__indices
+            data = self.__data
+            indptr = self.__indptr
+            result = array('d', bytes(8 * self.__rows))
+            for i in range(self.__rows):
+                start, stop = indptr[i], indptr[i + 1]
+                if start != stop:
+                    result[i] = sum(map(mul, data[start:stop], map(vector.__getitem__, indices[start:stop])))
+            return Vector.from_buffer(result, copy=False)
+
+        elif isinstance(other, (int, float)):
+            result = SparseMatrix(self.__rows, self.__cols)
+            result.__indptr = array('q', self.__indptr)
+            result.__indices = array('q', self.__indices)
+            result.__data = array('d', map(mul, self.__data, repeat(other)))
+            return result
+
+        else:
+            raise TypeError('Unsupported type for multiplication.')
+
+    def __rmul__(self, other: int | float) -> 'SparseMatrix':
+        """Операция умножения: число * матрица."""
+        if isinstance(other, (int, float)):
+            return self * other
+        return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        """Сравнение на равенство по сжатому представлению."""
+        if not isinstance(other, SparseMatrix):
+            return False
+        return self.__len__() == other.__len__() and self.csr == other.csr
+
+    def __ne__(self, other) -> bool:
+        """Сравнение на неравенство."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление матрицы."""
+        return f'{type(self).__name__}(rows={self.__rows}, cols={self.__cols}, nnz={self.nnz})'
+
+    def solve(self, col_of_free_mem: Vector) -> Vector:
+        """Решает систему прямым разреженным методом Гаусса с выбором ведущего элемента.
+
+        Строки хранятся словарями ненулевых элементов, поэтому исключение затрагивает
+        только ненулевые позиции и возникающее при нем заполнение.
+
+        Args:
+            col_of_free_mem (Vector): Вектор свободных членов.
+
+        Returns:
+            Vector: Вектор решений системы.
+
+        Raises:
+            ValueError: Если матрица не квадратная или длина вектора не совпадает с числом строк.
+            ZeroDivisionError: Если обнаружена вырожденная матрица.
+        """
+        if self.__rows != self.__cols:
+            raise ValueError('The matrix must be square (n x n) for the Gauss method.')
+        if self.__rows != len(col_of_free_mem):
+            raise ValueError(
+                "The length of the column of free terms must be equal to the number of rows in the matrix.")
+        self.compress()
+        size = self.__rows
+        rows: list[dict[int, float]] = [dict(self.row(i)) for i in range(size)]
+        free_terms = array('d', col_of_free_mem)
+        # Номера еще не исключенных строк, имеющих ненулевой элемент в каждом столбце
+        column_rows: list[set[int]] = [set() for _ in range(size)]
+        for i, row in enumerate(rows):
+            for col in row:
+                column_rows[col].add(i)
+
+        pivots = [0] * size
+        for i in range(size):
+            candidates = column_rows[i]
+            if not candidates:
+                raise ZeroDivisionError(
+                    f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
+            pivot_index = max(candidates, key=lambda r: (abs(rows[r][i]), -r))
+            pivot_row = rows[pivot_index]
+            pivot = pivot_row[i]
+            if abs(pivot) < 1e-12:
+                raise ZeroDivisionError(
+                    f"System of equations is inconsistent or underdetermined (leading element = 0) in row {i + 1}.")
+            pivots[i] = pivot_index
+            for col in pivot_row:
+                column_rows[col].discard(pivot_index)
+
+            for j in list(candidates):
+                row = rows[j]
+                factor = row.pop(i) / pivot
+                column_rows[i].discard(j)
+                for col, value in pivot_row.items():
+                    if col == i:
+                        continue
+                    updated = row.get(col, 0.0) - factor * value
+                    if updated == 0:
+                        row.pop(col, None)
+                        column_rows[col].discard(j)
+                    else:
+                        if col not in row:
+                            column_rows[col].add(j)
+                        row[col] = updated
+                free_terms[j] -= factor * free_terms[pivot_index]
+
+        # Обратный ход
+        solution = array('d', bytes(8 * size))
+        for i in range(size - 1, -1, -1):
+            row = rows[pivots[i]]
+            sum_ax = sum(value * solution[col] for col, value in row.items() if col != i)
+            solution[i] = (free_terms[pivots[i]] - sum_ax) / row[i]
+        return Vector.from_buffer(solution, copy=False)
+
+    def write_to_file(self, filename: str) -> None:
+        """Записывает матрицу в файл в координатном формате.
+
+        Первая строка содержит размеры и число ненулевых элементов, далее по строке
+        "номер_строки номер_столбца значение" на каждый ненулевой элемент.
+        """
+        self.compress()
+        with open(filename, 'w') as f:
+            f.write(f'{self.__rows} {self.__cols} {len(self.__data)}\n')
+            for i in range(self.__rows):
+                for col, value in self.row(i):
+                    f.write(f'{i} {col} {value!r}\n')
+
+    @classmethod
+    def from_file(cls, filename: str) -> 'SparseMatrix':
+        """Читает матрицу из файла в координатном формате.
+
+        Raises:
+            ValueError: Если файл имеет неверный формат.
+        """
+        with open(filename, 'r') as f:
+            header = f.readline().split()
+            if len(header) != 3:
+                raise ValueError('The first line must contain rows, cols and the number of non-zero elements.')
+            rows, cols, count = map(int, header)
+            row_indices = array('q')
+            col_indices = array('q')
+            values = array('d')
+            for line in f:
+                if not line.strip():
+                    continue
+                row, col, value = line.split()
+                row_indices.append(int(row))
+                col_indices.append(int(col))
+                values.append(float(value))
+            if len(values) != count:
+                raise ValueError(f'Expected {count} elements, found {len(values)}.')
+        return cls.from_coo(rows, cols, row_indices, col_indices, values)
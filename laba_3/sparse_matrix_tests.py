@@ -0,0 +1,88 @@
+import unittest
+import os
+from matrix import Matrix
+from vector import Vector
+from sparse_matrix import SparseMatrix
+
+
+class TestSparseMatrix(unittest.TestCase):
+
+    def setUp(self):
+        """Создаем трехдиагональную разреженную матрицу и ее плотную копию."""
+        self.size = 6
+        self.sparse = SparseMatrix(self.size, self.size)
+        for i in range(self.size):
+            self.sparse.add(i, i, 4)
+            if i > 0:
+                self.sparse.add(i, i - 1, -1)
+            if i < self.size - 1:
+                self.sparse.add(i, i + 1, -1)
+        self.dense = self.sparse.to_matrix()
+
+    def test_assembly(self):
+        """Тестируем сборку в формате COO и сжатие в CSR."""
+        self.assertEqual(self.sparse.nnz, 3 * self.size - 2)
+        self.sparse.add(0, 0, 1)
+        self.sparse.add(0, 0, 1)
+        self.assertEqual(self.sparse[0, 0], 6)
+        self.assertEqual(self.sparse[0, 5], 0)
+        self.sparse.add(0, 1, 1)
+        self.assertEqual(self.sparse.nnz, 3 * self.size - 3)
+        with self.assertRaises(IndexError):
+            self.sparse.add(self.size, 0, 1)
+        with self.assertRaises(TypeError):
+            self.sparse.add(0, 0, 'string')
+
+    def test_conversion(self):
+        """Тестируем преобразование в плотную матрицу и обратно."""
+        self.assertEqual(self.dense[1], Vector(self.size, [-1, 4, -1]))
+        self.assertTrue(SparseMatrix.from_matrix(self.dense) == self.sparse)
+        coo = SparseMatrix.from_coo(2, 2, [0, 1, 1], [1, 0, 0], [5, 1, 2])
+        self.assertEqual(coo[1, 0], 3)
+        with self.assertRaises(ValueError):
+            SparseMatrix.from_coo(2, 2, [0], [0, 1], [1])
+
+    def test_multiplication(self):
+        """Тестируем умножение на вектор и на число."""
+        vector = Vector(self.size, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.sparse * vector, self.dense * vector)
+        self.assertEqual((2 * self.sparse)[2, 2], 8)
+        with self.assertRaises(ValueError):
+            self.sparse * Vector(2)
+
+    def test_solve(self):
+        """Тестируем прямое разреженное решение системы."""
+        vector = Vector(self.size, [1, 2, 3, 4, 5, 6])
+        solution = self.sparse.solve(vector)
+        expected = self.dense.gauss(vector)
+        for a, b in zip(solution, expected):
+            self.assertAlmostEqual(a, b)
+
+        singular = SparseMatrix.from_coo(2, 2, [0, 1], [0, 0], [1, 2])
+        with self.assertRaises(ZeroDivisionError):
+            singular.solve(Vector(2, [1, 2]))
+
+    def test_pivoting(self):
+        """Тестируем решение системы, требующей перестановки строк."""
+        matrix = Matrix(3, 3)
+        matrix[0] = Vector(3, [0, 1, 2])
+        matrix[1] = Vector(3, [3, 0, 0])
+        matrix[2] = Vector(3, [1, 1, 0])
+        vector = Vector(3, [5, 3, 2])
+        solution = SparseMatrix.from_matrix(matrix).solve(vector)
+        for a, b in zip(solution, [1, 1, 2]):
+            self.assertAlmostEqual(a, b)
+
+    def test_file_read_write(self):
+        """Тестируем запись и чтение в координатном формате."""
+        filename = 'test_sparse_matrix.txt'
+        try:
+            self.sparse.write_to_file(filename)
+            self.assertTrue(SparseMatrix.from_file(filename) == self.sparse)
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+from array import array
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+# Размер блока чтения при подсчете строк и буфера записи (байт)
+CHUNK_SIZE: int = 1 << 20
+
+
+def count_lines(filename: str) -> int:
+    """Подсчитывает количество строк файла, читая его блоками без разбора чисел."""
+    count = 0
+    last = b'\n'
+    with open(filename, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            count += chunk.count(b'\n')
+            last = chunk[-1:]
+    # Последняя строка может не заканчиваться переводом строки
+    return count + (last != b'\n')
+
+
+def iter_rows(filename: str, start: int = 0, stop: int | None = None) -> Iterator[array]:
+    """Построчно читает числа из текстового файла.
+
+    Args:
+        filename (str): Имя файла.
+        start (int): Смещение начала диапазона в байтах (должно указывать на начало строки).
+        stop (int | None): Смещение конца диапазона; строки, начинающиеся до него, читаются целиком.
+
+    Yields:
+        array: Числа очередной непустой строки.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if stop is not None and position >= stop:
+                break
+            position += len(line)
+            values = line.split()
+            if values:
+                yield array('d', map(float, values))
+
+
+def chunk_ranges(filename: str, count: int) -> list[tuple[int, int]]:
+    """Делит файл на count диапазонов байтов, границы которых совпадают с началами строк."""
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, 'rb') as f:
+        for k in range(1, count):
+            f.seek(max(bounds[-1], size * k // count))
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def parse_range(filename: str, start: int, stop: int) -> tuple[int, int, bytes]:
+    """Разбирает диапазон файла (выполняется в дочернем процессе).
+
+    Returns:
+        tuple[int, int, bytes]: Количество строк, столбцов и числа в виде байтов.
+
+    Raises:
+        ValueError: Если строки диапазона имеют разную длину.
+    """
+    data = array('d')
+    rows = cols = 0
+    for row in iter_rows(filename, start, stop):
+        if rows == 0:
+            cols = len(row)
+        elif len(row) != cols:
+            raise ValueError(f'The number of elements in the row {rows + 1} of the chunk at byte {start} '
+                             f'does not match the previous rows.')
+        data.extend(row)
+        rows += 1
+    return rows, cols, data.tobytes()
+
+
+def read(filename: str, workers: int = 1) -> tuple[int, int, array]:
+    """Читает матрицу из текстового файла в заранее выделенный буфер.
+
+    Сначала подсчитываются строки файла, затем после первой строки выделяется буфер
+    на все элементы, и строки записываются в него по мере разбора - список строк
+    не создается. При workers > 1 диапазоны файла разбираются в пуле процессов.
+
+    Args:
+        filename (str): Имя файла.
+        workers (int): Количество процессов для разбора.
+
+    Returns:
+        tuple[int, int, array]: Количество строк, столбцов и буфер элементов по строкам.
+
+    Raises:
+        ValueError: Если строки имеют разную длину или файл пуст.
+    """
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError('The number of workers must be a positive integer.')
+    capacity = count_lines(filename)
+
+    if workers > 1:
+        ranges = chunk_ranges(filename, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(parse_range, repeat(filename, len(ranges)),
+                                      [start for start, _ in ranges], [stop for _, stop in ranges]))
+        parts = [part for part in parts if part[0]]
+        if not parts:
+            raise ValueError('The file does not contain any rows.')
+        cols = parts[0][1]
+        data = array('d', bytes(8 * capacity * cols))
+        rows = 0
+        for part_rows, part_cols, part_data in parts:
+            if part_cols != cols:
+                raise ValueError(f'The number of elements in the row {rows + 1} does not match the previous rows.')
+            data[rows * cols:(rows + part_rows) * cols] = array('d', part_data)
+            rows += part_rows
+    else:
+        data = array('d')
+        rows = cols = 0
+        for row in iter_rows(filename):
+            if rows == 0:
+                cols = len(row)
+                data = array('d', bytes(8 * capacity * cols))
+            elif len(row) != cols:
+                raise ValueError(f'The number of elements in the row {rows + 1} does not match the previous rows.')
+            data[rows * cols:(rows + 1) * cols] = row
+            rows += 1
+        if rows == 0:
+            raise ValueError('The file does not contain any rows.')
+
+    # Пустые строки файла были учтены при выделении буфера
+    del data[rows * cols:]
+    return rows, cols, data
+
+
+def write(filename: str, rows: Iterable, precision: int | None = None, buffer_size: int = CHUNK_SIZE) -> None:
+    """Записывает строки чисел в текстовый файл через буфер.
+
+    Args:
+        filename (str): Имя файла.
+        rows (Iterable): Строки чисел.
+        precision (int | None): Количество знаков после запятой в экспоненциальной записи;
+            None - кратчайшее представление, точно восстанавливающее число.
+        buffer_size (int): Размер буфера записи в байтах.
+    """
+    if precision is not None and (not isinstance(precision, int) or precision < 0):
+        raise ValueError('Precision must be a non-negative integer.')
+    with open(filename, 'w', buffering=buffer_size) as f:
+        row_format = None
+        for row in rows:
+            if precision is None:
+                f.write(' '.join(map(repr, row)))
+            else:
+                if row_format is None or row_format[0] != len(row):
+                    row_format = (len(row), ' '.join([f'%.{precision}e'] * len(row)))
+                f.write(row_format[1] % tuple(row))
+            f.write('\n')
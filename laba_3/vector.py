@@ -1,28 +1,118 @@
-from random import uniform
+from array import array
+import binary_format
+import text_format
+from itertools import repeat
+from operator import add, mul, neg, sub, truediv
+import random
+from typing import Callable, Iterable, Iterator
+
+# Количество элементов, записываемых за один шаг операциями на месте (add_into, axpy и др.)
+WRITE_BLOCK: int = 4096
 
 
 class Vector:
-    """Класс, представляющий математический вектор."""
+    """Класс, представляющий математический вектор.
+
+    Элементы хранятся в одном непрерывном буфере чисел двойной точности (``array('d')``).
+    """
+
+    __slots__ = ('__size', '__vector', '__version')
 
     def __init__(self, size: int = 0, items: tuple | list[int | float] | int | float | None = None) -> None:
         """Инициализирует вектор заданного размера, заполняя его нулями или значениями из списка."""
         self.validated_size(size)
         self.__size: int = size
+        self.__version: list[int] | None = None
 
         if items is None:
-            self.__vector: list[int | float] = [0] * size
+            self.__vector: array | memoryview = array('d', bytes(8 * size))
         else:
             if isinstance(items, (int, float)):
-                self.__vector = [items] + [0] * (size - 1)
+                self.__vector = array('d', [items]) + array('d', bytes(8 * (size - 1)))
             elif isinstance(items, (tuple, list)):
                 for item in items:
                     self.validated_value(item)
                 if len(items) > size:
                     raise ValueError("The number of items exceeds the size of the vector.")
-                self.__vector = list(items) + [0] * (size - len(items))
+                self.__vector = array('d', items) + array('d', bytes(8 * (size - len(items))))
             else:
                 raise TypeError("Items can be tuple, list, int, or float.")
 
+    @classmethod
+    def from_buffer(cls, buffer: array | memoryview, copy: bool = True,
+                    version: list[int] | None = None) -> 'Vector':
+        """Создает вектор поверх буфера чисел типа 'd' без поэлементной проверки.
+
+        Args:
+            buffer (array | memoryview): Буфер ``array('d')`` или ``memoryview`` формата 'd'.
+            copy (bool): Если False, вектор разделяет память с буфером.
+            version (list[int] | None): Счетчик изменений владельца буфера (например, матрицы,
+                строкой которой является вектор); увеличивается при каждой записи в вектор.
+
+        Returns:
+            Vector: Новый вектор.
+        """
+        if copy or not isinstance(buffer, (array, memoryview)):
+            buffer = array('d', buffer)
+        elif isinstance(buffer, array) and buffer.typecode != 'd':
+            raise TypeError('The buffer must contain doubles (typecode "d").')
+        elif isinstance(buffer, memoryview) and buffer.format != 'd':
+            raise TypeError('The buffer must contain doubles (format "d").')
+        vector = cls.__new__(cls)
+        vector.__size = len(buffer)
+        vector.__vector = buffer
+        vector.__version = version
+        return vector
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | float]) -> 'Vector':
+        """Создает вектор из произвольной последовательности чисел одним проходом."""
+        return cls.from_buffer(array('d', values), copy=False)
+
+    @classmethod
+    def zeros(cls, size: int) -> 'Vector':
+        """Создает нулевой вектор заданного размера."""
+        cls.validated_size(size)
+        return cls.from_buffer(array('d', bytes(8 * size)), copy=False)
+
+    def __reduce__(self):
+        """Сериализует вектор через копию его буфера."""
+        return type(self).from_buffer, (array('d', self.__vector),)
+
+    @property
+    def buffer(self) -> array | memoryview:
+        """Возвращает внутренний буфер вектора (без копирования и проверок).
+
+        Буфер вектора-представления чужой памяти (например, строки матрицы) доступен
+        только для чтения, чтобы запись не обходила счетчик изменений владельца;
+        для записи используется writable_buffer().
+        """
+        if self.__version is None:
+            return self.__vector
+        return self.__vector.toreadonly()
+
+    def writable_buffer(self) -> array | memoryview:
+        """Возвращает внутренний буфер вектора для записи, отмечая изменение у владельца буфера."""
+        self.mark_modified()
+        return self.__vector
+
+    @property
+    def version(self) -> int | None:
+        """Возвращает счетчик изменений владельца буфера (None, если вектор владеет своим буфером)."""
+        return None if self.__version is None else self.__version[0]
+
+    def detach(self) -> None:
+        """Заменяет разделяемый буфер (например, строку матрицы) собственной копией элементов.
+
+        После вызова запись в вектор не затрагивает прежнего владельца буфера, и наоборот.
+        """
+        self.__vector = array('d', self.__vector.tobytes())
+        self.__version = None
+
+    def tolist(self) -> list[float]:
+        """Возвращает элементы вектора в виде списка."""
+        return self.__vector.tolist()
+
     @staticmethod
     def validated_size(size: int) -> None:
         """Проверяет валидность размера вектора."""
@@ -50,74 +140,144 @@ class Vector:
     def __add__(self, other: 'Vector') -> 'Vector':
         """Операция сложения двух векторов."""
         self.validated_vector(other)
-        return Vector(self.__size, [self.__vector[i] + other.__vector[i] for i in range(self.__size)])
+        return Vector.from_buffer(array('d', map(add, self.__vector, other.__vector)), copy=False)
 
     def __radd__(self, other: 'Vector') -> 'Vector':
         return self + other
 
+    def mark_modified(self) -> None:
+        """Отмечает изменение буфера у его владельца (writable_buffer() вызывает его сам)."""
+        if self.__version is not None:
+            self.__version[0] += 1
+
+    def __target(self, out: 'Vector | None') -> 'Vector':
+        """Проверяет вектор для записи результата (None - сам вектор)."""
+        if out is None:
+            return self
+        if not isinstance(out, Vector):
+            raise TypeError('The "out" argument is not a vector.')
+        if self.__size != out.__size:
+            raise ValueError('The vectors must be of the same length.')
+        return out
+
+    def __write(self, out: 'Vector', block: Callable[[int, int], Iterator[float]]) -> 'Vector':
+        """Записывает результат поэлементной операции в out блоками по WRITE_BLOCK элементов.
+
+        block(start, stop) возвращает значения элементов [start, stop), поэтому временный
+        буфер не превышает одного блока, а не занимает размер всего вектора.
+        """
+        out.mark_modified()
+        target = out.__vector
+        for start in range(0, self.__size, WRITE_BLOCK):
+            stop = min(start + WRITE_BLOCK, self.__size)
+            target[start:stop] = array('d', block(start, stop))
+        return out
+
+    def add_into(self, other: 'Vector', out: 'Vector | None' = None) -> 'Vector':
+        """Записывает сумму векторов в out (по умолчанию в сам вектор), не создавая новый вектор.
+
+        Args:
+            other (Vector): Второе слагаемое.
+            out (Vector | None): Вектор для результата; может совпадать с self или other,
+                но не должен частично перекрываться с ними.
+
+        Returns:
+            Vector: out.
+        """
+        self.validated_vector(other)
+        x, y = memoryview(self.__vector), memoryview(other.__vector)
+        return self.__write(self.__target(out), lambda start, stop: map(add, x[start:stop], y[start:stop]))
+
+    def sub_into(self, other: 'Vector', out: 'Vector | None' = None) -> 'Vector':
+        """Записывает разность векторов в out (по умолчанию в сам вектор), не создавая новый вектор."""
+        self.validated_vector(other)
+        x, y = memoryview(self.__vector), memoryview(other.__vector)
+        return self.__write(self.__target(out), lambda start, stop: map(sub, x[start:stop], y[start:stop]))
+
+    def scale_into(self, factor: int | float, out: 'Vector | None' = None) -> 'Vector':
+        """Записывает произведение вектора на число в out (по умолчанию в сам вектор)."""
+        self.validated_value(factor)
+        x = memoryview(self.__vector)
+        return self.__write(self.__target(out), lambda start, stop: map(mul, x[start:stop], repeat(factor)))
+
+    def axpy(self, alpha: int | float, x: 'Vector') -> 'Vector':
+        """Прибавляет к вектору alpha * x на месте (y <- y + alpha * x) за один проход.
+
+        Returns:
+            Vector: Сам вектор.
+        """
+        self.validated_value(alpha)
+        self.validated_vector(x)
+        y, x = memoryview(self.__vector), memoryview(x.__vector)
+        return self.__write(self, lambda start, stop: map(add, y[start:stop],
+                                                          map(mul, x[start:stop], repeat(alpha))))
+
+    def scale_add(self, factor: int | float, other: 'Vector') -> 'Vector':
+        """Заменяет вектор на factor * y + other на месте за один проход (например, p <- beta * p + r).
+
+        Returns:
+            Vector: Сам вектор.
+        """
+        self.validated_value(factor)
+        self.validated_vector(other)
+        y, x = memoryview(self.__vector), memoryview(other.__vector)
+        return self.__write(self, lambda start, stop: map(add, map(mul, y[start:stop], repeat(factor)),
+                                                          x[start:stop]))
+
     def __iadd__(self, other: 'Vector') -> 'Vector':
         """Операция присваивающего сложения векторов."""
-        self.validated_vector(other)
-        for i in range(self.__size):
-            self.__vector[i] += other.__vector[i]
-        return self
+        return self.add_into(other)
 
     def __sub__(self, other: 'Vector') -> 'Vector':
         """Операция вычитания двух векторов."""
         self.validated_vector(other)
-        return Vector(self.__size, [self.__vector[i] - other.__vector[i] for i in range(self.__size)])
+        return Vector.from_buffer(array('d', map(sub, self.__vector, other.__vector)), copy=False)
 
     def __rsub__(self, other: 'Vector') -> 'Vector':
         return -self + other
 
     def __isub__(self, other: 'Vector') -> 'Vector':
         """Операция присваивающего вычитания векторов."""
-        self.validated_vector(other)
-        for i in range(self.__size):
-            self.__vector[i] -= other.__vector[i]
-        return self
+        return self.sub_into(other)
 
     def __mul__(self, other: int | float) -> 'Vector':
         self.validated_value(other)
-        return Vector(self.__size, [self.__vector[i] * other for i in range(self.__size)])
+        return Vector.from_buffer(array('d', map(mul, self.__vector, repeat(other))), copy=False)
 
     def __rmul__(self, other: int | float) -> 'Vector':
         return self * other
 
     def __imul__(self, other: int | float) -> 'Vector':
         """Операция присваивающего умножения вектора на число."""
-        self.validated_value(other)
-        for i in range(self.__size):
-            self.__vector[i] *= other
-        return self
+        return self.scale_into(other)
 
     def __truediv__(self, other: int | float) -> 'Vector':
         """Операция деления вектора на число."""
         self.validated_value(other)
         if other == 0:
             raise ZeroDivisionError("Division by zero is not allowed.")
-        return Vector(self.__size, [self[i] / other for i in range(self.__size)])
+        return Vector.from_buffer(array('d', map(truediv, self.__vector, repeat(other))), copy=False)
 
     def __itruediv__(self, other: int | float) -> 'Vector':
         """Операция присваивающего деления вектора на число."""
         self.validated_value(other)
         if other == 0:
             raise ValueError("Division by zero is not allowed.")
-        for i in range(self.__size):
-            self.__vector[i] /= other
+        self.mark_modified()
+        self.__vector[:] = array('d', map(truediv, self.__vector, repeat(other)))
         return self
 
     def norma(self) -> float:
         """Вычисляет норму вектора, определяемую максимальным элементом вектора по модулю."""
-        return max(abs(v) for v in self.__vector)
+        return max(map(abs, self.__vector))
 
     def __str__(self) -> str:
         """Возвращает строковое представление вектора."""
-        return f'{self.__vector}'
+        return f'{self.__vector.tolist()}'
 
     def __repr__(self) -> str:
         """Выводит официальное строковое представление вектора."""
-        return f'{type(self).__name__}(size={self.__size!r}, elements={self.__vector!r})'
+        return f'{type(self).__name__}(size={self.__size!r}, elements={self.__vector.tolist()!r})'
 
     def __getitem__(self, index: int) -> int | float:
         """Получает элемент вектора по индексу."""
@@ -128,23 +288,32 @@ class Vector:
         """Устанавливает элемент вектора по индексу."""
         self.validated_index(index)
         self.validated_value(value)
+        self.mark_modified()
         self.__vector[index] = value
 
+    def __iter__(self) -> Iterator[float]:
+        """Итерирует по элементам вектора без проверки индексов."""
+        return iter(self.__vector)
+
     def __len__(self) -> int:
         """Возвращает размер вектора."""
         return self.__size
 
     def __neg__(self) -> 'Vector':
         """Возвращает новый вектор, представляющий отрицание текущего."""
-        return Vector(self.__size, [-self[i] for i in range(self.__size)])
+        return Vector.from_buffer(array('d', map(neg, self.__vector)), copy=False)
 
     @classmethod
-    def random_vector(cls, size: int, start: float, end: float) -> 'Vector':
-        """Создает случайный вектор заданного размера с элементами в указанном диапазоне."""
+    def random_vector(cls, size: int, start: float, end: float, rng: random.Random | None = None) -> 'Vector':
+        """Создает случайный вектор заданного размера с элементами в указанном диапазоне.
+
+        Элементы округляются до двух знаков; rng - генератор (по умолчанию глобальный модуля random).
+        """
         cls.validated_size(size)
         cls.validated_value(start)
         cls.validated_value(end)
-        return Vector(size, [round(uniform(start, end), 2) for _ in range(size)])
+        uniform = (rng or random).uniform
+        return cls.from_buffer(array('d', [round(uniform(start, end), 2) for _ in range(size)]), copy=False)
 
     @classmethod
     def from_input(cls) -> 'Vector':
@@ -158,12 +327,10 @@ class Vector:
         return vector
 
     @classmethod
-    def write_to_file(cls, file_name: str, vectors: list | tuple) -> None:
-        """Записывает список векторов в файл."""
+    def write_to_file(cls, file_name: str, vectors: list | tuple, precision: int | None = None) -> None:
+        """Записывает список векторов в файл (через буфер, см. text_format.write)."""
         try:
-            with open(file_name, "w") as file:
-                for vect in vectors:
-                    file.write(f"{' '.join(map(str, vect.__vector))}\n")
+            text_format.write(file_name, (vect.__vector for vect in vectors), precision)
         except IOError as e:
             print(f"Error writing to file: {e}")
 
@@ -172,13 +339,8 @@ class Vector:
         """Читает векторы из файла."""
         vectors = []
         try:
-            with open(file_name, "r") as file:
-                for line in file:
-                    values = list(map(float, line.split()))
-                    vect = cls(len(values))
-                    for index, value in enumerate(values):
-                        vect[index] = value
-                    vectors.append(vect)
+            for values in text_format.iter_rows(file_name):
+                vectors.append(cls.from_buffer(values, copy=False))
         except ValueError as e:
             raise ValueError(f"Error reading the file: {e}")
         except IOError as e:
@@ -186,6 +348,34 @@ class Vector:
 
         return vectors
 
+    @classmethod
+    def write_binary(cls, file_name: str, vectors: list | tuple) -> None:
+        """Записывает список векторов одинаковой длины в двоичный файл (формат binary_format).
+
+        Raises:
+            ValueError: Если векторы имеют разную длину или список пуст.
+        """
+        if not vectors:
+            raise ValueError('There are no vectors to write.')
+        size = len(vectors[0])
+        if any(len(vect) != size for vect in vectors):
+            raise ValueError('The vectors must be of the same length.')
+        binary_format.write(file_name, len(vectors), size, (vect.__vector for vect in vectors))
+
+    @classmethod
+    def read_binary(cls, file_name: str, mode: str | None = 'r') -> list['Vector']:
+        """Открывает векторы из двоичного файла, отображая его в память.
+
+        Args:
+            file_name (str): Имя файла.
+            mode (str | None): Режим отображения (см. binary_format.load).
+
+        Returns:
+            list[Vector]: Векторы, разделяющие память с отображением файла.
+        """
+        count, size, data = binary_format.load(file_name, mode)
+        return [cls.from_buffer(data[i * size:(i + 1) * size], copy=False) for i in range(count)]
+
     def __eq__(self, other) -> bool:
         """Проверяет равенство двух векторов."""
         if not isinstance(other, Vector):
@@ -1,6 +1,7 @@
 import unittest
 import os
-from vector import Vector
+import tracemalloc
+from vector import Vector, WRITE_BLOCK
 
 
 class TestVector(unittest.TestCase):
@@ -107,3 +108,77 @@ class TestVector(unittest.TestCase):
         self.assertTrue(self.vector_a <= self.vector_c)  # меньше или равно
         self.assertTrue(self.vector_b > self.vector_a)  # больше
         self.assertTrue(self.vector_b >= self.vector_c)  # больше или равно
+
+    def test_bulk_constructors(self):
+        """Проверка массовых конструкторов без поэлементной проверки."""
+        from array import array
+        buffer = array('d', [1, 2, 3])
+        shared = Vector.from_buffer(buffer, copy=False)
+        copied = Vector.from_buffer(buffer)
+        buffer[0] = 10
+        self.assertEqual(shared[0], 10)
+        self.assertEqual(copied[0], 1)
+        self.assertEqual(Vector.from_iterable(range(1, 4)), self.vector_a)
+        self.assertEqual(Vector.zeros(2), Vector(2))
+        with self.assertRaises(TypeError):
+            Vector.from_buffer(array('f', [1.0]), copy=False)
+
+    def test_iteration_and_buffer(self):
+        """Проверка итерации и доступа к внутреннему буферу."""
+        self.assertEqual(list(self.vector_a), [1.0, 2.0, 3.0])
+        self.assertEqual(self.vector_a.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(self.vector_a.buffer.typecode, 'd')
+        with self.assertRaises(AttributeError):
+            self.vector_a.extra = 1
+
+    def test_out_parameters(self):
+        """Проверка записи результатов в заранее созданный вектор и совмещенных операций."""
+        out = Vector(3)
+        self.assertIs(self.vector_a.add_into(self.vector_b, out), out)
+        self.assertEqual(out.tolist(), [5, 7, 9])
+        self.vector_a.sub_into(self.vector_b, out)
+        self.assertEqual(out.tolist(), [-3, -3, -3])
+        self.vector_a.scale_into(2, out)
+        self.assertEqual(out.tolist(), [2, 4, 6])
+        self.assertEqual(self.vector_a.tolist(), [1, 2, 3])
+        # out может совпадать с операндом
+        self.vector_a.add_into(self.vector_b, self.vector_b)
+        self.assertEqual(self.vector_b.tolist(), [5, 7, 9])
+        self.assertIs(self.vector_a.axpy(2, self.vector_c), self.vector_a)
+        self.assertEqual(self.vector_a.tolist(), [3, 6, 9])
+        self.vector_a.scale_add(0.5, self.vector_c)
+        self.assertEqual(self.vector_a.tolist(), [2.5, 5, 7.5])
+        with self.assertRaises(ValueError):
+            self.vector_a.add_into(self.vector_b, Vector(2))
+        with self.assertRaises(TypeError):
+            self.vector_a.scale_into(2, [0, 0, 0])
+
+    def test_out_parameters_blocks(self):
+        """Проверка записи на месте блоками: результат верен, временный буфер не больше блока."""
+        size = 3 * WRITE_BLOCK + 5
+        x = Vector.from_buffer([float(i) for i in range(size)])
+        y = Vector.from_buffer([1.0] * size)
+        tracemalloc.start()
+        try:
+            y.axpy(2, x)
+            x.add_into(y, x)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(y.tolist(), [1.0 + 2 * i for i in range(size)])
+        self.assertEqual(x.tolist(), [1.0 + 3 * i for i in range(size)])
+        self.assertLess(peak, 8 * size // 2)
+
+    def test_binary_file(self):
+        """Проверка записи и чтения векторов в двоичном формате."""
+        filename = 'test_vectors.bin'
+        try:
+            Vector.write_binary(filename, [self.vector_a, self.vector_b])
+            vectors = Vector.read_binary(filename)
+            self.assertEqual(vectors, [self.vector_a, self.vector_b])
+            self.assertEqual(Vector.read_binary(filename, None), [self.vector_a, self.vector_b])
+            with self.assertRaises(ValueError):
+                Vector.write_binary(filename, [self.vector_a, Vector(2)])
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)